@@ -0,0 +1,654 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Offline Benchmark Suite
+Times the database and dashboard hot paths on synthetic datasets
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+# Wall-time ceiling for a query subcommand's startup (fresh interpreter,
+# imports and argument parsing, no data); --only cli fails above it
+CLI_STARTUP_BUDGET_MS = 250
+
+# Weighted roughly like the live listing: a few countries dominate
+COUNTRIES = [
+    ("MEXICO", 40),
+    ("GUATEMALA", 10),
+    ("HONDURAS", 10),
+    ("EL SALVADOR", 7),
+    ("CUBA", 5),
+    ("VENEZUELA", 5),
+    ("DOMINICAN REPUBLIC", 4),
+    ("HAITI", 3),
+    ("COLOMBIA", 3),
+    ("ECUADOR", 3),
+    ("CHINA", 2),
+    ("INDIA", 2),
+    ("NICARAGUA", 2),
+    ("JAMAICA", 1),
+    ("BRAZIL", 1),
+    ("VIETNAM", 1),
+    ("RUSSIA", 1),
+]
+
+LOCATIONS = [
+    ("Houston, TX", 12),
+    ("Dallas, Texas", 6),
+    ("San Antonio, TX", 5),
+    ("Los Angeles, CA", 10),
+    ("San Diego, California", 4),
+    ("Miami, FL", 8),
+    ("Orlando, Florida", 3),
+    ("New York, NY", 6),
+    ("Chicago, IL", 5),
+    ("Phoenix, AZ", 5),
+    ("Atlanta, GA", 4),
+    ("Newark, NJ", 3),
+    ("Charlotte, NC", 3),
+    ("Denver, CO", 2),
+    ("Seattle, WA", 2),
+    ("Boston, MA", 2),
+    ("Salt Lake City, UT", 1),
+    ("Nashville, TN", 1),
+    ("Washington, DC", 1),
+    ("Unknown", 1),
+]
+
+CRIMES = [
+    ("Possession with intent to distribute cocaine", 8),
+    ("Trafficking in methamphetamine", 6),
+    ("Sexual assault of a child", 7),
+    ("Aggravated sexual abuse", 4),
+    ("Murder", 3),
+    ("Manslaughter", 2),
+    ("Aggravated assault with a deadly weapon", 6),
+    ("Domestic battery", 3),
+    ("Driving under the influence", 5),
+    ("Robbery", 3),
+    ("Grand theft", 2),
+    ("Burglary of a dwelling", 2),
+    ("Illegal reentry", 5),
+    ("Human smuggling", 2),
+    ("Fraud and identity theft", 2),
+]
+
+FIRST_NAMES = [
+    "JOSE", "LUIS", "CARLOS", "JUAN", "MIGUEL", "JORGE", "MARIA", "ANA",
+    "PEDRO", "FRANCISCO", "ANTONIO", "JESUS", "MANUEL", "RAFAEL", "DAVID",
+    "WEI", "RAJ", "OLEG", "JEAN", "ANDRES",
+]  # fmt: skip
+
+LAST_NAMES = [
+    "GARCIA", "MARTINEZ", "HERNANDEZ", "LOPEZ", "GONZALEZ", "RODRIGUEZ",
+    "PEREZ", "SANCHEZ", "RAMIREZ", "CRUZ", "FLORES", "GOMEZ", "DIAZ",
+    "REYES", "MORALES", "ORTIZ", "CHEN", "PATEL", "PIERRE", "IVANOV",
+]  # fmt: skip
+
+
+def _weighted(rng: random.Random, choices):
+    """Pick one value from a [(value, weight), ...] list"""
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights)[0]
+
+
+def generate_dataset(n: int, seed: int = 0, days: int = 365) -> Dict:
+    """
+    Build a historical_arrests.json-shaped dict with n records.
+    About 15% are removed, a few have re-appeared, and ~5% carry history.
+    """
+    rng = random.Random(seed)
+    end = date(2026, 10, 1)
+    start = end - timedelta(days=days)
+
+    def day(offset: int) -> str:
+        return (start + timedelta(days=offset)).isoformat()
+
+    records = {}
+    history = {}
+    for i in range(n):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {i:07d}"
+        first = rng.randrange(days)
+        record = {
+            "country": _weighted(rng, COUNTRIES),
+            "convicted_of": _weighted(rng, CRIMES),
+            "arrested_location": _weighted(rng, LOCATIONS),
+            "name": name,
+            "image_url": f"https://www.dhs.gov/sites/default/files/wow/{i}.jpg",
+            "press_release_url": f"https://www.ice.gov/news/releases/{i}",
+            "first_seen_date": day(first),
+            "scrape_count": rng.randint(1, days - first),
+        }
+
+        roll = rng.random()
+        if roll < 0.15 and first < days - 1:
+            removed = rng.randrange(first + 1, days)
+            record["status"] = "removed"
+            record["removed_date"] = day(removed)
+            record["last_seen_date"] = day(max(removed - 1, first))
+            record["active_periods"] = [[day(first), day(removed)]]
+        elif roll < 0.17 and first < days - 2:
+            gap_start = rng.randrange(first + 1, days - 1)
+            gap_end = rng.randrange(gap_start + 1, days)
+            record["status"] = "active"
+            record["last_seen_date"] = day(days - 1)
+            record["active_periods"] = [
+                [day(first), day(gap_start)],
+                [day(gap_end), None],
+            ]
+            if i % 3 == 0:
+                # Re-appeared and was removed again on the same day
+                record["status"] = "removed"
+                record["removed_date"] = record["last_seen_date"] = day(gap_end)
+                record["active_periods"][1][1] = day(gap_end)
+        else:
+            record["status"] = "active"
+            record["last_seen_date"] = day(days - 1)
+            record["active_periods"] = [[day(first), None]]
+
+        if rng.random() < 0.05:
+            changed_on = day(rng.randrange(first, days))
+            history[name] = [[changed_on, {"convicted_of": "Pending charges"}]]
+
+        records[name] = record
+
+    active = sum(1 for r in records.values() if r["status"] == "active")
+    return {
+        "records": records,
+        "history": history,
+        "metadata": {
+            "last_updated": datetime(2026, 10, 1, 6, 0).isoformat(),
+            "total_scrapes": days,
+            "total_records": n,
+            "active_records": active,
+        },
+    }
+
+
+def synthetic_scrape(data: Dict, seed: int = 1) -> List[Dict]:
+    """
+    A plausible next scrape: active records minus 2%, 1% with a changed
+    field, plus 2% brand-new people.
+    """
+    rng = random.Random(seed)
+    scrape = []
+    for record in data["records"].values():
+        if record["status"] != "active" or rng.random() < 0.02:
+            continue
+        card = {
+            k: record[k]
+            for k in (
+                "country",
+                "convicted_of",
+                "arrested_location",
+                "name",
+                "image_url",
+                "press_release_url",
+            )
+        }
+        if rng.random() < 0.01:
+            card["convicted_of"] = _weighted(rng, CRIMES)
+        scrape.append(card)
+
+    for i in range(max(1, len(scrape) // 50)):
+        scrape.append(
+            {
+                "country": _weighted(rng, COUNTRIES),
+                "convicted_of": _weighted(rng, CRIMES),
+                "arrested_location": _weighted(rng, LOCATIONS),
+                "name": f"NEW PERSON {i:07d}",
+                "image_url": f"https://www.dhs.gov/sites/default/files/wow/new{i}.jpg",
+            }
+        )
+    return scrape
+
+
+def ensure_dataset(n: int, data_dir: Path) -> Path:
+    """Generate (once) and return the path of the n-record dataset"""
+    path = data_dir / f"historical_arrests_{n}.json"
+    if not path.exists():
+        print(f"  🧪 Generating {n:,} records -> {path}")
+        data_dir.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(generate_dataset(n), f, indent=2, ensure_ascii=False)
+    return path
+
+
+def time_call(fn: Callable, repeat: int, setup: Optional[Callable] = None) -> Dict:
+    """Run fn `repeat` times (after an optional per-run setup) and summarise"""
+    samples = []
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn(arg) if setup else fn()
+            samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "runs": repeat,
+    }
+
+
+def bench_database(path: Path, repeat: int) -> Dict:
+    """DHSDatabase load/save/merge/statistics/search timings"""
+    from dhs_tracker import DHSDatabase
+    from shared_dataset import SharedDataset
+
+    work = Path(tempfile.mkdtemp(prefix="dhs_bench_"))
+    try:
+        db_path = work / "historical_arrests.json"
+        shutil.copy(path, db_path)
+        results = {}
+        results["db_load"] = time_call(lambda: DHSDatabase(str(db_path)), repeat)
+
+        db = DHSDatabase(str(db_path))
+        results["db_save"] = time_call(db._save_database, repeat)
+
+        # Same data in the canonical one-record-per-line layout
+        from ndjson_store import dump_ndjson
+
+        ndjson_path = work / "historical_arrests.ndjson"
+        results["db_save_ndjson"] = time_call(
+            lambda: dump_ndjson(db.data, ndjson_path), repeat
+        )
+        results["db_load_ndjson"] = time_call(
+            lambda: DHSDatabase(str(ndjson_path)), repeat
+        )
+
+        # What each dashboard worker pays for its dataset: parse the JSON, or
+        # attach to the tracker's Arrow snapshot when pyarrow is installed
+        results["dataset_from_json"] = time_call(
+            lambda: SharedDataset.from_file(str(db_path)), repeat
+        )
+        try:
+            from dataset_snapshot import publish_snapshot
+
+            snapshot_path = work / "dataset.arrow"
+            results["snapshot_publish"] = time_call(
+                lambda: publish_snapshot(db.data, snapshot_path), repeat
+            )
+            results["dataset_from_snapshot"] = time_call(
+                lambda: SharedDataset.from_snapshot(str(snapshot_path)), repeat
+            )
+        except ImportError:
+            pass
+        results["get_statistics"] = time_call(db.get_statistics, repeat)
+        results["search_by_name"] = time_call(
+            lambda: db.search_by_name("garcia"), repeat
+        )
+
+        # Read-only paths that stream the file instead of loading it
+        from record_stream import DatabaseReader
+
+        reader = DatabaseReader(str(db_path))
+        results["stream_statistics"] = time_call(reader.get_statistics, repeat)
+        results["stream_statistics_ndjson"] = time_call(
+            DatabaseReader(str(ndjson_path)).get_statistics, repeat
+        )
+
+        # Streaming exports of every record, file to file
+        from export_engine import available_formats, export_to_file
+
+        for fmt in available_formats():
+            results[f"export_{fmt}"] = time_call(
+                lambda: export_to_file(
+                    reader.iter_records(), work / f"export.{fmt}", fmt
+                ),
+                repeat,
+            )
+        results["search_by_date_range"] = time_call(
+            lambda: db.search_by_date_range("2026-03-01", "2026-05-31"), repeat
+        )
+        results["count_active_between"] = time_call(
+            lambda: db.count_active_between("2026-03-01", "2026-05-31"), repeat
+        )
+        # The bisection count must agree with the records it stands for
+        for first, last in (("2026-03-01", "2026-05-31"), ("2025-10-02", "2026-10-01")):
+            counted = db.count_active_between(first, last)
+            listed = len(db.get_active_between(first, last))
+            if counted != listed:
+                raise RuntimeError(
+                    f"count_active_between({first}, {last}) = {counted}, "
+                    f"but {listed} records are active"
+                )
+
+        # Each merge runs against a freshly loaded copy of the dataset
+        scrape = synthetic_scrape(db.data)
+
+        def fresh_db():
+            shutil.copy(path, db_path)
+            (work / "daily_rollups.json").unlink(missing_ok=True)
+            with contextlib.redirect_stdout(io.StringIO()):
+                return DHSDatabase(str(db_path))
+
+        results["update_records"] = time_call(
+            lambda fresh: fresh.update_records([dict(r) for r in scrape]),
+            repeat,
+            setup=fresh_db,
+        )
+        return results
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+
+def bench_dashboard(path: Path, repeat: int) -> Dict:
+    """The dashboard's filter and aggregate functions, run without a server"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        import dashboard_v2 as dash
+
+    from shared_dataset import SharedDataset
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = SharedDataset(json.load(f))
+    version = data.version
+    active = data.active
+
+    # What an untouched sidebar sends, including its date range
+    default_filters = dash.default_filters()
+    default_dates = default_filters[0]
+    narrow_filters = (
+        (date(2026, 3, 1), date(2026, 5, 31)),
+        "",
+        "MEXICO",
+        "Texas",
+        ("Drug Trafficking",),
+    )
+
+    results = {}
+    results["filter_options"] = time_call(
+        lambda: dash.get_filter_options.__wrapped__(data, version), repeat
+    )
+    results["filter_default"] = time_call(
+        lambda: dash.filter_records(active, *default_filters), repeat
+    )
+    results["filter_narrow"] = time_call(
+        lambda: dash.filter_records(active, *narrow_filters), repeat
+    )
+    results["filter_name"] = time_call(
+        lambda: dash.filter_records(active, default_dates, "garcia", "All", "All", ()),
+        repeat,
+    )
+    # Aggregation alone: the filtered-names step is a cache hit after warm-up
+    dash.get_filtered_names(data, version, default_filters)
+    results["aggregate_default"] = time_call(
+        lambda: dash.compute_aggregates.__wrapped__(data, version, default_filters),
+        repeat,
+    )
+    return results
+
+
+def _rss_bytes() -> Optional[int]:
+    """Resident set size of this process (Linux only, else None)"""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def bench_sessions(path: Path, sessions: int = 50) -> Dict:
+    """
+    Memory held by concurrent dashboard sessions. dashboard_v2.py runs in
+    `sessions` Streamlit AppTest sessions that stay open side by side, each
+    with its own session state, widget values and rendered elements
+    (including the table HTML it was sent). Every other session also picks a
+    country, so filter-specific cached views are part of the cost. The first
+    session loads the shared dataset and fills the process caches; the
+    median of the rest is what each extra viewer adds.
+    """
+    import tracemalloc
+
+    import streamlit as st
+    from streamlit.logger import set_log_level
+    from streamlit.testing.v1 import AppTest
+
+    script = str(Path(__file__).with_name("dashboard_v2.py").resolve())
+    work = Path(tempfile.mkdtemp(prefix="dhs_sessions_"))
+    (work / "data").mkdir()
+    shutil.copy(path, work / "data" / "historical_arrests.json")
+    cwd, warm_interval = os.getcwd(), os.environ.get("DHS_WARM_INTERVAL")
+    # The warmer thread would otherwise re-check the data mid-run
+    os.environ["DHS_WARM_INTERVAL"] = "3600"
+    set_log_level("error")
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+    apps, held, seconds = [], [], []
+    try:
+        os.chdir(work)
+        tracemalloc.start()
+        rss_start = _rss_bytes()
+        for i in range(sessions):
+            before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            app = AppTest.from_file(script, default_timeout=300)
+            app.run()
+            if i % 2:
+                countries = app.selectbox(key="s_country").options[1:]
+                if countries:
+                    country = countries[(i // 2) % len(countries)]
+                    app.selectbox(key="s_country").select(country).run()
+            if app.exception:
+                raise RuntimeError(f"Dashboard raised: {app.exception[0].value}")
+            seconds.append(time.perf_counter() - start)
+            held.append(tracemalloc.get_traced_memory()[0] - before)
+            apps.append(app)
+        rss_end = _rss_bytes()
+    finally:
+        tracemalloc.stop()
+        os.chdir(cwd)
+        if warm_interval is None:
+            os.environ.pop("DHS_WARM_INTERVAL", None)
+        else:
+            os.environ["DHS_WARM_INTERVAL"] = warm_interval
+        del apps
+        st.cache_data.clear()
+        st.cache_resource.clear()
+        shutil.rmtree(work, ignore_errors=True)
+
+    extra = held[1:] or held
+    return {
+        "session_memory": {
+            "bytes_per_session": int(statistics.median(extra)),
+            "sessions": sessions,
+            "first_session_bytes": held[0],
+            "total_bytes": sum(held),
+            "rss_growth_bytes": (
+                rss_end - rss_start if None not in (rss_start, rss_end) else None
+            ),
+            "seconds_per_session": round(statistics.median(seconds), 3),
+        }
+    }
+
+
+def bench_parser(n: int, repeat: int) -> Dict:
+    """card_parser on n records' worth of listing pages, serial and pooled"""
+    from card_parser import parse_page_html, parse_pages_parallel
+    from wow_fixtures import synthetic_pages
+
+    pages = list(synthetic_pages(n).values())
+    return {
+        "parse_pages": time_call(lambda: [parse_page_html(p) for p in pages], repeat),
+        "parse_pages_parallel": time_call(lambda: parse_pages_parallel(pages), repeat),
+    }
+
+
+def bench_cli(path: Path, repeat: int) -> Dict:
+    """dhs_tracker.py query subcommands as a user runs them: a new process each"""
+    script = str(Path(__file__).with_name("dhs_tracker.py"))
+
+    def run(*args):
+        subprocess.run(
+            [sys.executable, script, *args], check=True, stdout=subprocess.DEVNULL
+        )
+
+    startup = time_call(lambda: run("stats", "--help"), repeat)
+    startup["budget_ms"] = CLI_STARTUP_BUDGET_MS
+    return {
+        "cli_startup": startup,
+        "cli_stats": time_call(lambda: run("stats", "--db", str(path)), repeat),
+        "cli_search_name": time_call(
+            lambda: run("search-name", "garcia", "--db", str(path)), repeat
+        ),
+    }
+
+
+def over_budget(report: Dict) -> List[str]:
+    """Results whose median exceeds their own budget_ms"""
+    return [
+        f"{size} {name}: {result['median_ms']:.1f} ms > {result['budget_ms']} ms"
+        for size, groups in report["results"].items()
+        for name, result in groups.items()
+        if "budget_ms" in result and result["median_ms"] > result["budget_ms"]
+    ]
+
+
+def headline(result: Dict):
+    """(value, unit) a result is compared and printed by"""
+    if "median_ms" in result:
+        return result["median_ms"], "ms"
+    return result["bytes_per_session"] / 1024, "KiB/session"
+
+
+def compare(current: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Benchmarks whose headline number grew by more than `threshold` (a ratio)"""
+    regressions = []
+    for size, groups in current["results"].items():
+        for name, result in groups.items():
+            old = baseline.get("results", {}).get(size, {}).get(name)
+            if not old:
+                continue
+            (new_value, unit), (old_value, _) = headline(result), headline(old)
+            if not old_value:
+                continue
+            ratio = new_value / old_value
+            if ratio > threshold:
+                regressions.append(
+                    f"{size} {name}: {old_value:.1f} -> "
+                    f"{new_value:.1f} {unit} ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def main():
+    """Run the benchmark suite"""
+    parser = argparse.ArgumentParser(description="Offline DHS benchmark suite")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Dataset sizes in records (e.g. 1000 10000 100000 1000000)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark")
+    parser.add_argument(
+        "--data-dir",
+        type=str,
+        default="bench_data",
+        help="Where generated datasets are kept between runs",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Results file (default: bench_results/benchmark_<timestamp>.json)",
+    )
+    parser.add_argument(
+        "--only",
+        choices=["database", "dashboard", "sessions", "parser", "cli"],
+        default=None,
+        help="Run only one benchmark group",
+    )
+    parser.add_argument(
+        "--sessions",
+        type=int,
+        default=50,
+        help="Concurrent dashboard sessions for the sessions group",
+    )
+    parser.add_argument(
+        "--compare", type=str, default=None, help="Baseline results file to diff"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.25,
+        help="Flag benchmarks slower than baseline by this ratio",
+    )
+    args = parser.parse_args()
+
+    started = datetime.now()
+    report = {
+        "started": started.isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": {},
+    }
+
+    for n in args.sizes:
+        print(f"\n📏 {n:,} records")
+        path = ensure_dataset(n, Path(args.data_dir))
+        results = {}
+        if args.only in (None, "database"):
+            results.update(bench_database(path, args.repeat))
+        if args.only in (None, "dashboard"):
+            results.update(bench_dashboard(path, args.repeat))
+        if args.only in (None, "sessions"):
+            results.update(bench_sessions(path, args.sessions))
+        if args.only in (None, "parser"):
+            results.update(bench_parser(n, args.repeat))
+        if args.only in (None, "cli"):
+            results.update(bench_cli(path, args.repeat))
+        report["results"][str(n)] = results
+        for name, result in results.items():
+            value, unit = headline(result)
+            print(f"  {name:<24} {value:>10.2f} {unit}")
+
+    output = Path(
+        args.output
+        or f"bench_results/benchmark_{started.strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Results written to {output}")
+
+    exceeded = over_budget(report)
+    if exceeded:
+        print(f"\n⚠️  {len(exceeded)} result(s) over budget:")
+        for line in exceeded:
+            print(f"  - {line}")
+        raise SystemExit(1)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} regression(s) vs {args.compare}:")
+            for line in regressions:
+                print(f"  - {line}")
+            raise SystemExit(1)
+        print(f"\n✅ No regressions vs {args.compare}")
+
+
+if __name__ == "__main__":
+    main()
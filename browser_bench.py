@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Browsing Mode Benchmark
+Loads the same listing pages with the default browser setup and with lean
+browsing (--lean), compares per-page load time and bytes transferred, and
+checks that both setups parse the same records, field by field
+
+Usage examples:
+  python browser_bench.py --pages 0-4
+  python browser_bench.py --synthetic 500 --pages 0-9
+  python browser_bench.py --base-url http://127.0.0.1:8765/wow --rounds 3
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+from dhs_tracker import DHSWoWScraper
+from rate_control import AdaptiveRateController
+from scraper_metrics import ScrapeMetrics
+from wow_fixtures import ReplayServer, page_url, parse_page_spec, synthetic_pages
+
+MODES = {"full": False, "lean": True}
+
+
+def measure_mode(
+    lean: bool,
+    base_url: str,
+    pages: List[int],
+    headless: bool = True,
+    settle_s: float = 1.0,
+    timeout_s: float = 30.0,
+) -> List[Dict]:
+    """
+    One browser session over pages. Load time runs from driver.get() until
+    the first card is in the DOM, which is all the scraper waits for. Cards
+    are then parsed the way the scraper does it, after a settle_s pause, and
+    the transfer counters are read so responses still arriving are included.
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    # extract_all_cards' settle pause is the controller's delay
+    settle = AdaptiveRateController(
+        initial_delay=settle_s, min_delay=settle_s, max_delay=settle_s
+    )
+    scraper = DHSWoWScraper(
+        headless=headless,
+        metrics=ScrapeMetrics(out_dir=None),
+        rate=settle,
+        lean=lean,
+        transfer_stats=True,
+    )
+    if not scraper.setup_driver():
+        raise RuntimeError("Could not start Chrome")
+    results = []
+    try:
+        scraper.drain_transfer_stats()
+        for page_index in pages:
+            start = time.perf_counter()
+            scraper.driver.get(page_url(base_url, page_index))
+            try:
+                WebDriverWait(scraper.driver, timeout_s).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "li.usa-card"))
+                )
+                load_ms = (time.perf_counter() - start) * 1000
+            except Exception:
+                load_ms = None
+            records = scraper.extract_all_cards() if load_ms is not None else []
+            results.append(
+                {
+                    "page": page_index,
+                    "load_ms": round(load_ms, 1) if load_ms is not None else None,
+                    "cards": len(records),
+                    **scraper.drain_transfer_stats(),
+                    "records": records,
+                }
+            )
+    finally:
+        scraper.close()
+    return results
+
+
+def summarize(pages: List[Dict]) -> Dict:
+    """Per-page medians and totals for one mode"""
+    loads = [p["load_ms"] for p in pages if p["load_ms"] is not None]
+    count = len(pages) or 1
+    return {
+        "pages": len(pages),
+        "timeouts": len(pages) - len(loads),
+        "load_ms_p50": round(statistics.median(loads), 1) if loads else None,
+        "load_ms_p90": sorted(loads)[int(0.9 * (len(loads) - 1))] if loads else None,
+        "kb_per_page": round(sum(p["transfer_bytes"] for p in pages) / count / 1000, 1),
+        "requests_per_page": round(
+            sum(p["resource_requests"] for p in pages) / count, 1
+        ),
+        "blocked_per_page": round(sum(p["blocked_requests"] for p in pages) / count, 1),
+        "cards": sum(p["cards"] for p in pages),
+    }
+
+
+def record_differences(full: List[Dict], lean: List[Dict]) -> List[Dict]:
+    """
+    Field-by-field differences between the records each mode parsed from the
+    same page loads (matched by name; a record only one mode found shows up
+    with field "record").
+    """
+    differences = []
+    for full_page, lean_page in zip(full, lean):
+        by_mode = [
+            {r.get("name"): r for r in page["records"]}
+            for page in (full_page, lean_page)
+        ]
+        for name in sorted(by_mode[0].keys() | by_mode[1].keys(), key=str):
+            full_record, lean_record = (records.get(name) for records in by_mode)
+            if full_record is None or lean_record is None:
+                differences.append(
+                    {
+                        "page": full_page["page"],
+                        "name": name,
+                        "field": "record",
+                        "full": full_record is not None,
+                        "lean": lean_record is not None,
+                    }
+                )
+                continue
+            for field in sorted(full_record.keys() | lean_record.keys()):
+                if full_record.get(field) != lean_record.get(field):
+                    differences.append(
+                        {
+                            "page": full_page["page"],
+                            "name": name,
+                            "field": field,
+                            "full": full_record.get(field),
+                            "lean": lean_record.get(field),
+                        }
+                    )
+    return differences
+
+
+def main():
+    """Compare the default and lean browsing setups on the same pages"""
+    parser = argparse.ArgumentParser(
+        description="Per-page load time and bytes: full vs lean browsing"
+    )
+    parser.add_argument("--base-url", type=str, default="https://www.dhs.gov/wow")
+    parser.add_argument(
+        "--pages", type=str, default="0-4", help="0-based page indexes, e.g. 0-9"
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=0,
+        help="Serve N generated records from a local replay server instead",
+    )
+    parser.add_argument(
+        "--asset-kb",
+        type=float,
+        default=40,
+        help="Size of each image the replay server returns (with --synthetic)",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=1, help="Alternating full/lean passes"
+    )
+    parser.add_argument(
+        "--settle",
+        type=float,
+        default=1.0,
+        help="Seconds before parsing cards and reading counters (> 0)",
+    )
+    parser.add_argument("--visible", action="store_true", help="Show browser")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Results file (default: bench_results/browser_<timestamp>.json)",
+    )
+    args = parser.parse_args()
+
+    started = datetime.now()
+    server = None
+    base_url = args.base_url
+    if args.synthetic:
+        server = ReplayServer(
+            synthetic_pages(args.synthetic), port=0, asset_kb=args.asset_kb
+        )
+        server.start_in_thread()
+        base_url = server.base_url
+    pages = parse_page_spec(args.pages)
+
+    print(f"🌐 {base_url}: pages {args.pages}, {args.rounds} round(s) per mode")
+    per_mode = {mode: [] for mode in MODES}
+    try:
+        # Alternate modes so network conditions drift evenly over both
+        for round_index in range(args.rounds):
+            for mode, lean in MODES.items():
+                print(f"   Round {round_index + 1}: {mode}...")
+                per_mode[mode] += measure_mode(
+                    lean, base_url, pages, not args.visible, args.settle
+                )
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+    summary = {mode: summarize(results) for mode, results in per_mode.items()}
+    differences = record_differences(per_mode["full"], per_mode["lean"])
+    for results in per_mode.values():
+        for page in results:
+            del page["records"]
+    print(f"\n{'':<22}{'full':>12}{'lean':>12}")
+    for key in (
+        "load_ms_p50",
+        "load_ms_p90",
+        "kb_per_page",
+        "requests_per_page",
+        "blocked_per_page",
+        "cards",
+        "timeouts",
+    ):
+        full, lean = summary["full"][key], summary["lean"][key]
+        print(f"{key:<22}{str(full):>12}{str(lean):>12}")
+    if differences:
+        print(f"\n⚠️  {len(differences)} parsed field(s) differ between modes:")
+        for d in differences[:10]:
+            print(
+                f"   page {d['page']} {d['name']} {d['field']}: "
+                f"{d['full']!r} (full) vs {d['lean']!r} (lean)"
+            )
+    else:
+        print("\n✓ Both modes parsed identical records")
+
+    output = Path(
+        args.output or f"bench_results/browser_{started.strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "started": started.isoformat(timespec="seconds"),
+                "base_url": base_url,
+                "pages": pages,
+                "summary": summary,
+                "record_differences": differences,
+                "per_page": per_mode,
+            },
+            f,
+            indent=2,
+        )
+    print(f"\n💾 Results written to {output}")
+    if differences:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
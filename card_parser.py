@@ -0,0 +1,422 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Card Parser
+Pure functions that turn a listing card (or a whole listing page) into a
+record, shared by the Selenium scraper and offline tools
+
+Usage examples:
+  python card_parser.py fixtures/wow/page_0000.html.gz
+  python card_parser.py --verify fixtures/cards
+"""
+
+import argparse
+import gzip
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+ORIGIN = "https://www.dhs.gov"
+
+# Tags that start a new line in rendered text (what Selenium's .text sees)
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl",
+    "dt", "figcaption", "figure", "footer", "h1", "h2", "h3", "h4", "h5",
+    "h6", "header", "hr", "li", "main", "nav", "ol", "p", "section",
+    "table", "tr", "ul",
+}  # fmt: skip
+SKIP_TAGS = {"script", "style", "template", "noscript"}
+# Visually hidden content, which Selenium's .text leaves out as well
+HIDDEN_CLASSES = {"usa-sr-only", "sr-only", "visually-hidden", "element-invisible"}
+VOID_TAGS = {"area", "br", "col", "embed", "hr", "img", "input", "link", "meta", "wbr"}
+
+
+def _absolute(url: Optional[str]) -> Optional[str]:
+    """Site-relative /paths -> absolute URLs"""
+    if url and url.startswith("/"):
+        return ORIGIN + url
+    return url or None
+
+
+def parse_card(
+    text: str, image_src: Optional[str] = None, href: Optional[str] = None
+) -> Optional[Dict]:
+    """
+    Parse one card from its rendered text, image src and "more" link href.
+    Returns None when the card has no name (or is too short to be a card).
+    """
+    full_text = (text or "").strip()
+    if not full_text or len(full_text) < 20:
+        return None
+
+    record = {}
+    lines = full_text.split("\n")
+
+    # Extract country (first line, all caps)
+    if lines and lines[0].isupper() and len(lines[0]) < 30:
+        record["country"] = lines[0].strip()
+
+    # Find section markers
+    convicted_idx = next(
+        (
+            i
+            for i, line in enumerate(lines)
+            if "CONVICTED OF:" in line.upper() or "ARRESTED FOR:" in line.upper()
+        ),
+        None,
+    )
+    arrested_idx = next(
+        (i for i, line in enumerate(lines) if line.strip().upper() == "ARRESTED:"),
+        None,
+    )
+    name_idx = next(
+        (i for i, line in enumerate(lines) if line.strip().upper() == "NAME:"),
+        None,
+    )
+
+    # Extract convicted_of (runs to Name: on cards without an Arrested: line)
+    crime_end = arrested_idx if arrested_idx is not None else name_idx
+    if convicted_idx is not None and crime_end is not None:
+        crime_lines = lines[convicted_idx + 1 : crime_end]
+        crime_text = " ".join([l.strip() for l in crime_lines if l.strip()])
+        if crime_text:
+            record["convicted_of"] = crime_text
+
+    # Extract location
+    if arrested_idx is not None and name_idx is not None:
+        location_lines = lines[arrested_idx + 1 : name_idx]
+        location_text = " ".join([l.strip() for l in location_lines if l.strip()])
+        if location_text:
+            record["arrested_location"] = location_text
+
+    # Extract name
+    if name_idx is not None and name_idx + 1 < len(lines):
+        name_parts = []
+        for line in lines[name_idx + 1 :]:
+            line = line.strip()
+            if line == ">>" or not line:
+                break
+            name_parts.append(line)
+        name_text = " ".join(name_parts)
+        if name_text:
+            record["name"] = name_text
+
+    image_url = _absolute(image_src)
+    if image_url:
+        record["image_url"] = image_url
+    press_release_url = _absolute(href)
+    if press_release_url:
+        record["press_release_url"] = press_release_url
+
+    return record if record.get("name") else None
+
+
+def _normalise_lines(raw: str) -> str:
+    """Collapse whitespace per line and drop blank lines"""
+    lines = (" ".join(line.split()) for line in raw.split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def _has_class(classes: Optional[str], name: str) -> bool:
+    return name in (classes or "").split()
+
+
+def _is_hidden(tag: str, attrs) -> bool:
+    """Elements whose text never reaches the rendered card"""
+    if tag in SKIP_TAGS or "hidden" in attrs:
+        return True
+    return not HIDDEN_CLASSES.isdisjoint((attrs.get("class") or "").split())
+
+
+# -----------------------------------------------------------------------------
+# Whole-page parsing
+# -----------------------------------------------------------------------------
+
+
+def _cards_lxml(html: str) -> List[Dict]:
+    """(text, image_src, href) for each li.usa-card, via lxml"""
+    from lxml import html as lxml_html
+
+    doc = lxml_html.fromstring(html)
+    cards = []
+    for li in doc.xpath(
+        '//li[contains(concat(" ", normalize-space(@class), " "), " usa-card ")]'
+    ):
+        parts = []
+
+        def walk(node):
+            if not isinstance(node.tag, str) or _is_hidden(node.tag, node.attrib):
+                return
+            block = node.tag in BLOCK_TAGS
+            if block:
+                parts.append("\n")
+            if node.text:
+                parts.append(node.text)
+            for child in node:
+                walk(child)
+                if child.tail:
+                    parts.append(child.tail)
+            if block:
+                parts.append("\n")
+
+        walk(li)
+        srcs = li.xpath(".//img/@src")
+        hrefs = li.xpath(
+            './/a[contains(concat(" ", normalize-space(@class), " "),'
+            ' " usa-card__more ")]/@href'
+        )
+        cards.append(
+            {
+                "text": _normalise_lines("".join(parts)),
+                "image_src": srcs[0] if srcs else None,
+                "href": hrefs[0] if hrefs else None,
+            }
+        )
+    return cards
+
+
+class _CardCollector(HTMLParser):
+    """Standard-library fallback producing the same card tuples as lxml"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.cards = []
+        self._card = None
+        self._li_depth = 0  # nested <li> depth inside the current card
+        self._skip_tag = None  # hidden element being skipped, and its nesting
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs, self_closing=False):
+        attrs = dict(attrs)
+        if self._card is None:
+            if tag == "li" and _has_class(attrs.get("class"), "usa-card"):
+                self._card = {"parts": ["\n"], "image_src": None, "href": None}
+                self._li_depth = 1
+            return
+        if self._skip_tag:
+            self._skip_depth += tag == self._skip_tag
+        elif not self_closing and tag not in VOID_TAGS and _is_hidden(tag, attrs):
+            self._skip_tag, self._skip_depth = tag, 1
+        if tag == "li":
+            self._li_depth += 1
+        if tag in BLOCK_TAGS and not self._skip_tag:
+            self._card["parts"].append("\n")
+        if tag == "img" and self._card["image_src"] is None:
+            self._card["image_src"] = attrs.get("src")
+        if (
+            tag == "a"
+            and self._card["href"] is None
+            and _has_class(attrs.get("class"), "usa-card__more")
+        ):
+            self._card["href"] = attrs.get("href")
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs, self_closing=True)
+        if tag in BLOCK_TAGS and self._card is not None and not self._skip_tag:
+            self._card["parts"].append("\n")
+
+    def handle_endtag(self, tag):
+        if self._card is None:
+            return
+        if self._skip_tag:
+            if tag == self._skip_tag:
+                self._skip_depth -= 1
+                if not self._skip_depth:
+                    self._skip_tag = None
+        elif tag in BLOCK_TAGS:
+            self._card["parts"].append("\n")
+        if tag == "li":
+            self._li_depth -= 1
+            if self._li_depth == 0:
+                card = self._card
+                self.cards.append(
+                    {
+                        "text": _normalise_lines("".join(card["parts"])),
+                        "image_src": card["image_src"],
+                        "href": card["href"],
+                    }
+                )
+                self._card = None
+
+    def handle_data(self, data):
+        if self._card is not None and not self._skip_tag:
+            self._card["parts"].append(data)
+
+
+def extract_cards_html(html: str, use_lxml: bool = True) -> List[Dict]:
+    """Card {text, image_src, href} dicts from page HTML (lxml if installed)"""
+    if use_lxml:
+        try:
+            return _cards_lxml(html)
+        except ImportError:
+            pass
+    collector = _CardCollector()
+    collector.feed(html)
+    collector.close()
+    return collector.cards
+
+
+def html_backends() -> List[bool]:
+    """use_lxml values that can run here: lxml (if installed), then the fallback"""
+    try:
+        import lxml.html  # noqa: F401
+    except ImportError:
+        return [False]
+    return [True, False]
+
+
+def parse_page_html(html, use_lxml: bool = True) -> List[Dict]:
+    """All named records on one listing page's HTML (str or bytes)"""
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="replace")
+    records = []
+    for card in extract_cards_html(html, use_lxml):
+        record = parse_card(card["text"], card["image_src"], card["href"])
+        if record:
+            records.append(record)
+    return records
+
+
+def parse_pages_parallel(
+    pages: Iterable, workers: Optional[int] = None
+) -> List[List[Dict]]:
+    """parse_page_html over many pages on a process pool, in input order"""
+    pages = list(pages)
+    if workers == 1 or len(pages) < 2:
+        return [parse_page_html(page) for page in pages]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(parse_page_html, pages, chunksize=8))
+
+
+# -----------------------------------------------------------------------------
+# Golden fixtures
+# -----------------------------------------------------------------------------
+
+
+def read_page(path: Path) -> bytes:
+    """Page HTML from a .html or .html.gz file"""
+    if path.suffix == ".gz":
+        with gzip.open(path, "rb") as f:
+            return f.read()
+    return path.read_bytes()
+
+
+def golden_path(page_path: Path) -> Path:
+    """page_0001.html(.gz) -> page_0001.json"""
+    return page_path.with_name(page_path.name.split(".")[0] + ".json")
+
+
+def verify_cases(path: Path) -> int:
+    """
+    Check one hand-written .cases.json file; returns the failing case count.
+    Each case gives either a card's rendered "text" (with optional image_src
+    and href) for parse_card, or one card's "html", which is run through
+    every available HTML backend. "expected" is the record, or null.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        cases = json.load(f)
+    failures = 0
+    for case in cases:
+        if "text" in case:
+            runs = {
+                "text": parse_card(
+                    case["text"], case.get("image_src"), case.get("href")
+                )
+            }
+        else:
+            runs = {
+                "lxml" if use_lxml else "html.parser": next(
+                    iter(parse_page_html(case["html"], use_lxml)), None
+                )
+                for use_lxml in html_backends()
+            }
+        for backend, got in runs.items():
+            if got != case["expected"]:
+                failures += 1
+                print(f"  ✗ {path.name}: {case['case']} ({backend})")
+                print(f"      got  {got}\n      want {case['expected']}")
+    if not failures:
+        print(f"  ✓ {path.name}: {len(cases)} cases")
+    return failures
+
+
+def verify_fixtures(fixture_dir: str, update: bool = False) -> int:
+    """
+    Parse every page in fixture_dir with each HTML backend and compare with
+    its golden .json, then check the hand-written .cases.json files.
+    Returns the number of mismatches (update=True rewrites page goldens;
+    cases are never generated).
+    """
+    fixture_dir = Path(fixture_dir)
+    pages = sorted(
+        p for p in fixture_dir.iterdir() if p.name.endswith((".html", ".html.gz"))
+    )
+    mismatches = 0
+    for page in pages:
+        html = read_page(page)
+        records = parse_page_html(html)
+        golden = golden_path(page)
+        if update:
+            with open(golden, "w", encoding="utf-8") as f:
+                json.dump(records, f, indent=2, ensure_ascii=False)
+                f.write("\n")
+            print(f"  ✏️  {golden.name}: {len(records)} records")
+            continue
+        if not golden.exists():
+            print(f"  ⚠️  {page.name}: no golden file (run with --update)")
+            continue
+        with open(golden, "r", encoding="utf-8") as f:
+            expected = json.load(f)
+        for use_lxml in html_backends():
+            backend = "lxml" if use_lxml else "html.parser"
+            records = parse_page_html(html, use_lxml)
+            if records == expected:
+                print(f"  ✓ {page.name} ({backend}): {len(records)} records")
+                continue
+            mismatches += 1
+            print(
+                f"  ✗ {page.name} ({backend}): parsed {len(records)}, "
+                f"golden {len(expected)}"
+            )
+            for got, want in zip(records, expected):
+                if got != want:
+                    print(f"      got  {got}\n      want {want}")
+                    break
+
+    for cases in sorted(fixture_dir.glob("*.cases.json")):
+        mismatches += verify_cases(cases)
+    return mismatches
+
+
+def main():
+    """Parse pages to JSON, or check them against golden fixtures"""
+    parser = argparse.ArgumentParser(description="Parse DHS WoW listing pages")
+    parser.add_argument("pages", nargs="*", help="Page files (.html or .html.gz)")
+    parser.add_argument(
+        "--verify", type=str, help="Compare pages in DIR with their golden .json"
+    )
+    parser.add_argument(
+        "--update", action="store_true", help="Rewrite golden files with --verify"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Parse processes")
+    args = parser.parse_args()
+
+    if args.verify:
+        mismatches = verify_fixtures(args.verify, update=args.update)
+        if mismatches:
+            print(f"\n✗ {mismatches} fixture(s) differ from their expected output")
+            sys.exit(1)
+        return
+
+    results = parse_pages_parallel(
+        (read_page(Path(p)) for p in args.pages), workers=args.workers
+    )
+    records = [record for page in results for record in page]
+    json.dump(records, sys.stdout, indent=2, ensure_ascii=False)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Change Feed
+One small changeset file per tracker run (new, updated, re-appeared and
+removed records), plus a reader that returns everything after a given run
+
+Usage examples:
+  python change_feed.py --since 120
+  python change_feed.py --since 120 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_CHANGES_DIR = "data/changes"
+INDEX_FILE = "index.json"
+
+
+def changeset_path(changes_dir: Path, run: int) -> Path:
+    """File for one run's changeset"""
+    return Path(changes_dir) / f"run_{run:06d}.json"
+
+
+def _write_json(path: Path, payload):
+    """Write next to path, then rename over it so readers never see a partial file"""
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+            f.write("\n")
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def read_index(changes_dir: str = DEFAULT_CHANGES_DIR) -> Dict:
+    """{"first_run", "latest_run"} of the feed (both None when empty)"""
+    index_path = Path(changes_dir) / INDEX_FILE
+    if not index_path.exists():
+        return {"first_run": None, "latest_run": None}
+    with open(index_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_changeset(changeset: Dict, changes_dir: str = DEFAULT_CHANGES_DIR) -> Path:
+    """
+    Save one run's changeset and advance the index.
+    The changeset file lands before the index points at it.
+    """
+    changes_dir = Path(changes_dir)
+    changes_dir.mkdir(parents=True, exist_ok=True)
+    path = changeset_path(changes_dir, changeset["run"])
+    _write_json(path, changeset)
+
+    index = read_index(changes_dir)
+    index["first_run"] = index["first_run"] or changeset["run"]
+    index["latest_run"] = changeset["run"]
+    _write_json(changes_dir / INDEX_FILE, index)
+    return path
+
+
+def read_changes(
+    since_run: int = 0,
+    changes_dir: str = DEFAULT_CHANGES_DIR,
+    max_runs: Optional[int] = None,
+) -> Tuple[List[Dict], int]:
+    """
+    Changesets for every run after since_run, oldest first, and the cursor
+    to pass next time. Only the index and the requested run files are read,
+    so the cost follows the number of changes, not the size of the database.
+    """
+    index = read_index(changes_dir)
+    if index["latest_run"] is None:
+        return [], since_run
+
+    first = max(since_run + 1, index["first_run"])
+    last = index["latest_run"]
+    if max_runs:
+        last = min(last, first + max_runs - 1)
+
+    changesets = []
+    for run in range(first, last + 1):
+        path = changeset_path(changes_dir, run)
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                changesets.append(json.load(f))
+    return changesets, max(since_run, last)
+
+
+def main():
+    """Print the changes since a run"""
+    parser = argparse.ArgumentParser(description="Read the tracker's change feed")
+    parser.add_argument(
+        "--since", type=int, default=0, help="Last run already processed"
+    )
+    parser.add_argument("--dir", type=str, default=DEFAULT_CHANGES_DIR)
+    parser.add_argument("--max-runs", type=int, default=None)
+    parser.add_argument(
+        "--json", action="store_true", help="Print changesets as JSON lines"
+    )
+    args = parser.parse_args()
+
+    changesets, cursor = read_changes(args.since, args.dir, args.max_runs)
+    if args.json:
+        for changeset in changesets:
+            json.dump(changeset, sys.stdout, ensure_ascii=False)
+            print()
+        return
+
+    for c in changesets:
+        print(
+            f"Run {c['run']} ({c['date']}): {len(c['new'])} new, "
+            f"{len(c['updated'])} updated, {len(c['reappeared'])} re-appeared, "
+            f"{len(c['removed'])} removed"
+        )
+    print(f"\nNext cursor: --since {cursor}")
+
+
+if __name__ == "__main__":
+    main()
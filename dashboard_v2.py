@@ -9,12 +9,27 @@ import streamlit.components.v1 as components
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime
+from datetime import date, datetime
 import json
+import os
+import threading
+import time
 from pathlib import Path
 from collections import Counter
 import textwrap
 
+from dataset_snapshot import snapshot_is_current
+from dhs_common import extract_state_from_location, get_most_common_crime
+from export_engine import (
+    COLUMNS as EXPORT_COLUMNS,
+    DEFAULT_COLUMNS as DEFAULT_EXPORT_COLUMNS,
+    FORMATS as EXPORT_FORMATS,
+    available_formats,
+    export_bytes,
+)
+from render_profiler import RenderProfiler
+from shared_dataset import SharedDataset
+
 # Page config
 st.set_page_config(
     page_title="DHS WoW Dashboard",
@@ -491,136 +506,468 @@ st.markdown(
 # Logic & Data
 # -----------------------------------------------------------------------------
 
+DB_PATH = "data/historical_arrests.json"
+NDJSON_DB_PATH = "data/historical_arrests.ndjson"
+SNAPSHOT_PATH = "data/dataset.arrow"
+ROLLUPS_PATH = "data/daily_rollups.json"
+IMAGE_INDEX_PATH = "data/image_cache.json"
+
+# Sidebar defaults; the cache warmer primes the view they produce
+DEFAULT_DATE_FROM = date(2025, 12, 10)
+# Seconds between the cache warmer's checks for a new data version
+WARM_INTERVAL_S = int(os.environ.get("DHS_WARM_INTERVAL", "30"))
+
+
+def _mtime_ns(path):
+    """File modification time, 0 if it does not exist"""
+    path = Path(path)
+    return path.stat().st_mtime_ns if path.exists() else 0
+
+
+@st.cache_resource(max_entries=1)
+def _load_shared_dataset(path, mtime_ns):
+    """One read-only dataset per process and file version, shared by sessions"""
+    if path.endswith(".arrow"):
+        return SharedDataset.from_snapshot(path)
+    return SharedDataset.from_file(path)
+
+
+def _data_file():
+    """
+    (path, mtime_ns) of the file to serve: the tracker's Arrow snapshot
+    (memory-mapped, shared by every worker process) when it is current,
+    otherwise the JSON (or NDJSON) database.
+    """
+    db_path = DB_PATH
+    if not Path(DB_PATH).exists() and Path(NDJSON_DB_PATH).exists():
+        db_path = NDJSON_DB_PATH
+    path = db_path
+    if snapshot_is_current(db_path, SNAPSHOT_PATH):
+        try:
+            import pyarrow  # noqa: F401
+
+            path = SNAPSHOT_PATH
+        except ImportError:
+            pass
+    return path, _mtime_ns(path)
+
 
-@st.cache_data(ttl=3600)  # Cache for 1 hour
 def load_database():
-    """Load the historical database"""
-    db_path = Path("data/historical_arrests.json")
-    if db_path.exists():
-        with open(db_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data
-    return {"records": {}, "metadata": {}}
-
-
-def extract_state_from_location(location):
-    """Extract state abbreviation or name from location string"""
-    if not location:
-        return None
-
-    state_abbrev = {
-        "AL": "Alabama",
-        "AK": "Alaska",
-        "AZ": "Arizona",
-        "AR": "Arkansas",
-        "CA": "California",
-        "CO": "Colorado",
-        "CT": "Connecticut",
-        "DE": "Delaware",
-        "FL": "Florida",
-        "GA": "Georgia",
-        "HI": "Hawaii",
-        "ID": "Idaho",
-        "IL": "Illinois",
-        "IN": "Indiana",
-        "IA": "Iowa",
-        "KS": "Kansas",
-        "KY": "Kentucky",
-        "LA": "Louisiana",
-        "ME": "Maine",
-        "MD": "Maryland",
-        "MA": "Massachusetts",
-        "MI": "Michigan",
-        "MN": "Minnesota",
-        "MS": "Mississippi",
-        "MO": "Missouri",
-        "MT": "Montana",
-        "NE": "Nebraska",
-        "NV": "Nevada",
-        "NH": "New Hampshire",
-        "NJ": "New Jersey",
-        "NM": "New Mexico",
-        "NY": "New York",
-        "NC": "North Carolina",
-        "ND": "North Dakota",
-        "OH": "Ohio",
-        "OK": "Oklahoma",
-        "OR": "Oregon",
-        "PA": "Pennsylvania",
-        "RI": "Rhode Island",
-        "SC": "South Carolina",
-        "SD": "South Dakota",
-        "TN": "Tennessee",
-        "TX": "Texas",
-        "UT": "Utah",
-        "VT": "Vermont",
-        "VA": "Virginia",
-        "WA": "Washington",
-        "WV": "West Virginia",
-        "WI": "Wisconsin",
-        "WY": "Wyoming",
-        "DC": "District of Columbia",
-    }
-
-    parts = location.split(",")
-    if len(parts) >= 2:
-        state = parts[-1].strip().upper()
-        if state in state_abbrev:
-            return state_abbrev[state]
-        state_names = list(state_abbrev.values())
-        for name in state_names:
-            if name.upper() == state:
-                return name
-
-    location_upper = location.strip().upper()
-    if location_upper in state_abbrev:
-        return state_abbrev[location_upper]
-    return location.strip()
-
-
-def get_most_common_crime(records):
-    """Determine the most common crime category"""
-    crime_keywords = {
-        "Drug Trafficking": [
-            "drug",
-            "narcotic",
-            "trafficking",
-            "cocaine",
-            "heroin",
-            "meth",
-        ],
-        "Sexual Assault": ["sex", "rape", "sexual", "assault", "child", "abuse"],
-        "Murder": ["murder", "homicide", "manslaughter", "kill"],
-        "Assault": ["assault", "battery"],
-        "DUI": ["dui", "dwi", "driving", "influence"],
-        "Theft": ["theft", "burglary", "robbery", "larceny"],
-    }
-
-    crime_counts = Counter()
-    for record in records:
-        crime_text = record.get("convicted_of", "").lower()
-        found = False
-        for category, keywords in crime_keywords.items():
-            if any(keyword in crime_text for keyword in keywords):
-                crime_counts[category] += 1
-                found = True
-                break
-        if not found and crime_text:
-            crime_counts["Other"] += 1
-
-    if crime_counts:
-        return crime_counts.most_common(1)[0][0]
-    return "N/A"
+    """
+    The process-wide dataset. With the cache warmer running this is the
+    last version it finished priming; otherwise the file on disk.
+    """
+    slot = _warm_slot()
+    if slot["dataset"] is not None and slot["thread"].is_alive():
+        return slot["dataset"]
+    return _load_shared_dataset(*_data_file())
 
 
-def main():
-    db_data = load_database()
-    if not db_data["records"]:
-        st.error("⚠️ No data available. Please run the scraper first.")
-        return
+@st.cache_data(max_entries=4)
+def _read_rollups(path, mtime_ns):
+    """Parsed rollups file, one entry per file version"""
+    if mtime_ns:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {"fields": ["new", "removed", "active"], "days": {}}
+
+
+def load_rollups():
+    """Load the daily rollups written by the tracker"""
+    return _read_rollups(ROLLUPS_PATH, _mtime_ns(ROLLUPS_PATH))
+
+
+@st.cache_data(max_entries=4)
+def _read_image_index(path, mtime_ns):
+    """Parsed image index file, one entry per file version"""
+    if mtime_ns:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def load_image_index():
+    """Load the image_url -> thumbnail hash index written by image_cache.py"""
+    return _read_image_index(IMAGE_INDEX_PATH, _mtime_ns(IMAGE_INDEX_PATH))
+
+
+def rollup_series(rollups, dimension=None, bucket=None):
+    """
+    Daily series from the rollups, optionally for one country/state/crime bucket.
+    Returns (dates, new, removed, active); cost depends on days, not records.
+    """
+    dates = sorted(rollups.get("days", {}))
+    new, removed, active = [], [], []
+    for day in dates:
+        entry = rollups["days"][day]
+        triple = entry.get(dimension, {}).get(bucket) if dimension else entry["total"]
+        triple = triple or [0, 0, 0]
+        new.append(triple[0])
+        removed.append(triple[1])
+        active.append(triple[2])
+    return dates, new, removed, active
+
+
+def sparkline_svg(values, color="#1e3a8a", width=120, height=28):
+    """Inline SVG sparkline for a short list of numbers"""
+    if len(values) < 2:
+        return ""
+    low, high = min(values), max(values)
+    span = (high - low) or 1
+    step = width / (len(values) - 1)
+    points = " ".join(
+        f"{i * step:.1f},{height - 2 - (v - low) / span * (height - 4):.1f}"
+        for i, v in enumerate(values)
+    )
+    return (
+        f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+        f'<polyline fill="none" stroke="{color}" stroke-width="2" points="{points}"/>'
+        "</svg>"
+    )
+
+
+# Client-side results table: the filtered rows are shipped once as JSON and
+# paging, sorting and scrolling happen in the browser without a rerun.
+RESULTS_TABLE_TEMPLATE = """
+<style>
+    * { font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif; box-sizing: border-box; }
+    body { margin: 0; background: white; }
+    .grid {
+        display: grid;
+        grid-template-columns: 80px 2.5fr 1.5fr 3fr 2fr 1.5fr;
+        gap: 1.5rem;
+        padding: 0 24px;
+        align-items: center;
+    }
+    .table-header {
+        height: 50px;
+        background-color: #f8fafc;
+        border-bottom: 1px solid #e2e8f0;
+        font-weight: 600;
+        color: #475569;
+        font-size: 13px;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+        user-select: none;
+    }
+    .table-header .sortable { cursor: pointer; }
+    .table-header .sortable:hover { color: #1e3a8a; }
+    .viewport { height: __VIEWPORT_HEIGHT__px; overflow-y: auto; position: relative; }
+    .table-row {
+        position: absolute;
+        left: 0;
+        right: 0;
+        height: __ROW_HEIGHT__px;
+        border-bottom: 1px solid #f1f5f9;
+        font-size: 14px;
+        color: #334155;
+    }
+    .table-row:hover { background-color: #f8fafc; }
+    .table-row > div { white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+    .person-name-link { color: #1e3a8a; font-weight: 600; text-decoration: none; }
+    .person-name-link:hover { color: #2563eb; border-bottom: 2px solid #2563eb; }
+    .person-name-no-link { color: #1e293b; font-weight: 500; }
+    .no-details { font-size: 11px; color: #94a3b8; }
+    .mugshot-container {
+        width: 40px; height: 40px; border-radius: 8px; overflow: hidden;
+        background-color: #e2e8f0; box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    }
+    .mugshot-img { width: 100%; height: 100%; object-fit: cover; cursor: pointer; }
+    .footer {
+        display: flex; justify-content: space-between; align-items: center;
+        gap: 12px; padding: 12px 24px; color: #64748b; font-weight: 500; font-size: 14px;
+    }
+    .footer button {
+        background-color: #1e3a8a; color: white; border-radius: 8px; border: none;
+        font-weight: 600; padding: 0.6rem 1.5rem; text-transform: uppercase;
+        letter-spacing: 0.5px; font-size: 13px; cursor: pointer;
+    }
+    .footer button:disabled { opacity: 0.4; cursor: default; }
+    .footer select { border: 1px solid #e2e8f0; border-radius: 6px; padding: 4px 8px; }
+    .empty { padding: 24px; text-align: center; color: #94a3b8; }
+</style>
+
+<div class="table-header grid" id="header">
+    <div>Photo</div>
+    <div class="sortable" data-col="2">Name</div>
+    <div class="sortable" data-col="4">Country</div>
+    <div class="sortable" data-col="5">Crime</div>
+    <div class="sortable" data-col="6">Location</div>
+    <div class="sortable" data-col="7">Date Seen</div>
+</div>
+<div class="viewport" id="viewport"><div id="canvas"></div></div>
+<div class="footer">
+    <button id="prev">Previous</button>
+    <span id="info"></span>
+    <label>Rows per page
+        <select id="size">
+            <option value="10">10</option>
+            <option value="25" selected>25</option>
+            <option value="100">100</option>
+            <option value="1000">1000</option>
+            <option value="0">All</option>
+        </select>
+    </label>
+    <button id="next">Next</button>
+</div>
+
+<script>
+    // Row layout: [thumb, image_url, name, press_url, country, crime, location, date]
+    const ROWS = __TABLE_DATA__;
+    const ROW_HEIGHT = __ROW_HEIGHT__;
+    const OVERSCAN = 6;
+    const MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"];
+
+    const viewport = document.getElementById("viewport");
+    const canvas = document.getElementById("canvas");
+    let order = ROWS.map((_, i) => i);
+    let sortCol = null, sortDir = 1, page = 0, pageSize = 25;
+
+    function formatDate(s) {
+        const m = /^(\\d{4})-(\\d{2})-(\\d{2})$/.exec(s || "");
+        return m ? `${MONTHS[+m[2] - 1]} ${m[3]}, ${m[1]}` : (s || "");
+    }
+
+    function cell(text, title) {
+        const div = document.createElement("div");
+        div.textContent = text;
+        if (title) div.title = title;
+        return div;
+    }
+
+    function buildRow(r, top) {
+        const row = document.createElement("div");
+        row.className = "table-row grid";
+        row.style.top = top + "px";
+
+        const photo = document.createElement("div");
+        if (r[0]) {
+            const box = document.createElement("div");
+            box.className = "mugshot-container";
+            const img = document.createElement("img");
+            img.className = "mugshot-img";
+            img.loading = "lazy";
+            img.src = r[0];
+            img.onerror = () => { img.style.display = "none"; };
+            // Full-size image is only requested by the zoom modal
+            img.onclick = () => window.parent.openDhsPhoto && window.parent.openDhsPhoto(r[1] || r[0]);
+            box.appendChild(img);
+            photo.appendChild(box);
+        }
+        row.appendChild(photo);
+
+        const name = document.createElement("div");
+        if (r[3]) {
+            const a = document.createElement("a");
+            a.href = r[3];
+            a.target = "_blank";
+            a.rel = "noopener noreferrer";
+            a.className = "person-name-link";
+            a.textContent = r[2];
+            name.appendChild(a);
+        } else {
+            const span = document.createElement("span");
+            span.className = "person-name-no-link";
+            span.textContent = r[2] + " ";
+            const note = document.createElement("span");
+            note.className = "no-details";
+            note.textContent = "(No details)";
+            span.appendChild(note);
+            name.appendChild(span);
+        }
+        row.appendChild(name);
+
+        row.appendChild(cell(r[4]));
+        row.appendChild(cell(r[5], r[5]));
+        row.appendChild(cell(r[6], r[6]));
+        row.appendChild(cell(formatDate(r[7])));
+        return row;
+    }
+
+    function pageRows() {
+        if (!pageSize) return order;
+        return order.slice(page * pageSize, (page + 1) * pageSize);
+    }
+
+    // Only the rows inside the viewport (plus a small overscan) exist in the DOM
+    function draw() {
+        const rows = pageRows();
+        const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+        const last = Math.min(rows.length,
+            Math.ceil((viewport.scrollTop + viewport.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+        const frag = document.createDocumentFragment();
+        for (let i = first; i < last; i++) {
+            frag.appendChild(buildRow(ROWS[rows[i]], i * ROW_HEIGHT));
+        }
+        canvas.replaceChildren(frag);
+    }
+
+    function render() {
+        const total = ROWS.length;
+        const pages = pageSize ? Math.max(1, Math.ceil(total / pageSize)) : 1;
+        page = Math.min(page, pages - 1);
+        const rows = pageRows();
+        canvas.style.height = (rows.length * ROW_HEIGHT) + "px";
+        viewport.scrollTop = 0;
+        if (!total) {
+            canvas.innerHTML = '<div class="empty">No matching records</div>';
+        } else {
+            draw();
+        }
+        document.getElementById("info").textContent =
+            `Page ${page + 1} of ${pages} · ${total.toLocaleString()} records`;
+        document.getElementById("prev").disabled = page === 0;
+        document.getElementById("next").disabled = page >= pages - 1;
+    }
+
+    function sortBy(col) {
+        sortDir = sortCol === col ? -sortDir : 1;
+        sortCol = col;
+        order.sort((a, b) => {
+            const x = ROWS[a][col] || "", y = ROWS[b][col] || "";
+            return x < y ? -sortDir : x > y ? sortDir : 0;
+        });
+        document.querySelectorAll(".sortable").forEach(h => {
+            h.textContent = h.textContent.replace(/ [▲▼]$/, "");
+            if (+h.dataset.col === col) h.textContent += sortDir > 0 ? " ▲" : " ▼";
+        });
+        page = 0;
+        render();
+    }
+
+    let pending = false;
+    viewport.addEventListener("scroll", () => {
+        if (pending) return;
+        pending = true;
+        requestAnimationFrame(() => { pending = false; draw(); });
+    });
+    document.querySelectorAll(".sortable").forEach(h =>
+        h.addEventListener("click", () => sortBy(+h.dataset.col)));
+    document.getElementById("prev").onclick = () => { page -= 1; render(); };
+    document.getElementById("next").onclick = () => { page += 1; render(); };
+    document.getElementById("size").onchange = (e) => {
+        pageSize = +e.target.value;
+        page = 0;
+        render();
+    };
+    render();
+</script>
+"""
 
+TABLE_ROW_HEIGHT = 64
+TABLE_VISIBLE_ROWS = 8
+
+
+def table_payload(records, image_index):
+    """Compact JSON rows for the results table, safe to embed in a <script>"""
+    rows = []
+    for r in records:
+        img_url = r.get("image_url", "")
+        # Local thumbnail when cached; the full-size image only loads in the zoom modal
+        thumb_hash = image_index.get(img_url)
+        thumb_url = f"app/static/thumbs/{thumb_hash}.jpg" if thumb_hash else img_url
+        rows.append(
+            [
+                thumb_url,
+                img_url,
+                r.get("name", ""),
+                r.get("press_release_url", ""),
+                r.get("country", "").title(),
+                r.get("convicted_of", ""),
+                r.get("arrested_location", ""),
+                r.get("first_seen_date", ""),
+            ]
+        )
+    payload = json.dumps(rows, ensure_ascii=False, separators=(",", ":"))
+    return payload.replace("</", "<\\/")
+
+
+@st.cache_data(max_entries=256)
+def get_table_html(_db_data, data_version, filters):
+    """Results table component HTML for one filter combination"""
+    records = _db_data.records
+    filtered_records = [
+        records[n] for n in get_filtered_names(_db_data, data_version, filters)
+    ]
+    viewport_height = TABLE_ROW_HEIGHT * TABLE_VISIBLE_ROWS
+    return (
+        RESULTS_TABLE_TEMPLATE.replace("__VIEWPORT_HEIGHT__", str(viewport_height))
+        .replace("__ROW_HEIGHT__", str(TABLE_ROW_HEIGHT))
+        .replace("__TABLE_DATA__", table_payload(filtered_records, load_image_index()))
+    )
+
+
+@st.cache_data(max_entries=8)
+def get_export_bytes(_db_data, data_version, filters, fmt, columns):
+    """
+    One export file for a filter combination, format and column set. The
+    cached name list is walked straight into the export engine (no
+    DataFrame or second list of records in between).
+    """
+    records = _db_data.records
+    names = get_filtered_names(_db_data, data_version, filters)
+    return export_bytes(
+        (records[n] for n in names), fmt, list(columns), state_of=_db_data.state_of
+    )
+
+
+@st.fragment
+def render_results_table(db_data, data_version, filters):
+    """
+    Row 4: the filtered records as a client-side paged, sortable table, with
+    an export of the same rows. Runs as a fragment; it depends only on the
+    data version and filters, so changing the export options reruns just this.
+    """
+    viewport_height = TABLE_ROW_HEIGHT * TABLE_VISIBLE_ROWS
+    components.html(
+        get_table_html(db_data, data_version, filters),
+        height=viewport_height + 50 + 70,
+    )
+
+    names = get_filtered_names(db_data, data_version, filters)
+    c_format, c_columns, c_button = st.columns([1, 4, 1.2])
+    fmt = c_format.selectbox(
+        "Export format",
+        available_formats(),
+        key="export_format",
+        label_visibility="collapsed",
+    )
+    columns = c_columns.multiselect(
+        "Export columns",
+        list(EXPORT_COLUMNS),
+        default=list(DEFAULT_EXPORT_COLUMNS),
+        key="export_columns",
+        label_visibility="collapsed",
+    )
+
+    # The file is only built once asked for, and again whenever the filters
+    # or export options change
+    export_key = (data_version, filters, fmt, tuple(columns))
+    ready = st.session_state.get("export_ready") == export_key
+    if not ready and c_button.button(
+        f"Export {len(names):,}",
+        key="export_prepare",
+        disabled=not (names and columns),
+        use_container_width=True,
+    ):
+        st.session_state["export_ready"] = export_key
+        ready = True
+    if ready:
+        mime, suffix = EXPORT_FORMATS[fmt]
+        c_button.download_button(
+            f"⬇ Download {len(names):,}",
+            data=get_export_bytes(db_data, data_version, filters, fmt, tuple(columns)),
+            file_name=f"dhs_wow_{date.today().isoformat()}{suffix}",
+            mime=mime,
+            on_click="ignore",
+            use_container_width=True,
+        )
+
+
+def render_ticker(last_updated):
+    """Disclaimer ticker and quick links bar"""
     # Compact Info Navbar
-    last_updated = db_data.get("metadata", {}).get("last_updated")
     if last_updated:
         try:
             from datetime import datetime
@@ -730,80 +1077,13 @@ def main():
         unsafe_allow_html=True,
     )
 
-    all_records = list(db_data["records"].values())
-    active_records = [r for r in all_records if r.get("status") == "active"]
 
-    # Pre-calculate lists for filters
-    all_countries = sorted(
-        list(set(r.get("country", "") for r in active_records if r.get("country")))
-    )
-    # Extract states and filter out None/empty before sorting
-    states_set = set(
-        extract_state_from_location(r.get("arrested_location", ""))
-        for r in active_records
-    )
-    all_states = sorted([s for s in states_set if s])
-
-    # -------------------------------------------------------------------------
-    # LAYOUT
-    # -------------------------------------------------------------------------
-
-    # Header removed for single-page view
-
-    # SIDEBAR CONTENT
-    with st.sidebar:
-        # A. Title Card
-        st.markdown(
-            """
-        <div class="sidebar-title-card">
-            <div class="sidebar-title-text">DHS Worst<br>of the Worst</div>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
-
-        # D. Search & Filter Card
-        st.markdown('<div class="sidebar-search-card">', unsafe_allow_html=True)
-
-        # Date Filter (Moved Up)
-        date_range = st.date_input(
-            "Date Range",
-            value=(datetime(2025, 12, 10), datetime.now()),
-            key="s_date_range",
-        )
-        st.markdown("<div style='margin-bottom: 24px;'></div>", unsafe_allow_html=True)
-
-        st.markdown(
-            '<div class="sidebar-search-header">Search & Filter</div>',
-            unsafe_allow_html=True,
-        )
-
-        # Grid inputs
-        f_name = st.text_input("Name", placeholder="Name", key="s_name")
-
-        f_country = st.selectbox("Country", ["All"] + all_countries, key="s_country")
-
-        f_state = st.selectbox("State", ["All"] + all_states, key="s_state")
-
-        f_crimes = st.multiselect(
-            "Crime Type",
-            ["Drug Trafficking", "Sexual Assault", "Murder", "Assault", "Theft"],
-            default=[],
-            key="s_crime",
-        )
-
-        st.markdown("<br>", unsafe_allow_html=True)
-        do_search = st.button("Search")
-
-        st.markdown("</div>", unsafe_allow_html=True)  # End search card
-
-    # MAIN AREA
-
-    # Filter Logic
-    filtered_records = active_records.copy()
+def filter_records(active_records, date_range, f_name, f_country, f_state, f_crimes):
+    """Apply the sidebar filters to the active records"""
+    filtered_records = list(active_records)
 
     # Date Filtering
-    if isinstance(date_range, tuple) and len(date_range) == 2:
+    if len(date_range) == 2:
         start_d, end_d = date_range
         temp_date_list = []
         for r in filtered_records:
@@ -862,24 +1142,69 @@ def main():
                 temp_list.append(r)
         filtered_records = temp_list
 
-    # Row 1: KPI Cards
-    k1, k2, k3, k4 = st.columns(4)
+    return filtered_records
 
-    # Calc Metrics
-    metric_total = len(filtered_records)
-    metric_countries = len(
-        set(r.get("country") for r in filtered_records if r.get("country"))
-    )
+
+@st.cache_data(max_entries=256)
+def get_filter_options(_db_data, data_version):
+    """Country and state option lists; depend only on the data version"""
+    # Built once when the shared dataset loads
+    return list(_db_data.countries), list(_db_data.states)
+
+
+@st.cache_data(max_entries=256)
+def get_filtered_names(_db_data, data_version, filters):
+    """Names of the records matching `filters`, cached per filter combination"""
+    return [r["name"] for r in filter_records(_db_data.active, *filters)]
+
+
+@st.cache_data(max_entries=256)
+def compute_aggregates(_db_data, data_version, filters):
+    """KPI and chart inputs for one filter combination"""
+    records = _db_data.records
+    filtered_records = [
+        records[n] for n in get_filtered_names(_db_data, data_version, filters)
+    ]
 
     # Calc Top State
-    m_state_counts = Counter(
-        extract_state_from_location(r.get("arrested_location"))
-        for r in filtered_records
+    state_of = _db_data.state_of
+    m_state_counts = Counter(state_of[r["name"]] for r in filtered_records)
+    country_counts = Counter(
+        r.get("country") for r in filtered_records if r.get("country")
     )
-    m_top_state = m_state_counts.most_common(1)[0] if m_state_counts else ("N/A", 0)
+    return {
+        "total": len(filtered_records),
+        "countries": len(country_counts),
+        "top_state": (
+            m_state_counts.most_common(1)[0] if m_state_counts else ("N/A", 0)
+        ),
+        "crime": get_most_common_crime(filtered_records),
+        "state_counts": {k: v for k, v in m_state_counts.items() if k},
+        "top_countries": country_counts.most_common(10),
+    }
 
-    # Calc Most Common Crime
-    m_crime = get_most_common_crime(filtered_records)
+
+def render_kpis(aggregates, f_country, f_state):
+    """Row 1: KPI cards"""
+    k1, k2, k3, k4 = st.columns(4)
+
+    metric_total = aggregates["total"]
+    metric_countries = aggregates["countries"]
+    m_top_state = aggregates["top_state"]
+    m_crime = aggregates["crime"]
+
+    # Sparkline comes from the precomputed rollups
+    rollups = load_rollups()
+    if f_country != "All":
+        trend_dim, trend_bucket = "country", f_country
+    elif f_state != "All":
+        trend_dim, trend_bucket = "state", f_state
+    else:
+        trend_dim, trend_bucket = None, None
+    trend_active = rollup_series(rollups, trend_dim, trend_bucket)[3]
+    active_sparkline = sparkline_svg(trend_active[-30:]) or (
+        '<span style="opacity: 0;">Spacer</span>'
+    )
 
     with k1:
         st.markdown(
@@ -887,7 +1212,7 @@ def main():
         <div class="white-card">
             <div class="kpi-label">Total Arrests</div>
             <div class="kpi-value">{metric_total:,}</div>
-            <div class="kpi-sub" style="opacity: 0;">Spacer</div>
+            <div class="kpi-sub" title="Active records, last 30 days">{active_sparkline}</div>
         </div>
         """,
             unsafe_allow_html=True,
@@ -931,104 +1256,148 @@ def main():
             unsafe_allow_html=True,
         )
 
-    # Row 2: Charts - Two columns
+
+@st.cache_data(max_entries=256)
+def build_map_figure(map_counts):
+    """Choropleth of arrests by state"""
+    df_map = pd.DataFrame([{"state": k, "count": v} for k, v in map_counts.items()])
+
+    state_to_code = {
+        "Alabama": "AL",
+        "Alaska": "AK",
+        "Arizona": "AZ",
+        "Arkansas": "AR",
+        "California": "CA",
+        "Colorado": "CO",
+        "Connecticut": "CT",
+        "Delaware": "DE",
+        "Florida": "FL",
+        "Georgia": "GA",
+        "Hawaii": "HI",
+        "Idaho": "ID",
+        "Illinois": "IL",
+        "Indiana": "IN",
+        "Iowa": "IA",
+        "Kansas": "KS",
+        "Kentucky": "KY",
+        "Louisiana": "LA",
+        "Maine": "ME",
+        "Maryland": "MD",
+        "Massachusetts": "MA",
+        "Michigan": "MI",
+        "Minnesota": "MN",
+        "Mississippi": "MS",
+        "Missouri": "MO",
+        "Montana": "MT",
+        "Nebraska": "NE",
+        "Nevada": "NV",
+        "New Hampshire": "NH",
+        "New Jersey": "NJ",
+        "New Mexico": "NM",
+        "New York": "NY",
+        "North Carolina": "NC",
+        "North Dakota": "ND",
+        "Ohio": "OH",
+        "Oklahoma": "OK",
+        "Oregon": "OR",
+        "Pennsylvania": "PA",
+        "Rhode Island": "RI",
+        "South Carolina": "SC",
+        "South Dakota": "SD",
+        "Tennessee": "TN",
+        "Texas": "TX",
+        "Utah": "UT",
+        "Vermont": "VT",
+        "Virginia": "VA",
+        "Washington": "WA",
+        "West Virginia": "WV",
+        "Wisconsin": "WI",
+        "Wyoming": "WY",
+        "District of Columbia": "DC",
+    }
+
+    if not df_map.empty:
+        df_map["code"] = df_map["state"].apply(
+            lambda x: state_to_code.get(x, x[:2].upper())
+        )
+
+        fig_map = go.Figure(
+            data=go.Choropleth(
+                locations=df_map["code"],
+                z=df_map["count"],
+                locationmode="USA-states",
+                colorscale=[[0, "#e0f2fe"], [1, "#1e40af"]],  # Light blue to Navy
+                marker_line_color="white",
+                marker_line_width=1.5,
+                showscale=False,  # Hide colorbar to match clean look
+            )
+        )
+        fig_map.update_layout(
+            geo=dict(
+                scope="usa",
+                projection=go.layout.geo.Projection(type="albers usa"),
+                bgcolor="rgba(0,0,0,0)",
+                showlakes=False,
+                landcolor="#f1f5f9",
+            ),
+            margin=dict(l=0, r=0, t=0, b=0),
+            paper_bgcolor="white",  # Set chart background to white
+            plot_bgcolor="white",  # Set plot background to white
+            height=300,
+        )
+    else:
+        fig_map = go.Figure()
+
+    return fig_map
+
+
+@st.cache_data(max_entries=256)
+def build_bar_figure(top_countries):
+    """Horizontal bar chart of the top countries"""
+    df_bar = pd.DataFrame(top_countries, columns=["Country", "Count"]).sort_values(
+        "Count", ascending=True
+    )
+
+    fig_bar = go.Figure(
+        go.Bar(
+            x=df_bar["Count"],
+            y=df_bar["Country"],
+            orientation="h",
+            marker_color="#10b981",  # Green
+            text=df_bar["Count"],
+            textposition="outside",
+        )
+    )
+
+    fig_bar.update_layout(
+        margin=dict(l=0, r=40, t=0, b=0),  # Right margin for outside text
+        paper_bgcolor="white",  # Set chart background to white
+        plot_bgcolor="white",  # Set plot background to white
+        xaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
+        yaxis=dict(
+            showgrid=False,
+            tickfont=dict(
+                family="Inter, sans-serif", size=13, color="#334155"
+            ),  # Fix text visibility
+        ),
+        font=dict(family="Inter, sans-serif", color="#334155"),
+        height=300,
+        uniformtext_minsize=10,
+        uniformtext_mode="hide",
+    )
+
+    return fig_bar
+
+
+def render_charts(aggregates):
+    """Row 2: state map and top countries bar chart"""
     c_map, c_bar = st.columns([1.5, 1])
 
     with c_map:
         # Prepare Map Data
-        map_counts = Counter()
-        for r in filtered_records:
-            s = extract_state_from_location(r.get("arrested_location"))
-            if s:
-                map_counts[s] += 1
-
-        df_map = pd.DataFrame([{"state": k, "count": v} for k, v in map_counts.items()])
-
-        state_to_code = {
-            "Alabama": "AL",
-            "Alaska": "AK",
-            "Arizona": "AZ",
-            "Arkansas": "AR",
-            "California": "CA",
-            "Colorado": "CO",
-            "Connecticut": "CT",
-            "Delaware": "DE",
-            "Florida": "FL",
-            "Georgia": "GA",
-            "Hawaii": "HI",
-            "Idaho": "ID",
-            "Illinois": "IL",
-            "Indiana": "IN",
-            "Iowa": "IA",
-            "Kansas": "KS",
-            "Kentucky": "KY",
-            "Louisiana": "LA",
-            "Maine": "ME",
-            "Maryland": "MD",
-            "Massachusetts": "MA",
-            "Michigan": "MI",
-            "Minnesota": "MN",
-            "Mississippi": "MS",
-            "Missouri": "MO",
-            "Montana": "MT",
-            "Nebraska": "NE",
-            "Nevada": "NV",
-            "New Hampshire": "NH",
-            "New Jersey": "NJ",
-            "New Mexico": "NM",
-            "New York": "NY",
-            "North Carolina": "NC",
-            "North Dakota": "ND",
-            "Ohio": "OH",
-            "Oklahoma": "OK",
-            "Oregon": "OR",
-            "Pennsylvania": "PA",
-            "Rhode Island": "RI",
-            "South Carolina": "SC",
-            "South Dakota": "SD",
-            "Tennessee": "TN",
-            "Texas": "TX",
-            "Utah": "UT",
-            "Vermont": "VT",
-            "Virginia": "VA",
-            "Washington": "WA",
-            "West Virginia": "WV",
-            "Wisconsin": "WI",
-            "Wyoming": "WY",
-            "District of Columbia": "DC",
-        }
+        map_counts = aggregates["state_counts"]
 
-        if not df_map.empty:
-            df_map["code"] = df_map["state"].apply(
-                lambda x: state_to_code.get(x, x[:2].upper())
-            )
-
-            fig_map = go.Figure(
-                data=go.Choropleth(
-                    locations=df_map["code"],
-                    z=df_map["count"],
-                    locationmode="USA-states",
-                    colorscale=[[0, "#e0f2fe"], [1, "#1e40af"]],  # Light blue to Navy
-                    marker_line_color="white",
-                    marker_line_width=1.5,
-                    showscale=False,  # Hide colorbar to match clean look
-                )
-            )
-            fig_map.update_layout(
-                geo=dict(
-                    scope="usa",
-                    projection=go.layout.geo.Projection(type="albers usa"),
-                    bgcolor="rgba(0,0,0,0)",
-                    showlakes=False,
-                    landcolor="#f1f5f9",
-                ),
-                margin=dict(l=0, r=0, t=0, b=0),
-                paper_bgcolor="white",  # Set chart background to white
-                plot_bgcolor="white",  # Set plot background to white
-                height=300,
-            )
-        else:
-            fig_map = go.Figure()
+        fig_map = build_map_figure(map_counts)
 
         # REMOVED chart-card-wrapper as requested
         st.markdown(
@@ -1041,41 +1410,8 @@ def main():
 
     with c_bar:
         # Prepare Bar Data
-        bar_counts = Counter(
-            r.get("country") for r in filtered_records if r.get("country")
-        )
-        top_countries = bar_counts.most_common(10)
-        df_bar = pd.DataFrame(top_countries, columns=["Country", "Count"]).sort_values(
-            "Count", ascending=True
-        )
-
-        fig_bar = go.Figure(
-            go.Bar(
-                x=df_bar["Count"],
-                y=df_bar["Country"],
-                orientation="h",
-                marker_color="#10b981",  # Green
-                text=df_bar["Count"],
-                textposition="outside",
-            )
-        )
-
-        fig_bar.update_layout(
-            margin=dict(l=0, r=40, t=0, b=0),  # Right margin for outside text
-            paper_bgcolor="white",  # Set chart background to white
-            plot_bgcolor="white",  # Set plot background to white
-            xaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
-            yaxis=dict(
-                showgrid=False,
-                tickfont=dict(
-                    family="Inter, sans-serif", size=13, color="#334155"
-                ),  # Fix text visibility
-            ),
-            font=dict(family="Inter, sans-serif", color="#334155"),
-            height=300,
-            uniformtext_minsize=10,
-            uniformtext_mode="hide",
-        )
+        top_countries = aggregates["top_countries"]
+        fig_bar = build_bar_figure(top_countries)
 
         # REMOVED chart-card-wrapper as requested
         st.markdown(
@@ -1086,115 +1422,267 @@ def main():
             fig_bar, use_container_width=True, config={"displayModeBar": False}
         )
 
-    # Row 3: Data Table
+
+@st.fragment
+def render_trends(trend_dim, trend_bucket):
+    """
+    Row 3: daily trend from the rollups.
+    Runs as a fragment so the window selector only reruns this chart.
+    """
+    rollups = load_rollups()
+    trend_dates, trend_new, trend_removed, trend_active = rollup_series(
+        rollups, trend_dim, trend_bucket
+    )
+    if len(trend_dates) < 2:
+        return
+
+    window = st.radio(
+        "Trend window",
+        ["30 days", "90 days", "All"],
+        index=2,
+        horizontal=True,
+        key="trend_window",
+        label_visibility="collapsed",
+    )
+    keep = {"30 days": 30, "90 days": 90}.get(window)
+    if keep:
+        trend_dates = trend_dates[-keep:]
+        trend_new = trend_new[-keep:]
+        trend_removed = trend_removed[-keep:]
+        trend_active = trend_active[-keep:]
+
+    fig_trend = go.Figure()
+    fig_trend.add_trace(
+        go.Bar(x=trend_dates, y=trend_new, name="New", marker_color="#10b981")
+    )
+    fig_trend.add_trace(
+        go.Bar(x=trend_dates, y=trend_removed, name="Removed", marker_color="#ef4444")
+    )
+    fig_trend.add_trace(
+        go.Scatter(
+            x=trend_dates,
+            y=trend_active,
+            name="Active",
+            mode="lines",
+            line=dict(color="#1e3a8a", width=2),
+            yaxis="y2",
+        )
+    )
+    fig_trend.update_layout(
+        margin=dict(l=0, r=0, t=0, b=0),
+        paper_bgcolor="white",
+        plot_bgcolor="white",
+        barmode="group",
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=False, title="New / Removed"),
+        yaxis2=dict(overlaying="y", side="right", showgrid=False, title="Active"),
+        legend=dict(orientation="h", y=1.1),
+        font=dict(family="Inter, sans-serif", color="#334155"),
+        height=260,
+    )
     st.markdown(
-        '<div class="white-card" style="padding: 0; overflow: hidden; min-height: auto;">',
+        '<div class="kpi-label" style="font-size:16px; color:#1e293b; margin-bottom: 24px;">Daily Trend</div>',
         unsafe_allow_html=True,
     )
+    st.plotly_chart(
+        fig_trend, use_container_width=True, config={"displayModeBar": False}
+    )
+
 
-    # Pagination Logic
-    ITEMS_PER_PAGE = 5
-    if "page" not in st.session_state:
-        st.session_state.page = 1
+# -----------------------------------------------------------------------------
+# Warm start
+# -----------------------------------------------------------------------------
 
-    total_pages = max(1, (len(filtered_records) + ITEMS_PER_PAGE - 1) // ITEMS_PER_PAGE)
 
-    # Ensure page is valid
-    if st.session_state.page > total_pages:
-        st.session_state.page = total_pages
-    if st.session_state.page < 1:
-        st.session_state.page = 1
+def default_filters():
+    """The filters tuple an untouched sidebar produces"""
+    return ((DEFAULT_DATE_FROM, date.today()), "", "All", "All", ())
 
-    start_idx = (st.session_state.page - 1) * ITEMS_PER_PAGE
-    end_idx = start_idx + ITEMS_PER_PAGE
-    page_data = filtered_records[start_idx:end_idx]
 
-    # Render Table Header
-    st.markdown(
-        """
-    <div class="table-header">
-        <div>Photo</div>
-        <div>Name</div>
-        <div>Country</div>
-        <div>Crime</div>
-        <div>Location</div>
-        <div>Date Seen</div>
-    </div>
-    """,
-        unsafe_allow_html=True,
+def prime_caches(db_data):
+    """Compute everything the default view needs for this data version"""
+    version = db_data.version
+    filters = default_filters()
+    get_filter_options(db_data, version)
+    aggregates = compute_aggregates(db_data, version, filters)
+    build_map_figure(aggregates["state_counts"])
+    build_bar_figure(aggregates["top_countries"])
+    get_table_html(db_data, version, filters)
+    load_rollups()
+
+
+def _warm_key():
+    """Everything a primed default view depends on"""
+    return (
+        _data_file(),
+        _mtime_ns(ROLLUPS_PATH),
+        _mtime_ns(IMAGE_INDEX_PATH),
+        date.today(),
     )
 
-    # Render Rows
-    for row in page_data:
-        # Format Date
-        date_str = row.get("first_seen_date", "")
+
+def _warm_loop(slot):
+    """Re-prime in the background whenever the data (or the day) changes"""
+    while True:
+        time.sleep(WARM_INTERVAL_S)
         try:
-            d_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            date_fmt = d_obj.strftime("%b %d, %Y")
-        except:
-            date_fmt = date_str
-
-        # Truncate Crime
-        crime = row.get("convicted_of", "")
-        if len(crime) > 30:
-            crime = crime[:30] + "..."
-
-        img_url = row.get("image_url", "")
-        # Escape quotes in URL for onclick handler
-        img_url_safe = img_url.replace("'", "\\'")
-        mugshot_html = f"""
-        <div class="mugshot-container">
-            <img src="{img_url}" class="mugshot-img zoom-trigger" data-img-src="{img_url}" onerror="this.style.display='none'">
-        </div>
-        """
+            key = _warm_key()
+            if key == slot["key"]:
+                continue
+            dataset = _load_shared_dataset(*key[0])
+            prime_caches(dataset)
+            # Sessions keep the previous version until this one is fully warm
+            slot.update(key=key, dataset=dataset)
+            print(f"🔥 Cache warmed for data version {dataset.version or '-'}")
+        except Exception as e:
+            print(f"⚠️  Cache warm-up failed: {e}")
+
+
+@st.cache_resource
+def _warm_slot():
+    """Process-wide holder for the dataset the warmer has primed"""
+    return {"key": None, "dataset": None, "thread": threading.Thread()}
+
+
+@st.cache_resource
+def start_cache_warmer():
+    """
+    Prime the default view once per process, then keep it warm from a
+    background thread. serve_dashboard.py runs this before the server
+    starts listening, so no visitor pays for the first load.
+    """
+    slot = _warm_slot()
+    key = _warm_key()
+    dataset = _load_shared_dataset(*key[0])
+    prime_caches(dataset)
+    thread = threading.Thread(
+        target=_warm_loop, args=(slot,), name="cache-warmer", daemon=True
+    )
+    slot.update(key=key, dataset=dataset, thread=thread)
+    thread.start()
+    return slot
 
-        # Create clickable name with press release link
-        press_url = row.get("press_release_url", "")
-        if press_url:
-            name_html = f'<a href="{press_url}" target="_blank" rel="noopener noreferrer" class="person-name-link">{row.get("name", "")}</a>'
-        else:
-            name_html = f'<span class="person-name-no-link">{row.get("name", "")} <span style="font-size: 11px; color: #94a3b8;">(No details)</span></span>'
 
+def main():
+    # Opt-in stage timings (DHS_PROFILE=1 or ?profile=1)
+    profiler = RenderProfiler.from_request(st.query_params)
+
+    with profiler.stage("warm_start"):
+        start_cache_warmer()
+
+    # Shared, read-only dataset: every session gets the same object, no copy
+    with profiler.stage("load_database"):
+        db_data = load_database()
+    if not db_data.records:
+        st.error("⚠️ No data available. Please run the scraper first.")
+        return
+
+    # Cached views below are keyed by the data version instead of hashing records
+    last_updated = db_data.metadata.get("last_updated")
+    data_version = db_data.version
+
+    # Compact Info Navbar
+    with profiler.stage("ticker"):
+        render_ticker(last_updated)
+
+    # Pre-calculate lists for filters
+    with profiler.stage("filter_options"):
+        all_countries, all_states = get_filter_options(db_data, data_version)
+
+    # -------------------------------------------------------------------------
+    # LAYOUT
+    # -------------------------------------------------------------------------
+
+    # Header removed for single-page view
+
+    # SIDEBAR CONTENT
+    with profiler.stage("sidebar"), st.sidebar:
+        # A. Title Card
         st.markdown(
-            f"""
-        <div class="table-row">
-            <div>{mugshot_html}</div>
-            <div style="font-weight: 500;">{name_html}</div>
-            <div>{row.get("country", "").title()}</div>
-            <div title="{row.get("convicted_of", "")}">{crime}</div>
-            <div title="{row.get("arrested_location", "")}">{row.get("arrested_location", "")}</div>
-            <div>{date_fmt}</div>
+            """
+        <div class="sidebar-title-card">
+            <div class="sidebar-title-text">DHS Worst<br>of the Worst</div>
         </div>
         """,
             unsafe_allow_html=True,
         )
 
-    # Pagination Footer
-    st.markdown(
-        """<div style="padding: 16px; background-color: white;">""",
-        unsafe_allow_html=True,
-    )
-    col1, col2, col3 = st.columns([1, 1, 1])
-    with col1:
-        if st.button("Previous", disabled=st.session_state.page == 1):
-            st.session_state.page -= 1
-            st.rerun()
-    with col2:
+        # D. Search & Filter Card
+        st.markdown('<div class="sidebar-search-card">', unsafe_allow_html=True)
+
+        # Date Filter (Moved Up)
+        date_range = st.date_input(
+            "Date Range",
+            value=(DEFAULT_DATE_FROM, date.today()),
+            key="s_date_range",
+        )
+        st.markdown("<div style='margin-bottom: 24px;'></div>", unsafe_allow_html=True)
+
         st.markdown(
-            f"<div style='text-align:center; padding-top: 14px; color: #64748b; font-weight: 500;'>Page {st.session_state.page} of {total_pages}</div>",
+            '<div class="sidebar-search-header">Search & Filter</div>',
             unsafe_allow_html=True,
         )
-    with col3:
-        if st.button("Next", disabled=st.session_state.page == total_pages):
-            st.session_state.page += 1
-            st.rerun()
-    st.markdown("</div>", unsafe_allow_html=True)
+
+        # Grid inputs
+        f_name = st.text_input("Name", placeholder="Name", key="s_name")
+
+        f_country = st.selectbox("Country", ["All"] + all_countries, key="s_country")
+
+        f_state = st.selectbox("State", ["All"] + all_states, key="s_state")
+
+        f_crimes = st.multiselect(
+            "Crime Type",
+            ["Drug Trafficking", "Sexual Assault", "Murder", "Assault", "Theft"],
+            default=[],
+            key="s_crime",
+        )
+
+        st.markdown("<br>", unsafe_allow_html=True)
+        do_search = st.button("Search")
+
+        st.markdown("</div>", unsafe_allow_html=True)  # End search card
+
+    # MAIN AREA
+
+    # Filter Logic (cached per filter combination)
+    if not (isinstance(date_range, tuple) and len(date_range) == 2):
+        date_range = ()
+    filters = (tuple(date_range), f_name, f_country, f_state, tuple(f_crimes))
+    with profiler.stage("filter_aggregate"):
+        aggregates = compute_aggregates(db_data, data_version, filters)
+
+    # Row 1: KPI Cards
+    with profiler.stage("kpis"):
+        render_kpis(aggregates, f_country, f_state)
+
+    # Row 2: Charts - Two columns
+    with profiler.stage("charts"):
+        render_charts(aggregates)
+
+    # Row 3: Daily Trend (from rollups)
+    with profiler.stage("trends"):
+        if f_country != "All":
+            render_trends("country", f_country)
+        elif f_state != "All":
+            render_trends("state", f_state)
+        else:
+            render_trends(None, None)
+
+    # Row 4: Data Table
+    st.markdown(
+        '<div class="white-card" style="padding: 0; overflow: hidden; min-height: auto;">',
+        unsafe_allow_html=True,
+    )
+
+    with profiler.stage("table"):
+        render_results_table(db_data, data_version, filters)
 
     st.markdown("</div>", unsafe_allow_html=True)  # End table card
 
     # Inject JavaScript for photo zoom modal
-    components.html(
-        """
+    with profiler.stage("zoom_modal"):
+        components.html(
+            """
         <div id="photoModal" class="photo-modal" onclick="if(event.target.id==='photoModal') this.style.display='none'">
             <span class="photo-modal-close" onclick="document.getElementById('photoModal').style.display='none'">&times;</span>
             <img class="photo-modal-content" id="modalImage" alt="Zoomed photo">
@@ -1342,12 +1830,19 @@ def main():
                 }
             }
             
+            // Expose the modal to other component iframes (results table)
+            window.parent.openDhsPhoto = openPhotoModalInParent;
+
             // Run on load and periodically to catch new elements
             attachZoomHandlers();
             setInterval(attachZoomHandlers, 1000);
         </script>
-        """,
-        height=0,
+            """,
+            height=0,
+        )
+
+    profiler.finish(
+        st, records=aggregates["total"], filters=repr(filters), version=data_version
     )
 
 
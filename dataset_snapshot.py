@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Dataset Snapshot
+Publishes the tracker database as an Arrow IPC file that dashboard worker
+processes memory-map instead of each parsing historical_arrests.json; record
+values are read from the mapping on access rather than copied per process
+
+Usage examples:
+  python dataset_snapshot.py publish
+  python dataset_snapshot.py info
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from array import array
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Optional, Tuple
+
+from dhs_common import extract_state_from_location
+from ndjson_store import load_any
+
+DEFAULT_DB_PATH = "data/historical_arrests.json"
+DEFAULT_SNAPSHOT_PATH = "data/dataset.arrow"
+
+# Record fields carried in the snapshot (active_periods and history stay in
+# the JSON; the dashboard never reads them)
+STRING_FIELDS = [
+    "name",
+    "country",
+    "convicted_of",
+    "arrested_location",
+    "image_url",
+    "press_release_url",
+    "first_seen_date",
+    "last_seen_date",
+    "removed_date",
+    "status",
+]
+INT_FIELDS = ["scrape_count"]
+# Derived once at publish time so workers don't re-run the state lookup
+STATE_COLUMN = "state"
+
+
+def _schema(pa, metadata: Dict):
+    fields = [pa.field(name, pa.string()) for name in STRING_FIELDS]
+    fields += [pa.field(name, pa.int64()) for name in INT_FIELDS]
+    fields.append(pa.field(STATE_COLUMN, pa.string()))
+    return pa.schema(
+        fields,
+        metadata={"metadata": json.dumps(metadata, ensure_ascii=False)},
+    )
+
+
+def publish_snapshot(data: Dict, snapshot_path: str = DEFAULT_SNAPSHOT_PATH) -> Path:
+    """
+    Write data (the historical_arrests.json structure) as an Arrow IPC file.
+
+    The file is written next to its destination and moved into place with
+    os.replace, so a worker sees either the old version or the new one,
+    never a partial file. Workers that already mapped the old file keep
+    reading it until they reopen.
+    """
+    import pyarrow as pa
+
+    records = list(data.get("records", {}).values())
+    columns = {
+        name: [r.get(name) for r in records] for name in STRING_FIELDS + INT_FIELDS
+    }
+    columns[STATE_COLUMN] = [
+        extract_state_from_location(r.get("arrested_location")) for r in records
+    ]
+    table = pa.table(columns, schema=_schema(pa, data.get("metadata") or {}))
+
+    path = Path(snapshot_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            with pa.ipc.new_file(f, table.schema) as writer:
+                writer.write_table(table)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return path
+
+
+def open_snapshot(snapshot_path: str = DEFAULT_SNAPSHOT_PATH) -> Tuple:
+    """
+    Memory-map a snapshot and return (table, metadata) without copying.
+    The table's buffers point straight into the page cache, which every
+    worker process on the machine shares.
+    """
+    import pyarrow as pa
+
+    source = pa.memory_map(str(snapshot_path), "r")
+    table = pa.ipc.open_file(source).read_all()
+    raw = (table.schema.metadata or {}).get(b"metadata", b"{}")
+    return table, json.loads(raw)
+
+
+def _column(table, name: str):
+    """
+    A column as one array. Snapshots are written as a single chunk, which is
+    a view of the mapping; combine_chunks() would copy it into this process.
+    """
+    column = table.column(name)
+    return column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+
+
+class SnapshotRecord(Mapping):
+    """
+    One record, read field by field from the mapped columns on access. Null
+    values count as missing keys, as in the JSON.
+    """
+
+    __slots__ = ("_columns", "_row")
+
+    def __init__(self, columns: Dict, row: int):
+        self._columns = columns
+        self._row = row
+
+    def __getitem__(self, field):
+        value = self._columns[field][self._row].as_py()
+        if value is None:
+            raise KeyError(field)
+        return value
+
+    def __iter__(self):
+        return (f for f, c in self._columns.items() if c[self._row].is_valid)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"SnapshotRecord({dict(self)!r})"
+
+
+class _SnapshotRecords(Mapping):
+    """name -> SnapshotRecord, built on demand"""
+
+    __slots__ = ("_columns", "_rows")
+
+    def __init__(self, columns: Dict, rows: Dict):
+        self._columns = columns
+        self._rows = rows
+
+    def __getitem__(self, name) -> SnapshotRecord:
+        return SnapshotRecord(self._columns, self._rows[name])
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class _SnapshotRows(Sequence):
+    """A sequence of records at the given row indexes"""
+
+    __slots__ = ("_columns", "_indexes")
+
+    def __init__(self, columns: Dict, indexes):
+        self._columns = columns
+        self._indexes = indexes
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return _SnapshotRows(self._columns, self._indexes[i])
+        return SnapshotRecord(self._columns, self._indexes[i])
+
+    def __iter__(self):
+        columns = self._columns
+        return (SnapshotRecord(columns, row) for row in self._indexes)
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+
+class _StateIndex(Mapping):
+    """name -> state from the snapshot's precomputed state column"""
+
+    __slots__ = ("_state", "_rows")
+
+    def __init__(self, state, rows: Dict):
+        self._state = state
+        self._rows = rows
+
+    def __getitem__(self, name) -> Optional[str]:
+        return self._state[self._rows[name]].as_py()
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+class SnapshotDataset:
+    """
+    SharedDataset's read-only interface over a memory-mapped snapshot.
+
+    Record values stay in the mapped Arrow buffers, which every worker
+    process shares through the page cache; they are converted one field at
+    a time as a record is read. Each process only builds the name -> row
+    index and the active row list. The country and state option lists are
+    computed with Arrow.
+    """
+
+    __slots__ = (
+        "table",
+        "records",
+        "metadata",
+        "version",
+        "active",
+        "state_of",
+        "countries",
+        "states",
+    )
+
+    def __init__(self, snapshot_path: str = DEFAULT_SNAPSHOT_PATH):
+        import pyarrow.compute as pc
+
+        table, metadata = open_snapshot(snapshot_path)
+        self.table = table
+        columns = {field: _column(table, field) for field in STRING_FIELDS + INT_FIELDS}
+        rows = {name: row for row, name in enumerate(columns["name"].to_pylist())}
+        self.records = _SnapshotRecords(columns, rows)
+        self.metadata = MappingProxyType(dict(metadata))
+        self.version = self.metadata.get("last_updated") or ""
+
+        is_active = pc.equal(columns["status"], "active")
+        self.active = _SnapshotRows(
+            columns, array("q", pc.indices_nonzero(is_active).to_pylist())
+        )
+        state = _column(table, STATE_COLUMN)
+        self.state_of = _StateIndex(state, rows)
+        self.countries = tuple(
+            sorted(
+                c
+                for c in pc.unique(columns["country"].filter(is_active)).to_pylist()
+                if c
+            )
+        )
+        self.states = tuple(
+            sorted(s for s in pc.unique(state.filter(is_active)).to_pylist() if s)
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
+def snapshot_is_current(
+    db_path: str = DEFAULT_DB_PATH, snapshot_path: str = DEFAULT_SNAPSHOT_PATH
+) -> bool:
+    """True if the snapshot exists and is not older than the JSON database"""
+    snapshot, db = Path(snapshot_path), Path(db_path)
+    if not snapshot.exists():
+        return False
+    return not db.exists() or snapshot.stat().st_mtime_ns >= db.stat().st_mtime_ns
+
+
+def publish_from_json(
+    db_path: str = DEFAULT_DB_PATH, snapshot_path: str = DEFAULT_SNAPSHOT_PATH
+) -> Optional[Path]:
+    """Publish a snapshot of an existing historical_arrests .json/.ndjson"""
+    if not Path(db_path).exists():
+        return None
+    return publish_snapshot(load_any(db_path), snapshot_path)
+
+
+def main():
+    """Publish or inspect the dashboard's dataset snapshot"""
+    parser = argparse.ArgumentParser(description="Arrow snapshot of the tracker DB")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    publish = sub.add_parser("publish", help="Write the snapshot from the JSON DB")
+    publish.add_argument("--db", type=str, default=DEFAULT_DB_PATH)
+    publish.add_argument("--output", type=str, default=DEFAULT_SNAPSHOT_PATH)
+
+    info = sub.add_parser("info", help="Show what a snapshot contains")
+    info.add_argument("--snapshot", type=str, default=DEFAULT_SNAPSHOT_PATH)
+    args = parser.parse_args()
+
+    if args.command == "publish":
+        path = publish_from_json(args.db, args.output)
+        if path is None:
+            print(f"❌ No database at {args.db}")
+            sys.exit(1)
+        print(f"✅ Published {path} ({path.stat().st_size / 1e6:.1f} MB)")
+        return
+
+    table, metadata = open_snapshot(args.snapshot)
+    print(f"📦 {args.snapshot}")
+    print(f"   Records: {table.num_rows:,}")
+    print(f"   Last updated: {metadata.get('last_updated')}")
+    print(f"   Columns: {', '.join(table.column_names)}")
+
+
+if __name__ == "__main__":
+    main()
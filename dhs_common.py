@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Shared record helpers
+Location and crime classification used by both the tracker and the dashboard
+"""
+
+from collections import Counter
+
+STATE_ABBREV = {
+    "AL": "Alabama",
+    "AK": "Alaska",
+    "AZ": "Arizona",
+    "AR": "Arkansas",
+    "CA": "California",
+    "CO": "Colorado",
+    "CT": "Connecticut",
+    "DE": "Delaware",
+    "FL": "Florida",
+    "GA": "Georgia",
+    "HI": "Hawaii",
+    "ID": "Idaho",
+    "IL": "Illinois",
+    "IN": "Indiana",
+    "IA": "Iowa",
+    "KS": "Kansas",
+    "KY": "Kentucky",
+    "LA": "Louisiana",
+    "ME": "Maine",
+    "MD": "Maryland",
+    "MA": "Massachusetts",
+    "MI": "Michigan",
+    "MN": "Minnesota",
+    "MS": "Mississippi",
+    "MO": "Missouri",
+    "MT": "Montana",
+    "NE": "Nebraska",
+    "NV": "Nevada",
+    "NH": "New Hampshire",
+    "NJ": "New Jersey",
+    "NM": "New Mexico",
+    "NY": "New York",
+    "NC": "North Carolina",
+    "ND": "North Dakota",
+    "OH": "Ohio",
+    "OK": "Oklahoma",
+    "OR": "Oregon",
+    "PA": "Pennsylvania",
+    "RI": "Rhode Island",
+    "SC": "South Carolina",
+    "SD": "South Dakota",
+    "TN": "Tennessee",
+    "TX": "Texas",
+    "UT": "Utah",
+    "VT": "Vermont",
+    "VA": "Virginia",
+    "WA": "Washington",
+    "WV": "West Virginia",
+    "WI": "Wisconsin",
+    "WY": "Wyoming",
+    "DC": "District of Columbia",
+}
+
+STATE_NAMES = {name.upper(): name for name in STATE_ABBREV.values()}
+
+CRIME_KEYWORDS = {
+    "Drug Trafficking": [
+        "drug",
+        "narcotic",
+        "trafficking",
+        "cocaine",
+        "heroin",
+        "meth",
+    ],
+    "Sexual Assault": ["sex", "rape", "sexual", "assault", "child", "abuse"],
+    "Murder": ["murder", "homicide", "manslaughter", "kill"],
+    "Assault": ["assault", "battery"],
+    "DUI": ["dui", "dwi", "driving", "influence"],
+    "Theft": ["theft", "burglary", "robbery", "larceny"],
+}
+
+
+def extract_state_from_location(location):
+    """Extract state abbreviation or name from location string"""
+    if not location:
+        return None
+
+    parts = location.split(",")
+    if len(parts) >= 2:
+        state = parts[-1].strip().upper()
+        if state in STATE_ABBREV:
+            return STATE_ABBREV[state]
+        if state in STATE_NAMES:
+            return STATE_NAMES[state]
+
+    location_upper = location.strip().upper()
+    if location_upper in STATE_ABBREV:
+        return STATE_ABBREV[location_upper]
+    return location.strip()
+
+
+def classify_crime(crime_text):
+    """Map a convicted_of string to its first matching crime category"""
+    crime_text = (crime_text or "").lower()
+    if not crime_text:
+        return None
+    for category, keywords in CRIME_KEYWORDS.items():
+        if any(keyword in crime_text for keyword in keywords):
+            return category
+    return "Other"
+
+
+def get_most_common_crime(records):
+    """Determine the most common crime category"""
+    crime_counts = Counter(
+        classify_crime(record.get("convicted_of", "")) for record in records
+    )
+    crime_counts.pop(None, None)
+
+    if crime_counts:
+        return crime_counts.most_common(1)[0][0]
+    return "N/A"
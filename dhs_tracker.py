@@ -2,43 +2,274 @@
 """
 DHS Worst of the Worst - Enhanced Scraper with Historical Tracking
 Tracks when people first appear on the database
+
+Selenium is imported only by the scraper, so the query subcommands
+(stats, search-name, search-dates, export, verify) start without it.
 """
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.support.ui import Select
 import json
 import time
 import re
+import sys
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional
 from pathlib import Path
 
+from card_parser import parse_card
+from change_feed import write_changeset
+from dataset_snapshot import publish_snapshot
+from dhs_common import classify_crime, extract_state_from_location
+from ndjson_store import dump_ndjson, is_ndjson, load_ndjson
+from rate_control import AdaptiveRateController
+from record_stream import compute_statistics
+from scraper_metrics import ScrapeMetrics
+
+# Fields compared to decide whether a re-scraped record changed
+COMPARED_FIELDS = ("country", "convicted_of", "arrested_location", "image_url")
+
+# Fields owned by the tracker, never overwritten by scraped values
+TRACKING_FIELDS = (
+    "first_seen_date",
+    "last_seen_date",
+    "status",
+    "scrape_count",
+    "removed_date",
+    "active_periods",
+)
+
+# Stand-in end date for periods that are still open
+OPEN_END = "9999-12-31"
+
+# Restart the browser every N pages to avoid long-session flakiness
+RESTART_EVERY = 150
+
+# Pager parsing: ?page=N links, or an "of 1,872 results" style count
+PAGE_PARAM = re.compile(r"[?&]page=(\d+)")
+RESULT_COUNT = re.compile(r"\bof\s+([\d,]+)\s+(?:results|records|items|entries)", re.I)
+
+# Lean browsing: requests Chrome drops before they leave the browser. The
+# scraper reads DOM text, img src and link href only, so none of these are
+# needed; first-party scripts are still allowed (the filter form uses them).
+BLOCKED_URL_PATTERNS = [
+    # Images, fonts and media. Stylesheets stay: .text only returns rendered
+    # text, and without CSS screen-reader labels and collapsed content show up
+    "*.jpg",
+    "*.jpeg",
+    "*.png",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.ico",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.mp4",
+    # Analytics, tag managers and feedback widgets
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*dap.digitalgov.gov*",
+    "*siteimproveanalytics*",
+    "*touchpoints.app.cloud.gov*",
+    "*youtube.com*",
+]
+
+# Breakdowns kept in the daily rollups, each mapping a record to a bucket
+ROLLUP_DIMENSIONS = {
+    "country": lambda r: r.get("country") or "Unknown",
+    "state": lambda r: extract_state_from_location(r.get("arrested_location"))
+    or "Unknown",
+    "crime": lambda r: classify_crime(r.get("convicted_of")) or "Unknown",
+}
+
+# Order of the counters stored in each rollup triple
+ROLLUP_FIELDS = ["new", "removed", "active"]
+
+
+def _fingerprint(record: Dict, fallback: Optional[Dict] = None) -> tuple:
+    """
+    Hashable fingerprint of the compared fields.
+    Fields missing from `record` are taken from `fallback`. Used both ways, so
+    a scrape that omits a field does not count as a change, and neither does
+    one that fills in a field the stored record never had (e.g. after a
+    parser fix).
+    """
+    fallback = fallback or {}
+    return tuple(record.get(k, fallback.get(k)) for k in COMPARED_FIELDS)
+
+
+def _print_name_summary(label: str, names: List[str], limit: int = 5):
+    """Print a one-line count plus the first few names"""
+    if not names:
+        return
+    preview = ", ".join(names[:limit])
+    more = f" ... and {len(names) - limit} more" if len(names) > limit else ""
+    print(f"  {label}: {len(names)} ({preview}{more})")
+
+
+class _IntervalTree:
+    """
+    Static centered interval tree over half-open [start, end) date periods.
+    Dates are YYYY-MM-DD strings, so plain string comparison orders them.
+    Queries cost O(log n + k) for k matching periods.
+    """
+
+    def __init__(self, periods: List[tuple]):
+        # Empty periods (seen and removed on the same day) never overlap a
+        # query, and would stop the median split from making progress
+        periods = [p for p in periods if p[0] < p[1]]
+        self.starts = sorted(p[0] for p in periods)
+        self.ends = sorted(p[1] for p in periods)
+        self.root = self._build(periods)
+
+    def _build(self, periods: List[tuple]) -> Optional[tuple]:
+        if not periods:
+            return None
+        points = sorted(p[0] for p in periods)
+        center = points[len(points) // 2]
+        left, right, here = [], [], []
+        for p in periods:
+            if p[1] <= center:
+                left.append(p)
+            elif p[0] > center:
+                right.append(p)
+            else:
+                here.append(p)
+        by_start = sorted(here, key=lambda p: p[0])
+        by_end = sorted(here, key=lambda p: p[1], reverse=True)
+        return (center, by_start, by_end, self._build(left), self._build(right))
+
+    def overlapping(self, first: str, last: str) -> List[tuple]:
+        """Periods active on at least one day of the inclusive range"""
+        found = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            center, by_start, by_end, left, right = node
+            if last < center:
+                for p in by_start:
+                    if p[0] > last:
+                        break
+                    found.append(p)
+                stack.append(left)
+            elif first >= center:
+                for p in by_end:
+                    if p[1] <= first:
+                        break
+                    found.append(p)
+                stack.append(right)
+            else:
+                found.extend(by_start)
+                stack.append(left)
+                stack.append(right)
+        return found
+
+    def count_overlapping(self, first: str, last: str) -> int:
+        """Number of periods overlapping the inclusive range, in O(log n)"""
+        return bisect_right(self.starts, last) - bisect_right(self.ends, first)
+
+
+class _CrawlProgress:
+    """Thread-safe page counter that prints progress and an ETA"""
+
+    def __init__(self, total_pages: int, max_results: int = None):
+        self.total_pages = total_pages
+        self.max_results = max_results
+        self.pages_done = 0
+        self.records = 0
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def done_enough(self) -> bool:
+        """True once max_results records have been collected"""
+        return bool(self.max_results) and self.records >= self.max_results
+
+    def page_done(self, page_index: int, cards: int):
+        with self._lock:
+            self.pages_done += 1
+            self.records += cards
+            elapsed = time.perf_counter() - self._start
+            remaining = self.total_pages - self.pages_done
+            eta = elapsed / self.pages_done * remaining
+            status = f"✓ {cards} records" if cards else "✗ Empty"
+            print(
+                f"Page {page_index + 1} [{self.pages_done}/{self.total_pages}] "
+                f"{status} (Total: {self.records}) • ETA {_format_duration(eta)}"
+            )
+
+
+def _format_duration(seconds: float) -> str:
+    """90 -> '1m30s'"""
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m"
+    return f"{minutes}m{secs:02d}s" if minutes else f"{secs}s"
+
 
 class DHSDatabase:
-    """Manages historical tracking of DHS arrests"""
+    """
+    Manages historical tracking of DHS arrests.
+    A db_path ending in .ndjson uses the canonical one-record-per-line layout
+    (see ndjson_store.py) instead of indented JSON.
+    """
 
     def __init__(self, db_path: str = "data/historical_arrests.json"):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.rollups_path = self.db_path.with_name("daily_rollups.json")
+        self.snapshot_path = self.db_path.with_name("dataset.arrow")
+        self.changes_dir = self.db_path.with_name("changes")
         self.data = self._load_database()
+        self._activity_index = None
+        self._multi_period_records = []
+        self._backfill_active_periods()
 
     def _load_database(self) -> Dict:
         """Load existing database"""
         if self.db_path.exists():
+            if is_ndjson(self.db_path):
+                return load_ndjson(self.db_path)
             with open(self.db_path, "r", encoding="utf-8") as f:
                 return json.load(f)
-        return {"records": {}, "metadata": {"last_updated": None, "total_scrapes": 0}}
+        return {
+            "records": {},
+            "history": {},
+            "metadata": {"last_updated": None, "total_scrapes": 0},
+        }
 
     def _save_database(self):
         """Save database to disk"""
+        if is_ndjson(self.db_path):
+            dump_ndjson(self.data, self.db_path)
+            return
         with open(self.db_path, "w", encoding="utf-8") as f:
             json.dump(self.data, indent=2, fp=f, ensure_ascii=False)
 
+    def _publish_snapshot(self):
+        """Swap in a fresh Arrow snapshot for the dashboard workers"""
+        try:
+            publish_snapshot(self.data, self.snapshot_path)
+        except ImportError:
+            print("⚠️  pyarrow not installed; dashboard will read the JSON database")
+
+    def _backfill_active_periods(self):
+        """Derive active_periods for records saved before periods were tracked"""
+        for record in self.data["records"].values():
+            if "active_periods" not in record and record.get("first_seen_date"):
+                end = (
+                    record.get("removed_date")
+                    if record["status"] == "removed"
+                    else None
+                )
+                record["active_periods"] = [[record["first_seen_date"], end]]
+
     def update_records(
         self, new_records: List[Dict], min_expected_records: int = 100
     ) -> Dict:
@@ -46,23 +277,42 @@ class DHSDatabase:
         Update database with new scrape results
         Returns statistics about changes
 
+        The merge is set-based: the scrape is keyed by name once, then the
+        new / still-present / changed / removed name sets are computed with
+        set operations and applied in bulk.
+
         Args:
             new_records: List of newly scraped records
             min_expected_records: Minimum records expected for a successful scrape.
                                  If less, don't mark missing records as removed.
         """
         today = datetime.now().strftime("%Y-%m-%d")
+        records = self.data["records"]
+
+        # Key the scrape by name (a repeated name keeps its last occurrence)
+        scraped = {r["name"]: r for r in new_records}
+        scraped_names = scraped.keys()
+        known_names = records.keys()
+        active_names = {name for name, r in records.items() if r["status"] == "active"}
+
+        new_names = scraped_names - known_names
+        present_names = scraped_names & known_names
+        changed_names = {
+            name
+            for name in present_names
+            if _fingerprint(scraped[name], records[name])
+            != _fingerprint(records[name], scraped[name])
+        }
+
         stats = {
-            "new_people": [],
-            "updated_people": [],
-            "still_present": 0,
+            "new_people": [name for name in scraped if name in new_names],
+            "updated_people": [name for name in scraped if name in changed_names],
+            "still_present": len(present_names),
             "total_in_scrape": len(new_records),
         }
 
         # Safety check: if we got very few records, something went wrong.
-        current_active = sum(
-            1 for r in self.data["records"].values() if r["status"] == "active"
-        )
+        current_active = len(active_names)
         scrape_looks_incomplete = (
             len(new_records) < min_expected_records
             or len(new_records)
@@ -78,66 +328,71 @@ class DHSDatabase:
             )
             print(f"⚠️  Set --min-expected-records lower if this is intentional.\n")
 
-        # Create a set of names from new scrape
-        scraped_names = {r["name"] for r in new_records}
-
-        # Update existing records and add new ones
-        for record in new_records:
-            name = record["name"]
-
-            if name not in self.data["records"]:
-                # NEW PERSON - first time seeing them
-                record["first_seen_date"] = today
-                record["last_seen_date"] = today
-                record["status"] = "active"
-                record["scrape_count"] = 1
-                self.data["records"][name] = record
-                stats["new_people"].append(name)
-                print(f"  🆕 NEW: {name}")
-            else:
-                # EXISTING PERSON - update last seen
-                existing = self.data["records"][name]
-
-                # Check if any data changed
-                data_changed = False
-                for key in [
-                    "country",
-                    "convicted_of",
-                    "arrested_location",
-                    "image_url",
-                ]:
-                    if key in record and record[key] != existing.get(key):
-                        data_changed = True
-                        break
-
-                if data_changed:
-                    stats["updated_people"].append(name)
-
-                # Update record
-                existing["last_seen_date"] = today
-                existing["scrape_count"] = existing.get("scrape_count", 0) + 1
-
-                # Update any changed fields
-                for key, value in record.items():
-                    if key not in [
-                        "first_seen_date",
-                        "last_seen_date",
-                        "status",
-                        "scrape_count",
-                    ]:
-                        existing[key] = value
-
-                stats["still_present"] += 1
+        # NEW PEOPLE - first time seeing them
+        for name in new_names:
+            record = scraped[name]
+            record["first_seen_date"] = today
+            record["last_seen_date"] = today
+            record["status"] = "active"
+            record["scrape_count"] = 1
+            record["active_periods"] = [[today, None]]
+            records[name] = record
+
+        # RE-APPEARED PEOPLE - previously removed, listed again
+        reappeared_names = {
+            name for name in present_names if records[name]["status"] == "removed"
+        }
+        for name in reappeared_names:
+            existing = records[name]
+            existing["status"] = "active"
+            existing.pop("removed_date", None)
+            existing.setdefault("active_periods", []).append([today, None])
+        stats["reappeared_people"] = [
+            name for name in scraped if name in reappeared_names
+        ]
+
+        # Record reverse deltas (old values only) before overwriting; fields
+        # being filled in for the first time are not changes
+        history = self.data.setdefault("history", {})
+        field_changes = {}
+        for name in changed_names:
+            existing = records[name]
+            old_values = {
+                k: existing[k]
+                for k, v in scraped[name].items()
+                if k in COMPARED_FIELDS and k in existing and v != existing[k]
+            }
+            history.setdefault(name, []).append([today, old_values])
+            field_changes[name] = {
+                k: [old, scraped[name][k]] for k, old in old_values.items()
+            }
+
+        # EXISTING PEOPLE - update last seen and copy scraped fields over
+        for name in present_names:
+            existing = records[name]
+            existing.update(
+                {k: v for k, v in scraped[name].items() if k not in TRACKING_FIELDS}
+            )
+            existing["last_seen_date"] = today
+            existing["scrape_count"] = existing.get("scrape_count", 0) + 1
 
         # Mark people who are no longer in the database
         # BUT ONLY if the scrape looks complete
+        removed_names = []
         if not scrape_looks_incomplete:
-            for name, record in self.data["records"].items():
-                if name not in scraped_names and record["status"] == "active":
-                    record["status"] = "removed"
-                    record["removed_date"] = today
-                    print(f"  ❌ REMOVED: {name}")
-        else:
+            removed_names = sorted(active_names - scraped_names)
+            for name in removed_names:
+                records[name]["status"] = "removed"
+                records[name]["removed_date"] = today
+                periods = records[name].setdefault("active_periods", [[today, None]])
+                periods[-1][1] = today
+        stats["removed_people"] = removed_names
+
+        _print_name_summary("🆕 NEW", stats["new_people"])
+        _print_name_summary("✏️  UPDATED", stats["updated_people"])
+        _print_name_summary("🔁 RE-APPEARED", stats["reappeared_people"])
+        _print_name_summary("❌ REMOVED", removed_names)
+        if scrape_looks_incomplete:
             print(
                 f"\n✓ Skipped marking missing records as removed (scrape appears incomplete)"
             )
@@ -147,14 +402,196 @@ class DHSDatabase:
         self.data["metadata"]["total_scrapes"] = (
             self.data["metadata"].get("total_scrapes", 0) + 1
         )
-        self.data["metadata"]["total_records"] = len(self.data["records"])
-        self.data["metadata"]["active_records"] = sum(
-            1 for r in self.data["records"].values() if r["status"] == "active"
+        self.data["metadata"]["total_records"] = len(records)
+        self.data["metadata"]["active_records"] = (
+            len(active_names)
+            + len(new_names)
+            + len(reappeared_names)
+            - len(removed_names)
         )
 
+        self._activity_index = None
         self._save_database()
+        self._publish_snapshot()
+        write_changeset(
+            {
+                "run": self.data["metadata"]["total_scrapes"],
+                "date": today,
+                "timestamp": self.data["metadata"]["last_updated"],
+                "scrape_complete": not scrape_looks_incomplete,
+                "new": [records[name] for name in stats["new_people"]],
+                "updated": {
+                    name: field_changes[name] for name in stats["updated_people"]
+                },
+                "reappeared": stats["reappeared_people"],
+                "removed": removed_names,
+            },
+            self.changes_dir,
+        )
+        self._update_daily_rollups(today, new_names, removed_names)
         return stats
 
+    def get_history(self, name: str) -> List[Dict]:
+        """
+        Field-level change history for a record, oldest first.
+        Each entry is {"date", "field", "old", "new"}.
+        """
+        record = self.data["records"].get(name)
+        deltas = self.data.get("history", {}).get(name, [])
+        if record is None or not deltas:
+            return []
+
+        # Walk backwards from the current record to recover each "new" value
+        current = {k: record.get(k) for k in COMPARED_FIELDS}
+        changes = []
+        for date, old_values in reversed(deltas):
+            entry = [
+                {"date": date, "field": field, "old": old, "new": current[field]}
+                for field, old in old_values.items()
+            ]
+            current.update(old_values)
+            changes[:0] = entry
+        return changes
+
+    def get_record_as_of(self, name: str, date: str) -> Optional[Dict]:
+        """
+        Rebuild a record as it looked at the end of `date` (YYYY-MM-DD).
+        Only the compared fields are rolled back; tracking fields are current.
+        Returns None if the person had not been seen yet.
+        """
+        record = self.data["records"].get(name)
+        if record is None or record.get("first_seen_date", "") > date:
+            return None
+
+        snapshot = dict(record)
+        for change_date, old_values in reversed(
+            self.data.get("history", {}).get(name, [])
+        ):
+            if change_date <= date:
+                break
+            for field, old in old_values.items():
+                if old is None:
+                    snapshot.pop(field, None)
+                else:
+                    snapshot[field] = old
+        return snapshot
+
+    def load_rollups(self) -> Dict:
+        """Load the daily rollups file"""
+        if self.rollups_path.exists():
+            with open(self.rollups_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return {"fields": ROLLUP_FIELDS, "days": {}}
+
+    def _save_rollups(self, rollups: Dict):
+        """Save rollups with one day per line so daily diffs stay small"""
+        days = rollups["days"]
+        lines = [
+            json.dumps(day)
+            + ":"
+            + json.dumps(days[day], ensure_ascii=False, separators=(",", ":"))
+            for day in sorted(days)
+        ]
+        with open(self.rollups_path, "w", encoding="utf-8") as f:
+            f.write(
+                '{"fields":'
+                + json.dumps(rollups["fields"], separators=(",", ":"))
+                + ',"days":{\n'
+            )
+            f.write(",\n".join(lines))
+            f.write("\n}}\n")
+
+    def _update_daily_rollups(self, today: str, new_names, removed_names):
+        """
+        Fold one merge into today's rollup.
+        Each bucket is a [new, removed, active] triple; new and removed
+        accumulate across same-day runs while active is replaced.
+        """
+        records = self.data["records"]
+        new = [records[name] for name in new_names]
+        removed = [records[name] for name in removed_names]
+        active = [r for r in records.values() if r["status"] == "active"]
+
+        rollups = self.load_rollups()
+        day = rollups["days"].get(today, {})
+        prev_total = day.get("total", [0, 0, 0])
+        entry = {
+            "total": [
+                prev_total[0] + len(new),
+                prev_total[1] + len(removed),
+                len(active),
+            ]
+        }
+
+        for dim, bucket_of in ROLLUP_DIMENSIONS.items():
+            prev = day.get(dim, {})
+            counts = {}
+            for idx, group in ((0, new), (1, removed), (2, active)):
+                for record in group:
+                    bucket = bucket_of(record)
+                    if bucket not in counts:
+                        counts[bucket] = [*prev.get(bucket, [0, 0])[:2], 0]
+                    counts[bucket][idx] += 1
+            # Keep buckets that only had arrivals/removals earlier today
+            for bucket, triple in prev.items():
+                if bucket not in counts and (triple[0] or triple[1]):
+                    counts[bucket] = [triple[0], triple[1], 0]
+            entry[dim] = counts
+
+        rollups["days"][today] = entry
+        self._save_rollups(rollups)
+
+    def _get_activity_index(self) -> _IntervalTree:
+        """Interval tree over every record's active periods, built on demand"""
+        if self._activity_index is None:
+            periods = [
+                (start, end or OPEN_END, name)
+                for name, record in self.data["records"].items()
+                for start, end in record.get("active_periods", [])
+            ]
+            self._activity_index = _IntervalTree(periods)
+            self._multi_period_records = [
+                record
+                for record in self.data["records"].values()
+                if len(record.get("active_periods", [])) > 1
+            ]
+        return self._activity_index
+
+    def get_active_between(self, start_date: str, end_date: str) -> List[Dict]:
+        """Records active on at least one day between two dates (inclusive)"""
+        periods = self._get_activity_index().overlapping(start_date, end_date)
+        names = dict.fromkeys(p[2] for p in periods)
+        return [self.data["records"][name] for name in names]
+
+    def get_active_on(self, date: str) -> List[Dict]:
+        """Records that were active on a given date"""
+        return self.get_active_between(date, date)
+
+    def count_active_between(self, start_date: str, end_date: str) -> int:
+        """
+        Number of records active on at least one day between two dates.
+        Periods are counted by bisection; only records with several periods
+        (re-appearances) are inspected individually to avoid double counts.
+        """
+        index = self._get_activity_index()
+        count = index.count_overlapping(start_date, end_date)
+        for record in self._multi_period_records:
+            # Same filter as the tree: empty periods were never counted
+            hits = sum(
+                1
+                for start, end in record["active_periods"]
+                if start < (end or OPEN_END)
+                and start <= end_date
+                and (end or OPEN_END) > start_date
+            )
+            count -= max(hits - 1, 0)
+        return count
+
+    def count_active_on(self, date: str) -> int:
+        """Number of records active on a given date, in O(log n)"""
+        # Periods of one record never overlap, so a single day needs no dedup
+        return self._get_activity_index().count_overlapping(date, date)
+
     def search_by_date_range(self, start_date: str, end_date: str) -> List[Dict]:
         """Find people who first appeared between two dates"""
         results = []
@@ -175,50 +612,43 @@ class DHSDatabase:
 
     def get_statistics(self) -> Dict:
         """Get database statistics"""
-        records = list(self.data["records"].values())
-        active = [r for r in records if r["status"] == "active"]
-
-        # Count by country
-        country_counts = {}
-        for r in active:
-            country = r.get("country", "Unknown")
-            country_counts[country] = country_counts.get(country, 0) + 1
-
-        # Count by state
-        state_counts = {}
-        for r in active:
-            location = r.get("arrested_location", "")
-            # Extract state from "City, State" format
-            if "," in location:
-                state = location.split(",")[-1].strip()
-                state_counts[state] = state_counts.get(state, 0) + 1
-
-        return {
-            "total_records": len(records),
-            "active_records": len(active),
-            "removed_records": len(records) - len(active),
-            "top_countries": sorted(
-                country_counts.items(), key=lambda x: x[1], reverse=True
-            )[:10],
-            "top_states": sorted(
-                state_counts.items(), key=lambda x: x[1], reverse=True
-            )[:10],
-            "last_updated": self.data["metadata"].get("last_updated"),
-            "total_scrapes": self.data["metadata"].get("total_scrapes", 0),
-        }
+        return compute_statistics(self.data["records"].values(), self.data["metadata"])
 
 
 class DHSWoWScraper:
     """Selenium-based scraper for DHS Worst of the Worst"""
 
-    def __init__(self, headless: bool = True, delay: float = 2.0):
+    def __init__(
+        self,
+        headless: bool = True,
+        delay: float = 2.0,
+        metrics: Optional[ScrapeMetrics] = None,
+        base_url: str = "https://www.dhs.gov/wow",
+        rate: Optional[AdaptiveRateController] = None,
+        lean: bool = False,
+        transfer_stats: bool = False,
+    ):
         self.headless = headless
+        # Eager page loads with images, fonts, media and analytics blocked
+        self.lean = lean
+        # Chrome's performance log, for per-page bytes and request counts
+        self.transfer_stats = transfer_stats
         self.delay = delay
+        self.metrics = metrics or ScrapeMetrics(out_dir=None)
+        self.rate = rate or AdaptiveRateController(initial_delay=delay)
+        self.last_failure = None  # why the last load/extract came back empty
+        self.last_fetch_s = 0.0
+        self.retry_report = {"queued": [], "recovered": [], "still_failed": []}
+        self.crawl_plan = {"discovered_pages": None, "planned_pages": None}
         self.driver = None
-        self.base_url = "https://www.dhs.gov/wow"
+        # Point at a local replay server (wow_fixtures.py) for offline runs
+        self.base_url = base_url
 
     def setup_driver(self):
         """Setup Chrome WebDriver"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
         print("Setting up Chrome WebDriver...")
 
         chrome_options = Options()
@@ -233,24 +663,82 @@ class DHSWoWScraper:
         )
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option("useAutomationExtension", False)
+        if self.transfer_stats:
+            # Network events for the per-page transfer counters
+            chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        if self.lean:
+            # Return from get() at DOMContentLoaded; extract_all_cards
+            # already waits for the cards themselves
+            chrome_options.page_load_strategy = "eager"
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            chrome_options.add_experimental_option(
+                "prefs", {"profile.managed_default_content_settings.images": 2}
+            )
 
         try:
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.execute_script(
                 "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
             )
-            print("✓ WebDriver initialized\n")
+            if self.lean:
+                self._block_resources()
+            print(f"✓ WebDriver initialized{' (lean browsing)' if self.lean else ''}\n")
             return True
         except Exception as e:
             print(f"✗ Error initializing WebDriver: {e}")
             return False
 
+    def _block_resources(self):
+        """Drop non-essential requests through the DevTools Network domain"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS}
+            )
+        except Exception as e:
+            # Images stay disabled and loads stay eager without it
+            print(f"⚠️  Request blocking unavailable: {e}")
+
+    def drain_transfer_stats(self) -> Dict:
+        """
+        Network totals since the last call, from Chrome's performance log:
+        transfer_bytes (encoded, on-the-wire size of finished responses),
+        resource_requests and blocked_requests.
+        """
+        stats = {"transfer_bytes": 0, "resource_requests": 0, "blocked_requests": 0}
+        if not self.transfer_stats:
+            return stats
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception:
+            return stats
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                stats["resource_requests"] += 1
+            elif method == "Network.loadingFinished":
+                stats["transfer_bytes"] += int(params.get("encodedDataLength", 0))
+            elif method == "Network.loadingFailed" and params.get("blockedReason"):
+                stats["blocked_requests"] += 1
+        return stats
+
+    def _count_transfer(self):
+        if not self.transfer_stats:
+            return
+        for key, value in self.drain_transfer_stats().items():
+            self.metrics.count(key, value)
+
     def load_page(self, url: str = None) -> bool:
         """Load the main page"""
         try:
             url = url or self.base_url
-            self.driver.get(url)
-            time.sleep(self.delay + 1)
+            with self.metrics.timed("fetch_ms"):
+                self.driver.get(url)
+            self._pause(self.delay + 1)
             return True
         except Exception as e:
             print(f"✗ Error loading page: {e}")
@@ -258,124 +746,99 @@ class DHSWoWScraper:
 
     def extract_all_cards(self) -> List[Dict]:
         """Extract all person cards from current page"""
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         try:
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "li.usa-card"))
-            )
-            time.sleep(3)
+            with self.metrics.timed("wait_ms"):
+                WebDriverWait(self.driver, 15).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "li.usa-card"))
+                )
+            self._pause(3)
 
             cards = self.driver.find_elements(By.CSS_SELECTOR, "li.usa-card")
             if not cards:
                 return []
 
+            extract_start = time.perf_counter()
             records = []
-            for idx, card in enumerate(cards, 1):
+            for card in cards:
                 try:
                     full_text = card.text.strip()
                     if not full_text or len(full_text) < 20:
                         continue
 
-                    record = {}
-                    lines = full_text.split("\n")
-
-                    # Extract country (first line, all caps)
-                    if lines and lines[0].isupper() and len(lines[0]) < 30:
-                        record["country"] = lines[0].strip()
-
-                    # Find section markers
-                    convicted_idx = next(
-                        (
-                            i
-                            for i, line in enumerate(lines)
-                            if "CONVICTED OF:" in line.upper()
-                            or "ARRESTED FOR:" in line.upper()
-                        ),
-                        None,
-                    )
-                    arrested_idx = next(
-                        (
-                            i
-                            for i, line in enumerate(lines)
-                            if line.strip().upper() == "ARRESTED:"
-                        ),
-                        None,
-                    )
-                    name_idx = next(
-                        (
-                            i
-                            for i, line in enumerate(lines)
-                            if line.strip().upper() == "NAME:"
-                        ),
-                        None,
-                    )
-
-                    # Extract convicted_of
-                    if convicted_idx is not None and arrested_idx is not None:
-                        crime_lines = lines[convicted_idx + 1 : arrested_idx]
-                        crime_text = " ".join(
-                            [l.strip() for l in crime_lines if l.strip()]
-                        )
-                        if crime_text:
-                            record["convicted_of"] = crime_text
-
-                    # Extract location
-                    if arrested_idx is not None and name_idx is not None:
-                        location_lines = lines[arrested_idx + 1 : name_idx]
-                        location_text = " ".join(
-                            [l.strip() for l in location_lines if l.strip()]
-                        )
-                        if location_text:
-                            record["arrested_location"] = location_text
-
-                    # Extract name
-                    if name_idx is not None and name_idx + 1 < len(lines):
-                        name_lines = lines[name_idx + 1 :]
-                        name_parts = []
-                        for line in name_lines:
-                            line = line.strip()
-                            if line == ">>" or not line:
-                                break
-                            name_parts.append(line)
-                        name_text = " ".join(name_parts)
-                        if name_text:
-                            record["name"] = name_text
-
-                    # Extract image URL
+                    image_src = href = None
                     try:
-                        img = card.find_element(By.CSS_SELECTOR, "img")
-                        src = img.get_attribute("src")
-                        if src:
-                            if src.startswith("/"):
-                                src = "https://www.dhs.gov" + src
-                            record["image_url"] = src
+                        image_src = card.find_element(
+                            By.CSS_SELECTOR, "img"
+                        ).get_attribute("src")
                     except:
                         pass
-
-                    # Extract press release URL
                     try:
-                        press_link = card.find_element(
+                        href = card.find_element(
                             By.CSS_SELECTOR, "a.usa-card__more"
-                        )
-                        href = press_link.get_attribute("href")
-                        if href:
-                            if href.startswith("/"):
-                                href = "https://www.dhs.gov" + href
-                            record["press_release_url"] = href
+                        ).get_attribute("href")
                     except:
                         pass
 
-                    if record.get("name"):
+                    record = parse_card(full_text, image_src, href)
+                    if record:
                         records.append(record)
 
                 except Exception as e:
+                    self.metrics.count("parse_failures")
                     continue
 
+            self.metrics.count(
+                "extract_ms", (time.perf_counter() - extract_start) * 1000
+            )
             return records
 
+        except TimeoutException:
+            self.last_failure = "timeout"
+            print("  ✗ Timed out waiting for cards")
+            return []
         except Exception as e:
+            self.last_failure = "error"
             print(f"  ✗ Error extracting cards: {e}")
             return []
 
+    def _pause(self, fixed_seconds: float):
+        """Settle/pacing sleep: the adaptive delay, or fixed_seconds if fixed"""
+        if self.rate.adaptive:
+            self.metrics.wait(self.rate.delay)
+        else:
+            self.metrics.wait(fixed_seconds)
+
+    def _error_page_kind(self) -> Optional[str]:
+        """Recognise throttling and server error pages by their title"""
+        try:
+            title = (self.driver.title or "").lower()
+        except Exception:
+            return None
+        if "429" in title or "too many requests" in title:
+            return "http_429"
+        if any(
+            marker in title
+            for marker in (
+                "500",
+                "502",
+                "503",
+                "504",
+                "service unavailable",
+                "bad gateway",
+                "gateway timeout",
+                "internal server error",
+            )
+        ):
+            return "http_5xx"
+        if "access denied" in title:
+            return "http_403"
+        return None
+
     def load_page_number(self, page_index: int, cache_bust: bool = False) -> bool:
         """
         Navigate directly to a page by index (0-based) using the ?page=X query param.
@@ -391,10 +854,24 @@ class DHSWoWScraper:
                 url = self.base_url
             else:
                 url = f"{self.base_url}?page={page_index}{suffix}"
-            self.driver.get(url)
-            time.sleep(self.delay + 1)
+            # Shared with any other worker sessions: wait for our send slot
+            self.metrics.wait(self.rate.acquire())
+            self.rate.on_request()
+            fetch_start = time.perf_counter()
+            with self.metrics.timed("fetch_ms"):
+                self.driver.get(url)
+            self.last_fetch_s = time.perf_counter() - fetch_start
+
+            error_kind = self._error_page_kind()
+            if error_kind:
+                self.last_failure = error_kind
+                self.metrics.count("throttled")
+                print(f"  ⚠️  Page index {page_index} returned {error_kind}")
+                return False
+            self._pause(self.delay + 1)
             return True
         except Exception as e:
+            self.last_failure = "load_error"
             print(f"  ⚠️  Error loading page index {page_index}: {e}")
             return False
 
@@ -403,8 +880,12 @@ class DHSWoWScraper:
         Load a page and extract cards, with retry and scroll to handle lazy loading.
         """
         for attempt in range(1, attempts + 1):
+            self.metrics.count("attempts")
+            self.last_failure = None
             cache_bust = attempt > 1  # add cache-buster after first try
             if not self.load_page_number(page_index, cache_bust=cache_bust):
+                if attempt < attempts:
+                    self.metrics.wait(self.rate.on_failure(self.last_failure))
                 continue
 
             # Nudge the page to load lazy content
@@ -414,16 +895,21 @@ class DHSWoWScraper:
                 )
             except Exception:
                 pass
-            time.sleep(self.delay + 2)  # slightly longer settle time
+            self._pause(self.delay + 2)  # slightly longer settle time
 
             cards = self.extract_all_cards()
+            self._count_transfer()
             if cards:
+                self.metrics.count("cards", len(cards))
+                self.rate.on_success(self.last_fetch_s)
                 return cards
 
             print(
                 f"  ⚠️  No cards found on page {page_index + 1}, retry {attempt}/{attempts}"
             )
-            time.sleep(self.delay + 3)
+            backoff = self.rate.on_failure(self.last_failure or "empty")
+            if attempt < attempts:
+                self.metrics.wait(backoff)
 
         return []
 
@@ -431,6 +917,9 @@ class DHSWoWScraper:
         self, country: str = None, state: str = None, search_term: str = None
     ):
         """Apply filters on the page"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import Select
+
         try:
             if search_term:
                 search_input = self.driver.find_element(By.ID, "edit-combine")
@@ -460,7 +949,7 @@ class DHSWoWScraper:
             try:
                 search_button = self.driver.find_element(By.ID, "edit-submit-wow")
                 search_button.click()
-                time.sleep(self.delay + 1)
+                self.metrics.wait(self.delay + 1)
             except:
                 pass
         except Exception as e:
@@ -472,12 +961,19 @@ class DHSWoWScraper:
         state: str = None,
         max_pages: int = 50,
         max_results: int = None,
+        retry_workers: int = 3,
+        workers: int = 1,
     ) -> List[Dict]:
         """
         Scrape all records using direct page navigation (?page=N) to avoid flaky clicks.
         Pages on DHS are 0-based in the query param; UI shows 1-based.
+        The page count is read from page 0's pager so exactly those pages are
+        scraped (shared over `workers` sessions); without a pager it walks
+        until three empty pages. Pages that stay empty after their retries
+        are re-scraped concurrently after the main pass (see retry_failed_pages).
         """
         all_records = []
+        failed_pages = []
 
         if not self.setup_driver():
             return all_records
@@ -487,33 +983,110 @@ class DHSWoWScraper:
             if not self.load_page_number(0):
                 return all_records
             self.apply_filters(country=country, state=state)
-            time.sleep(self.delay)
+            self.metrics.wait(self.delay)
         else:
             # Ensure first page is loaded
             if not self.load_page_number(0):
                 return all_records
 
-        consecutive_empty = 0
-        restart_every = (
-            150  # restart driver periodically to avoid long-session flakiness
+        last_page = self.discover_last_page()
+        if last_page is None:
+            print("📋 No pager found; walking pages until three come back empty\n")
+            all_records, failed_pages, pages_scraped = self._walk_pages(
+                max_pages, max_results, retry_workers, country, state
+            )
+        else:
+            planned = list(range(min(last_page + 1, max_pages)))
+            print(
+                f"📋 Pager reports {last_page + 1} pages; scraping {len(planned)} "
+                f"with {max(min(workers, len(planned)), 1)} session(s)\n"
+            )
+            all_records, failed_pages = self._scrape_planned(
+                planned, workers, max_results, country, state
+            )
+            pages_scraped = len(planned)
+            self.crawl_plan = {
+                "discovered_pages": last_page + 1,
+                "planned_pages": len(planned),
+            }
+
+        if failed_pages and retry_workers > 0:
+            recovered = self.retry_failed_pages(
+                failed_pages, workers=retry_workers, country=country, state=state
+            )
+            for page_index in sorted(recovered):
+                all_records.extend(recovered[page_index])
+        if max_results:
+            all_records = all_records[:max_results]
+
+        print(f"\n{'=' * 70}")
+        print(
+            f"Scraping completed: {len(all_records)} total records "
+            f"from {pages_scraped} pages"
         )
+        print(f"{'=' * 70}\n")
+        return all_records
+
+    def discover_last_page(self) -> Optional[int]:
+        """
+        Last 0-based page index according to the loaded page's pager:
+        the highest ?page= link, else an "of N results" count. None if the
+        page has neither.
+        """
+        from selenium.webdriver.common.by import By
+
+        try:
+            links = self.driver.find_elements(By.CSS_SELECTOR, "a[href*='page=']")
+            hrefs = [link.get_attribute("href") or "" for link in links]
+        except Exception:
+            hrefs = []
+        page_params = [int(m.group(1)) for h in hrefs for m in PAGE_PARAM.finditer(h)]
+        if page_params:
+            return max(page_params)
+
+        try:
+            text = self.driver.find_element(By.TAG_NAME, "body").text
+        except Exception:
+            return None
+        match = RESULT_COUNT.search(text)
+        cards = len(self.driver.find_elements(By.CSS_SELECTOR, "li.usa-card"))
+        if match and cards:
+            total = int(match.group(1).replace(",", ""))
+            return max((total - 1) // cards, 0)
+        return None
+
+    def _walk_pages(
+        self,
+        max_pages: int,
+        max_results: int = None,
+        retry_workers: int = 0,
+        country: str = None,
+        state: str = None,
+    ):
+        """
+        Fallback when the page count is unknown: go page by page until three
+        consecutive pages come back empty. With retry_workers, those three
+        are re-checked in fresh sessions first, and the walk carries on past
+        them if any recover. Returns (records, failed, pages).
+        """
+        all_records = []
+        failed_pages = []
+        consecutive_empty = 0
 
         for page_num in range(1, max_pages + 1):
             page_index = page_num - 1  # zero-based for the ?page= param
             print(f"Page {page_num} (page param={page_index})...", end=" ")
 
             # Periodic driver restart to avoid long-session instability
-            if page_num > 1 and (page_num - 1) % restart_every == 0:
-                try:
-                    self.close()
-                except Exception:
-                    pass
-                print("\n  ↻ Restarting browser to avoid session issues...\n")
-                if not self.setup_driver():
-                    print("  ✗ Failed to restart driver")
+            if page_num > 1 and (page_num - 1) % RESTART_EVERY == 0:
+                if not self._restart_driver():
+                    # Leave the page to the second pass rather than drop it
+                    failed_pages.append(page_index)
                     break
 
+            self.metrics.begin_page(page_index)
             cards = self.get_cards_with_retry(page_index, attempts=4)
+            self.metrics.end_page()
 
             if cards:
                 all_records.extend(cards)
@@ -521,21 +1094,185 @@ class DHSWoWScraper:
                 consecutive_empty = 0
 
                 if max_results and len(all_records) >= max_results:
-                    all_records = all_records[:max_results]
                     break
             else:
+                failed_pages.append(page_index)
                 consecutive_empty += 1
                 print(f"✗ Empty (attempt {consecutive_empty}/3)")
-                if consecutive_empty >= 3:
+                if consecutive_empty < 3:
+                    continue
+                if not retry_workers:
                     print("\n⚠️  Three consecutive empty pages, stopping scrape")
                     break
 
-        print(f"\n{'=' * 70}")
+                # A flaky run of empties looks the same as the end of the
+                # listing, so confirm it before stopping
+                streak = failed_pages[-3:]
+                del failed_pages[-3:]
+                recovered = self.retry_failed_pages(
+                    streak, workers=retry_workers, country=country, state=state
+                )
+                if not recovered:
+                    print("\n⚠️  Three consecutive empty pages confirmed, stopping")
+                    break
+                for streak_index in streak:
+                    all_records.extend(recovered.get(streak_index, []))
+                consecutive_empty = 0
+                print(f"  ↪ Continuing the walk (Total: {len(all_records)})\n")
+                if max_results and len(all_records) >= max_results:
+                    break
+
+        return all_records, failed_pages, page_num
+
+    def _scrape_planned(
+        self,
+        planned: List[int],
+        workers: int,
+        max_results: int = None,
+        country: str = None,
+        state: str = None,
+    ):
+        """
+        Scrape a known page set, on this session or shared out round-robin
+        over `workers` fresh sessions. Returns (records, failed page indexes).
+        """
+        progress = _CrawlProgress(len(planned), max_results)
+        workers = max(min(workers, len(planned)), 1)
+        if workers == 1:
+            results = self._scrape_pages(planned, attempts=4, progress=progress)
+        else:
+            results = {}
+            shares = [planned[i::workers] for i in range(workers)]
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        self._worker_session, share, 4, country, state, progress
+                    )
+                    for share in shares
+                ]
+                for future in futures:
+                    worker_metrics, worker_results = future.result()
+                    self.metrics.merge(worker_metrics)
+                    results.update(worker_results)
+
+        all_records = []
+        for page_index in sorted(results):
+            all_records.extend(results[page_index])
+        failed_pages = [i for i in sorted(results) if not results[i]]
+        return all_records, failed_pages
+
+    def _scrape_pages(
+        self,
+        page_indexes: List[int],
+        attempts: int,
+        progress: Optional["_CrawlProgress"] = None,
+    ) -> Dict[int, List[Dict]]:
+        """Scrape page indexes in order on this session; {page_index: cards}"""
+        results = {}
+        for n, page_index in enumerate(page_indexes):
+            if progress and progress.done_enough():
+                break
+            if n and n % RESTART_EVERY == 0 and not self._restart_driver():
+                # No browser for the rest: report the pages as empty so the
+                # second pass picks them up
+                results.update((skipped, []) for skipped in page_indexes[n:])
+                break
+            self.metrics.begin_page(page_index)
+            results[page_index] = self.get_cards_with_retry(
+                page_index, attempts=attempts
+            )
+            self.metrics.end_page()
+            if progress:
+                progress.page_done(page_index, len(results[page_index]))
+        return results
+
+    def _restart_driver(self) -> bool:
+        """Fresh browser to avoid long-session instability"""
+        try:
+            self.close()
+        except Exception:
+            pass
+        print("\n  ↻ Restarting browser to avoid session issues...\n")
+        self.metrics.count("driver_restarts")
+        if not self.setup_driver():
+            print("  ✗ Failed to restart driver")
+            return False
+        return True
+
+    def retry_failed_pages(
+        self,
+        page_indexes: List[int],
+        workers: int = 3,
+        attempts: int = 3,
+        country: str = None,
+        state: str = None,
+    ) -> Dict[int, List[Dict]]:
+        """
+        Second pass: re-scrape pages that came back empty, spread over
+        `workers` fresh browser sessions. Returns {page_index: cards} for the
+        pages that recovered and fills self.retry_report.
+        """
+        workers = min(workers, len(page_indexes))
+        shares = [page_indexes[i::workers] for i in range(workers)]
         print(
-            f"Scraping completed: {len(all_records)} total records from {page_num} pages"
+            f"\n🔁 Second pass: retrying {len(page_indexes)} empty page(s) "
+            f"with {workers} fresh session(s)"
         )
-        print(f"{'=' * 70}\n")
-        return all_records
+
+        recovered = {}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self._worker_session, share, attempts, country, state)
+                for share in shares
+            ]
+            for future in futures:
+                worker_metrics, results = future.result()
+                self.metrics.merge(worker_metrics, count_pages=False, retry_pass=True)
+                recovered.update({i: cards for i, cards in results.items() if cards})
+
+        # The walk may confirm empty runs before the final pass; keep both
+        report = self.retry_report
+        report["queued"] = sorted(set(report["queued"]) | set(page_indexes))
+        report["recovered"] = sorted(set(report["recovered"]) | set(recovered))
+        report["still_failed"] = sorted(
+            set(report["queued"]) - set(report["recovered"])
+        )
+        print(
+            f"  ✓ Recovered {len(recovered)} page(s), "
+            f"{sum(len(c) for c in recovered.values())} records; "
+            f"still empty: {sorted(set(page_indexes) - set(recovered)) or 'none'}"
+        )
+        return recovered
+
+    def _worker_session(
+        self,
+        page_indexes: List[int],
+        attempts: int,
+        country: str,
+        state: str,
+        progress: Optional["_CrawlProgress"] = None,
+    ):
+        """One extra browser session; returns (its metrics, {page_index: cards})"""
+        worker = DHSWoWScraper(
+            headless=self.headless,
+            delay=self.delay,
+            metrics=ScrapeMetrics(out_dir=None),
+            base_url=self.base_url,
+            rate=self.rate,
+            lean=self.lean,
+            transfer_stats=self.transfer_stats,
+        )
+        results = {}
+        if not worker.setup_driver():
+            return worker.metrics, results
+        try:
+            if country or state:
+                worker.load_page_number(0)
+                worker.apply_filters(country=country, state=state)
+            results = worker._scrape_pages(page_indexes, attempts, progress)
+        finally:
+            worker.close()
+        return worker.metrics, results
 
     def close(self):
         """Close the browser"""
@@ -543,20 +1280,275 @@ class DHSWoWScraper:
             self.driver.quit()
 
 
+# -----------------------------------------------------------------------------
+# Query subcommands (no browser)
+# -----------------------------------------------------------------------------
+
+QUERY_COMMANDS = ("stats", "search-name", "search-dates", "export", "verify")
+
+
+def _print_statistics(db_stats: Dict):
+    print(f"\n{'=' * 70}")
+    print("DATABASE STATISTICS")
+    print(f"{'=' * 70}")
+    print(f"Total records: {db_stats['total_records']}")
+    print(f"Active records: {db_stats['active_records']}")
+    print(f"Removed records: {db_stats['removed_records']}")
+    print(f"Total scrapes: {db_stats['total_scrapes']}")
+
+    print(f"\nTop 5 Countries:")
+    for country, count in db_stats["top_countries"][:5]:
+        print(f"   {country}: {count}")
+
+    print(f"\nTop 5 States:")
+    for state, count in db_stats["top_states"][:5]:
+        print(f"   {state}: {count}")
+
+
+def _print_matches(records, limit: int, as_json: bool) -> int:
+    """Print up to limit records (0 = all); returns how many matched in total"""
+    matched = 0
+    for record in records:
+        matched += 1
+        if limit and matched > limit:
+            continue
+        if as_json:
+            print(json.dumps(record, ensure_ascii=False))
+        else:
+            print(
+                f"{record['name']} | {record.get('country', '')} | "
+                f"{record['status']} | first seen {record['first_seen_date']}"
+            )
+    return matched
+
+
+def query_main(argv: List[str]) -> int:
+    """
+    stats / search-name / search-dates / export / verify against a database
+    file. These stream the file through record_stream.DatabaseReader and
+    never touch Selenium, so they start fast and run in constant memory.
+    """
+    import argparse
+
+    from export_engine import (
+        CHUNK_ROWS,
+        COLUMNS,
+        FORMATS,
+        export_to_file,
+        filter_records,
+        format_for_path,
+    )
+    from record_stream import DatabaseReader
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--db",
+        type=str,
+        default="data/historical_arrests.json",
+        help="Database file (.json or .ndjson)",
+    )
+    listing = argparse.ArgumentParser(add_help=False)
+    listing.add_argument(
+        "--limit", type=int, default=50, help="Records to print (0 = all)"
+    )
+    listing.add_argument("--json", action="store_true", help="Print JSON lines")
+
+    parser = argparse.ArgumentParser(
+        prog="dhs_tracker.py", description="Query the tracker database"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+    stats = sub.add_parser("stats", parents=[common], help="Counts and top values")
+    stats.add_argument("--json", action="store_true", help="Print as JSON")
+    name = sub.add_parser(
+        "search-name", parents=[common, listing], help="Names containing a string"
+    )
+    name.add_argument("query")
+    dates = sub.add_parser(
+        "search-dates",
+        parents=[common, listing],
+        help="Records first seen between two dates",
+    )
+    dates.add_argument("start", help="YYYY-MM-DD")
+    dates.add_argument("end", help="YYYY-MM-DD")
+    export = sub.add_parser(
+        "export", parents=[common], help="Write records as CSV, NDJSON or Parquet"
+    )
+    export.add_argument(
+        "output",
+        nargs="?",
+        help="Output file; its suffix picks the format (default data/export_<time>)",
+    )
+    export.add_argument("--format", choices=list(FORMATS), default=None)
+    export.add_argument(
+        "--columns",
+        type=str,
+        default=None,
+        help="Comma-separated columns: " + ", ".join(COLUMNS),
+    )
+    export.add_argument("--status", choices=["active", "removed", "all"], default="all")
+    export.add_argument(
+        "--from", dest="date_from", help="First seen on/after (YYYY-MM-DD)"
+    )
+    export.add_argument(
+        "--to", dest="date_to", help="First seen on/before (YYYY-MM-DD)"
+    )
+    export.add_argument("--country", type=str, default=None)
+    export.add_argument("--state", type=str, default=None, help="e.g. Texas")
+    export.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    sub.add_parser("verify", parents=[common], help="Check the database's consistency")
+    args = parser.parse_args(argv)
+
+    try:
+        reader = DatabaseReader(args.db)
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return 1
+
+    if args.command == "stats":
+        db_stats = reader.get_statistics()
+        if args.json:
+            print(json.dumps(db_stats, ensure_ascii=False, indent=2))
+        else:
+            _print_statistics(db_stats)
+            print(f"Last updated: {db_stats['last_updated']}")
+        return 0
+
+    if args.command in ("search-name", "search-dates"):
+        if args.command == "search-name":
+            matches = reader.search_by_name(args.query)
+        else:
+            matches = reader.search_by_date_range(args.start, args.end)
+        matched = _print_matches(matches, args.limit, args.json)
+        if not args.json:
+            shown = min(matched, args.limit) if args.limit else matched
+            print(
+                f"\n{matched} match(es)"
+                + (f", {shown} shown" if shown < matched else "")
+            )
+        return 0
+
+    if args.command == "export":
+        fmt = args.format or (format_for_path(args.output) if args.output else "csv")
+        output = args.output or (
+            f"data/export_{datetime.now().strftime('%Y%m%d_%H%M%S')}" + FORMATS[fmt][1]
+        )
+        columns = args.columns.split(",") if args.columns else None
+        matches = filter_records(
+            reader.iter_records(),
+            status=args.status,
+            first_seen_from=args.date_from,
+            first_seen_to=args.date_to,
+            country=args.country,
+            state=args.state,
+        )
+        try:
+            rows = export_to_file(matches, output, fmt, columns, args.chunk_rows)
+        except (ValueError, ImportError) as e:
+            print(f"❌ {e}")
+            return 1
+        print(f"✓ Exported {rows:,} records to: {output}")
+        return 0
+
+    report = reader.verify()
+    problems = report["problems"]
+    print(f"{args.db}: {report['records']:,} records ({report['active']:,} active)")
+    if not problems:
+        print("✓ No problems found")
+        return 0
+    print(f"✗ {len(problems)} problem(s):")
+    for line in problems[:20]:
+        print(f"   • {line}")
+    if len(problems) > 20:
+        print(f"   ... and {len(problems) - 20} more")
+    return 1
+
+
 def main():
     """Main scraping function with database tracking"""
+    if len(sys.argv) > 1 and sys.argv[1] in QUERY_COMMANDS:
+        sys.exit(query_main(sys.argv[1:]))
+
     import argparse
 
     parser = argparse.ArgumentParser(
-        description="Scrape DHS Worst of the Worst with historical tracking"
+        description="Scrape DHS Worst of the Worst with historical tracking",
+        epilog="Query commands (no browser): "
+        + ", ".join(QUERY_COMMANDS)
+        + ". See `dhs_tracker.py <command> --help`.",
     )
     parser.add_argument("--country", type=str, help="Filter by country")
     parser.add_argument("--state", type=str, help="Filter by state")
     parser.add_argument("--max-pages", type=int, default=50, help="Max pages")
     parser.add_argument("--max-results", type=int, help="Max total results")
-    parser.add_argument("--delay", type=float, default=2.0, help="Delay in seconds")
+    parser.add_argument(
+        "--delay", type=float, default=2.0, help="Starting delay in seconds"
+    )
+    parser.add_argument(
+        "--min-delay",
+        type=float,
+        default=0.5,
+        help="Fastest pacing the adaptive controller may reach",
+    )
+    parser.add_argument(
+        "--max-delay", type=float, default=30.0, help="Longest backoff in seconds"
+    )
+    parser.add_argument(
+        "--fixed-delay",
+        action="store_true",
+        help="Disable adaptive pacing and use the old fixed sleeps",
+    )
     parser.add_argument("--visible", action="store_true", help="Show browser")
+    parser.add_argument(
+        "--lean",
+        action="store_true",
+        help="Eager page loads; skip images, fonts, media and analytics",
+    )
+    parser.add_argument(
+        "--transfer-stats",
+        action="store_true",
+        help="Record bytes and requests per page (Chrome performance log)",
+    )
+    parser.add_argument(
+        "--base-url",
+        type=str,
+        default="https://www.dhs.gov/wow",
+        help="Listing URL (e.g. a local wow_fixtures.py replay server)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Browser sessions sharing the planned page set",
+    )
+    parser.add_argument(
+        "--retry-workers",
+        type=int,
+        default=3,
+        help="Browser sessions for the second pass over empty pages (0 = off)",
+    )
     parser.add_argument("--export-csv", action="store_true", help="Export to CSV")
+    parser.add_argument(
+        "--db",
+        type=str,
+        default="data/historical_arrests.json",
+        help="Database file (.ndjson for the line-per-record layout)",
+    )
+    parser.add_argument(
+        "--metrics-dir",
+        type=str,
+        default="logs",
+        help="Directory for per-page JSON lines and the run summary",
+    )
+    parser.add_argument(
+        "--prometheus",
+        type=str,
+        help="Also write the run summary in Prometheus text format to this file",
+    )
+    parser.add_argument(
+        "--cache-images",
+        action="store_true",
+        help="Download new mugshots once and store local thumbnails",
+    )
     parser.add_argument(
         "--min-expected-records",
         type=int,
@@ -571,6 +1563,8 @@ def main():
     print("=" * 70)
     print(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"Mode: {'Visible' if args.visible else 'Headless'}")
+    print(f"Browsing: {'Lean' if args.lean else 'Full page loads'}")
+    print(f"Source: {args.base_url}")
     if args.country:
         print(f"Filter: Country = {args.country}")
     if args.state:
@@ -578,7 +1572,22 @@ def main():
     print("=" * 70 + "\n")
 
     # Initialize scraper
-    scraper = DHSWoWScraper(headless=not args.visible, delay=args.delay)
+    metrics = ScrapeMetrics(out_dir=args.metrics_dir, prometheus_path=args.prometheus)
+    rate = AdaptiveRateController(
+        initial_delay=args.delay,
+        min_delay=args.min_delay,
+        max_delay=args.max_delay,
+        adaptive=not args.fixed_delay,
+    )
+    scraper = DHSWoWScraper(
+        headless=not args.visible,
+        delay=args.delay,
+        metrics=metrics,
+        base_url=args.base_url,
+        rate=rate,
+        lean=args.lean,
+        transfer_stats=args.transfer_stats,
+    )
 
     if not scraper.setup_driver():
         return
@@ -591,16 +1600,52 @@ def main():
             state=args.state,
             max_pages=args.max_pages,
             max_results=args.max_results,
+            retry_workers=args.retry_workers,
+            workers=args.workers,
+        )
+
+        rate_summary = rate.summary()
+        run_summary = metrics.finish(
+            records=len(records),
+            rate_control=rate_summary,
+            retry_pass=scraper.retry_report,
+            crawl_plan=scraper.crawl_plan,
         )
 
         print(f"\n{'=' * 70}")
         print(f"SCRAPING COMPLETE: {len(records)} records")
+        print(
+            f"{run_summary['pages_per_minute']} pages/min • "
+            f"{run_summary['retries']} retries • "
+            f"fetch {run_summary['fetch_s']}s / wait {run_summary['wait_s']}s"
+        )
+        if args.transfer_stats:
+            print(
+                f"Transfer: {run_summary['transfer_mb']} MB "
+                f"({run_summary['transfer_kb_per_page']} KB/page, "
+                f"{run_summary['resource_requests']} requests, "
+                f"{run_summary['blocked_requests']} blocked)"
+            )
+        print(
+            f"Pacing: {rate_summary['effective_pages_per_minute']} requests/min "
+            f"effective across all sessions (cap "
+            f"{rate_summary['target_pages_per_minute']}), "
+            f"delay now {rate_summary['current_delay_s']}s, "
+            f"{rate_summary['backoff_s']}s spent backing off"
+        )
+        if scraper.retry_report["queued"]:
+            print(
+                f"Second pass: {len(scraper.retry_report['recovered'])}/"
+                f"{len(scraper.retry_report['queued'])} empty pages recovered"
+            )
+        if args.metrics_dir:
+            print(f"Metrics: {metrics.summary_path}")
         print(f"{'=' * 70}\n")
 
         if records:
             # Update database
             print("Updating historical database...")
-            db = DHSDatabase()
+            db = DHSDatabase(args.db)
             stats = db.update_records(
                 records, min_expected_records=args.min_expected_records
             )
@@ -611,6 +1656,7 @@ def main():
             print(f"New people added: {len(stats['new_people'])}")
             print(f"Updated records: {len(stats['updated_people'])}")
             print(f"Still present: {stats['still_present']}")
+            print(f"Removed: {len(stats['removed_people'])}")
             print(f"Total in scrape: {stats['total_in_scrape']}")
 
             if stats["new_people"]:
@@ -621,48 +1667,23 @@ def main():
                     print(f"   ... and {len(stats['new_people']) - 10} more")
 
             # Get overall statistics
-            db_stats = db.get_statistics()
-            print(f"\n{'=' * 70}")
-            print("DATABASE STATISTICS")
-            print(f"{'=' * 70}")
-            print(f"Total records: {db_stats['total_records']}")
-            print(f"Active records: {db_stats['active_records']}")
-            print(f"Removed records: {db_stats['removed_records']}")
-            print(f"Total scrapes: {db_stats['total_scrapes']}")
+            _print_statistics(db.get_statistics())
 
-            print(f"\nTop 5 Countries:")
-            for country, count in db_stats["top_countries"][:5]:
-                print(f"   {country}: {count}")
+            # Cache mugshot thumbnails if requested
+            if args.cache_images:
+                from image_cache import ImageCache
 
-            print(f"\nTop 5 States:")
-            for state, count in db_stats["top_states"][:5]:
-                print(f"   {state}: {count}")
+                print("\nCaching mugshot thumbnails...")
+                ImageCache().cache_records(db.data["records"].values())
 
             # Export CSV if requested
             if args.export_csv:
-                import csv
+                from export_engine import export_to_file
 
                 csv_file = f"data/export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
                 Path(csv_file).parent.mkdir(parents=True, exist_ok=True)
 
-                with open(csv_file, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(
-                        f,
-                        fieldnames=[
-                            "name",
-                            "country",
-                            "convicted_of",
-                            "arrested_location",
-                            "first_seen_date",
-                            "last_seen_date",
-                            "status",
-                        ],
-                    )
-                    writer.writeheader()
-                    for record in db.data["records"].values():
-                        writer.writerow(
-                            {k: record.get(k, "") for k in writer.fieldnames}
-                        )
+                export_to_file(db.data["records"].values(), csv_file, "csv")
 
                 print(f"\n✓ Exported to: {csv_file}")
         else:
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Export Engine
+Streams records out as CSV, NDJSON or Parquet in fixed-size chunks, with
+status / first-seen date / country / state filters and column selection.
+Used by `dhs_tracker.py export`, the tracker's --export-csv and the
+dashboard's download button.
+"""
+
+import csv
+import io
+import json
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from dhs_common import extract_state_from_location
+
+# Format -> (MIME type, file suffix). Parquet needs pyarrow.
+FORMATS = {
+    "csv": ("text/csv", ".csv"),
+    "ndjson": ("application/x-ndjson", ".ndjson"),
+    "parquet": ("application/vnd.apache.parquet", ".parquet"),
+}
+
+# Exportable columns; "state" is derived from arrested_location
+COLUMNS = (
+    "name",
+    "country",
+    "convicted_of",
+    "arrested_location",
+    "state",
+    "image_url",
+    "press_release_url",
+    "status",
+    "first_seen_date",
+    "last_seen_date",
+    "removed_date",
+    "scrape_count",
+)
+DEFAULT_COLUMNS = (
+    "name",
+    "country",
+    "convicted_of",
+    "arrested_location",
+    "first_seen_date",
+    "last_seen_date",
+    "status",
+)
+INT_COLUMNS = ("scrape_count",)
+CHUNK_ROWS = 5000
+
+
+def available_formats() -> List[str]:
+    """Formats that can be written with the installed packages"""
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return ["csv", "ndjson"]
+    return list(FORMATS)
+
+
+def format_for_path(path) -> str:
+    """Export format implied by a file suffix (csv when unknown)"""
+    suffix = Path(path).suffix.lower()
+    for fmt, (_, fmt_suffix) in FORMATS.items():
+        if suffix == fmt_suffix:
+            return fmt
+    return "csv"
+
+
+def filter_records(
+    records: Iterable[Mapping],
+    status: str = "all",
+    first_seen_from: Optional[str] = None,
+    first_seen_to: Optional[str] = None,
+    country: Optional[str] = None,
+    state: Optional[str] = None,
+    state_of: Optional[Mapping] = None,
+) -> Iterator[Mapping]:
+    """
+    Lazily keep the records matching every given filter. Dates are
+    YYYY-MM-DD and inclusive; country is case-insensitive. state_of is an
+    optional prebuilt {name: state} index (SharedDataset.state_of, the
+    snapshot's state column) used instead of parsing each location.
+    """
+    country = country.upper() if country else None
+    for r in records:
+        if status != "all" and r.get("status") != status:
+            continue
+        first_seen = r.get("first_seen_date") or ""
+        if first_seen_from and first_seen < first_seen_from:
+            continue
+        if first_seen_to and first_seen > first_seen_to:
+            continue
+        if country and (r.get("country") or "").upper() != country:
+            continue
+        if state and _state(r, state_of) != state:
+            continue
+        yield r
+
+
+def _state(record: Mapping, state_of: Optional[Mapping]) -> Optional[str]:
+    if state_of is not None and record.get("name") in state_of:
+        return state_of[record["name"]]
+    return extract_state_from_location(record.get("arrested_location"))
+
+
+def _chunks(
+    records: Iterable[Mapping],
+    columns: List[str],
+    chunk_rows: int,
+    state_of: Optional[Mapping],
+) -> Iterator[List[Dict]]:
+    """Rows projected onto columns, chunk_rows at a time"""
+    derive_state = "state" in columns
+    chunk = []
+    for r in records:
+        row = {c: r.get(c) for c in columns}
+        if derive_state:
+            row["state"] = _state(r, state_of)
+        chunk.append(row)
+        if len(chunk) >= chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _check_format(fmt: str):
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format {fmt!r} (choose from {', '.join(FORMATS)})")
+    if fmt not in available_formats():
+        raise ImportError(f"{fmt} export needs pyarrow (pip install pyarrow)")
+
+
+def _check_columns(columns: Optional[Iterable[str]]) -> List[str]:
+    columns = list(columns or DEFAULT_COLUMNS)
+    unknown = [c for c in columns if c not in COLUMNS]
+    if unknown:
+        raise ValueError(
+            f"Unknown column(s): {', '.join(unknown)} (choose from {', '.join(COLUMNS)})"
+        )
+    return columns
+
+
+def write_export(
+    records: Iterable[Mapping],
+    out: BinaryIO,
+    fmt: str = "csv",
+    columns: Optional[Iterable[str]] = None,
+    chunk_rows: int = CHUNK_ROWS,
+    state_of: Optional[Mapping] = None,
+) -> int:
+    """
+    Write records to a binary file object, one chunk of rows at a time, and
+    return the row count. Only the current chunk is held in memory; Parquet
+    gets one row group per chunk.
+    """
+    _check_format(fmt)
+    columns = _check_columns(columns)
+    chunks = _chunks(records, columns, chunk_rows, state_of)
+    rows = 0
+
+    if fmt == "parquet":
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = pa.schema(
+            [
+                pa.field(c, pa.int64() if c in INT_COLUMNS else pa.string())
+                for c in columns
+            ]
+        )
+        with pq.ParquetWriter(out, schema) as writer:
+            for chunk in chunks:
+                writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+                rows += len(chunk)
+        return rows
+
+    if fmt == "csv":
+        header = io.StringIO()
+        csv.writer(header).writerow(columns)
+        out.write(header.getvalue().encode("utf-8"))
+    for chunk in chunks:
+        buf = io.StringIO()
+        if fmt == "csv":
+            writer = csv.DictWriter(buf, fieldnames=columns)
+            writer.writerows(
+                {c: "" if v is None else v for c, v in row.items()} for row in chunk
+            )
+        else:
+            for row in chunk:
+                buf.write(json.dumps(row, ensure_ascii=False))
+                buf.write("\n")
+        out.write(buf.getvalue().encode("utf-8"))
+        rows += len(chunk)
+    return rows
+
+
+def export_to_file(
+    records: Iterable[Mapping],
+    path,
+    fmt: Optional[str] = None,
+    columns: Optional[Iterable[str]] = None,
+    chunk_rows: int = CHUNK_ROWS,
+    state_of: Optional[Mapping] = None,
+) -> int:
+    """Write an export file (format from the suffix unless given); returns rows"""
+    path = Path(path)
+    fmt = fmt or format_for_path(path)
+    # Fail before creating the file
+    _check_format(fmt)
+    _check_columns(columns)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as out:
+        return write_export(records, out, fmt, columns, chunk_rows, state_of)
+
+
+def export_bytes(
+    records: Iterable[Mapping],
+    fmt: str = "csv",
+    columns: Optional[Iterable[str]] = None,
+    state_of: Optional[Mapping] = None,
+) -> bytes:
+    """The whole export as bytes (for download responses)"""
+    out = io.BytesIO()
+    write_export(records, out, fmt, columns, state_of=state_of)
+    return out.getvalue()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Mugshot Image Cache
+Downloads each image_url once and stores small thumbnails for the dashboard
+"""
+
+import hashlib
+import json
+import os
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+
+class ImageCache:
+    """Content-addressed thumbnail cache keyed by image_url"""
+
+    def __init__(
+        self,
+        index_path: str = "data/image_cache.json",
+        thumb_dir: str = "static/thumbs",
+        thumb_size: Tuple[int, int] = (80, 80),
+        workers: int = 8,
+        timeout: float = 15.0,
+    ):
+        self.index_path = Path(index_path)
+        self.thumb_dir = Path(thumb_dir)
+        self.thumb_size = thumb_size
+        self.workers = workers
+        self.timeout = timeout
+        self.index = self._load_index()
+
+    def _load_index(self) -> Dict[str, str]:
+        """Load the url -> content hash index"""
+        if self.index_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        return {}
+
+    def _save_index(self):
+        """Save the index to disk"""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+
+    def thumb_path(self, digest: str) -> Path:
+        """Thumbnail file for a content hash"""
+        return self.thumb_dir / f"{digest}.jpg"
+
+    def _fetch(self, url: str) -> bytes:
+        """Download an image"""
+        request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return response.read()
+
+    def _make_thumbnail(self, content: bytes, target: Path):
+        """Write a small JPEG thumbnail atomically"""
+        from PIL import Image
+
+        with Image.open(BytesIO(content)) as img:
+            img = img.convert("RGB")
+            img.thumbnail(self.thumb_size)
+            tmp = target.with_suffix(f".{os.getpid()}.{id(content)}.tmp")
+            img.save(tmp, "JPEG", quality=80, optimize=True)
+        os.replace(tmp, target)
+
+    def _process(self, url: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """Fetch one URL and make its thumbnail; returns (url, digest, error)"""
+        try:
+            content = self._fetch(url)
+            digest = hashlib.sha256(content).hexdigest()
+            target = self.thumb_path(digest)
+            if not target.exists():  # identical photo under another URL
+                self._make_thumbnail(content, target)
+            return url, digest, None
+        except Exception as e:
+            return url, None, str(e)
+
+    def cache_records(self, records: Iterable[Dict]) -> Dict:
+        """
+        Cache thumbnails for every record image not yet in the index.
+        Downloads run on a bounded thread pool.
+        """
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            print("  ⚠️  Pillow not installed, skipping image cache")
+            return {"cached": 0, "skipped": 0, "failed": 0}
+
+        urls = {r["image_url"] for r in records if r.get("image_url")}
+        pending = sorted(u for u in urls if u not in self.index)
+        stats = {"cached": 0, "skipped": len(urls) - len(pending), "failed": 0}
+        if not pending:
+            return stats
+
+        self.thumb_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for url, digest, error in pool.map(self._process, pending):
+                if digest:
+                    self.index[url] = digest
+                    stats["cached"] += 1
+                else:
+                    stats["failed"] += 1
+                    print(f"  ⚠️  Image failed: {url} ({error})")
+
+        self._save_index()
+        print(
+            f"  🖼️  Images: {stats['cached']} cached, {stats['skipped']} already "
+            f"cached, {stats['failed']} failed"
+        )
+        return stats
+
+
+def main():
+    """Cache thumbnails for every record in the database"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Cache mugshot thumbnails")
+    parser.add_argument(
+        "--db", type=str, default="data/historical_arrests.json", help="Database"
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Parallel downloads")
+    args = parser.parse_args()
+
+    with open(args.db, "r", encoding="utf-8") as f:
+        records = json.load(f)["records"].values()
+    ImageCache(workers=args.workers).cache_records(records)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Canonical NDJSON Storage
+historical_arrests as one line per record, sorted by name with a fixed
+field order, so a daily commit only touches the lines that changed
+
+Usage examples:
+  python ndjson_store.py convert data/historical_arrests.json data/historical_arrests.ndjson
+  python ndjson_store.py verify data/historical_arrests.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+FORMAT = "dhs-ndjson/1"
+
+# Record fields in the order they are written; anything else follows, sorted
+FIELD_ORDER = (
+    "name",
+    "country",
+    "convicted_of",
+    "arrested_location",
+    "image_url",
+    "press_release_url",
+    "status",
+    "first_seen_date",
+    "last_seen_date",
+    "removed_date",
+    "scrape_count",
+    "active_periods",
+)
+
+# Reserved line keys (records never use a leading underscore)
+SEEN = "_seen"  # scrape_count - total_scrapes, for records seen in the last run
+HISTORY = "_history"
+KEY = "_key"  # records key, only written when it differs from record["name"]
+
+
+def is_ndjson(path) -> bool:
+    """Storage format is chosen by file suffix"""
+    return Path(path).suffix == ".ndjson"
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _run_markers(metadata: Dict) -> Tuple:
+    """(date of the last run, total_scrapes) used to fold per-run counters"""
+    last_updated = metadata.get("last_updated")
+    total = metadata.get("total_scrapes")
+    run_date = last_updated[:10] if isinstance(last_updated, str) else None
+    return run_date, total if isinstance(total, int) else None
+
+
+def record_line(key: str, record: Dict, history, run_date, total) -> str:
+    """
+    One canonical line. last_seen_date and scrape_count move on every run
+    for every listed record, so for records seen in the last run they are
+    folded into a single offset that stays the same from run to run.
+    """
+    line = {}
+    if key != record.get("name"):
+        line[KEY] = key
+    fields = [k for k in FIELD_ORDER if k in record]
+    fields += sorted(k for k in record if k not in FIELD_ORDER)
+    fold = (
+        run_date is not None
+        and total is not None
+        and record.get("last_seen_date") == run_date
+        and type(record.get("scrape_count")) is int
+    )
+    for field in fields:
+        if fold and field in ("last_seen_date", "scrape_count"):
+            continue
+        line[field] = record[field]
+    if fold:
+        line[SEEN] = record["scrape_count"] - total
+    if history:
+        line[HISTORY] = history
+    return _dumps(line)
+
+
+def parse_record_line(line: Dict, run_date, total) -> Tuple[str, Dict, list]:
+    """(records key, record, history) from one decoded line"""
+    history = line.pop(HISTORY, None)
+    key = line.pop(KEY, None)
+    seen = line.pop(SEEN, None)
+    if seen is not None:
+        line["last_seen_date"] = run_date
+        line["scrape_count"] = total + seen
+    return key if key is not None else line.get("name"), line, history
+
+
+def dump_ndjson(data: Dict, path) -> Path:
+    """
+    Write data (the historical_arrests.json structure) as canonical NDJSON.
+    Line 1 holds the metadata (and any other top-level keys); each further
+    line is one record with its change history. Written to a temp file and
+    renamed into place.
+    """
+    path = Path(path)
+    records = data.get("records", {})
+    history = data.get("history", {})
+    header = {"_format": FORMAT}
+    header.update((k, data[k]) for k in sorted(data) if k not in ("records", "history"))
+    run_date, total = _run_markers(data.get("metadata") or {})
+
+    fd, tmp_name = tempfile.mkstemp(prefix=path.name + ".", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(_dumps(header) + "\n")
+            for key in sorted(records):
+                f.write(
+                    record_line(key, records[key], history.get(key), run_date, total)
+                )
+                f.write("\n")
+            # History of names without a record (not expected, kept for fidelity)
+            for key in sorted(history.keys() - records.keys()):
+                f.write(_dumps({KEY: key, HISTORY: history[key]}) + "\n")
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return path
+
+
+def read_header(path) -> Dict:
+    """The first line: metadata and other top-level keys"""
+    with open(path, "r", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+    if header.pop("_format", None) != FORMAT:
+        raise ValueError(f"{path} is not a {FORMAT} file")
+    return header
+
+
+def iter_ndjson(path) -> Iterator[Tuple[str, Dict, list]]:
+    """
+    Stream (key, record, history) one line at a time; memory stays at one
+    record. History-only lines come back with record None.
+    """
+    header = read_header(path)
+    run_date, total = _run_markers(header.get("metadata") or {})
+    with open(path, "r", encoding="utf-8") as f:
+        f.readline()
+        for raw in f:
+            if not raw.strip():
+                continue
+            line = json.loads(raw)
+            if set(line) == {KEY, HISTORY}:
+                yield line[KEY], None, line[HISTORY]
+                continue
+            yield parse_record_line(line, run_date, total)
+
+
+def load_ndjson(path) -> Dict:
+    """Read a canonical NDJSON file back into the historical_arrests.json structure"""
+    data = read_header(path)
+    records, history = {}, {}
+    for key, record, record_history in iter_ndjson(path):
+        if record is not None:
+            records[key] = record
+        if record_history:
+            history[key] = record_history
+    data["records"] = records
+    data["history"] = history
+    return data
+
+
+def load_any(path) -> Dict:
+    """Load a database file in either storage format"""
+    if is_ndjson(path):
+        return load_ndjson(path)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    """Convert between the JSON and NDJSON layouts, or check a round trip"""
+    parser = argparse.ArgumentParser(description="Canonical NDJSON database files")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    convert = sub.add_parser("convert", help="Rewrite a database in another format")
+    convert.add_argument("source", help="historical_arrests .json or .ndjson")
+    convert.add_argument("target", help="Output path; suffix picks the format")
+
+    verify = sub.add_parser("verify", help="Check that a file survives a round trip")
+    verify.add_argument("source")
+    args = parser.parse_args()
+
+    data = load_any(args.source)
+    if args.command == "convert":
+        target = Path(args.target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if is_ndjson(target):
+            dump_ndjson(data, target)
+        else:
+            with open(target, "w", encoding="utf-8") as f:
+                json.dump(data, indent=2, fp=f, ensure_ascii=False)
+        print(f"✅ Wrote {len(data.get('records', {})):,} records to {target}")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        copy = Path(tmp) / "roundtrip.ndjson"
+        dump_ndjson(data, copy)
+        restored = load_ndjson(copy)
+    restored.setdefault("history", {})
+    expected = dict(data, history=data.get("history", {}))
+    if restored == expected:
+        print(f"✓ {args.source}: {len(data.get('records', {})):,} records round-trip")
+    else:
+        print(f"✗ {args.source}: NDJSON round trip differs")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Query API
+Read-only JSON over HTTP on top of DHSDatabase, so consumers can fetch the
+rows and aggregates they need instead of loading the whole database file
+
+Usage examples:
+  python query_api.py
+  curl 'http://127.0.0.1:8766/api/records?country=MEXICO&state=Texas&limit=20'
+  curl 'http://127.0.0.1:8766/api/records?cursor=<next_cursor>'
+  curl 'http://127.0.0.1:8766/api/search/name?q=garcia'
+  curl 'http://127.0.0.1:8766/api/search/dates?start=2026-03-01&end=2026-05-31'
+  curl 'http://127.0.0.1:8766/api/records/JOSE%20GARCIA%20LOPEZ'
+  curl 'http://127.0.0.1:8766/api/stats'
+  curl 'http://127.0.0.1:8766/api/changes?since=120'
+"""
+
+import argparse
+import base64
+import binascii
+import hashlib
+import json
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlparse
+
+from change_feed import read_changes, read_index
+from dhs_common import classify_crime, extract_state_from_location
+from dhs_tracker import DHSDatabase
+
+DEFAULT_DB_PATH = "data/historical_arrests.json"
+DEFAULT_PORT = 8766
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+CACHE_ENTRIES = 512
+
+RECORD_PATH = re.compile(r"^/api/records/(.+)$")
+
+
+class QueryError(Exception):
+    """A request that can't be answered; carries the HTTP status"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def encode_cursor(name: str) -> str:
+    """Opaque page cursor: the last name on the previous page"""
+    return base64.urlsafe_b64encode(name.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Name a cursor points after (400 if it was tampered with)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.b64decode(padded.encode("ascii"), altchars=b"-_", validate=True)
+        return raw.decode("utf-8")
+    except (binascii.Error, UnicodeError, ValueError):
+        raise QueryError(400, "Invalid cursor")
+
+
+def _param(query: Dict[str, List[str]], key: str, default=None) -> Optional[str]:
+    values = query.get(key)
+    return values[0].strip() if values else default
+
+
+def _date_param(query: Dict[str, List[str]], key: str) -> Optional[str]:
+    value = _param(query, key)
+    if value:
+        try:
+            date.fromisoformat(value)
+        except ValueError:
+            raise QueryError(400, f"{key} must be YYYY-MM-DD")
+    return value or None
+
+
+class QueryService:
+    """
+    Answers API queries against one database file.
+
+    Results are sorted by name and paged with a keyset cursor, so a page
+    stays stable while earlier pages are fetched. Responses are cached by
+    (data version, path, query) and the same key gives the ETag, so a
+    client revalidating an unchanged query gets a 304 without any work.
+    The change feed's version also includes its latest run.
+    The database is reloaded when the file changes on disk.
+    """
+
+    def __init__(
+        self, db_path: str = DEFAULT_DB_PATH, cache_entries: int = CACHE_ENTRIES
+    ):
+        self.db_path = Path(db_path)
+        self.cache_entries = cache_entries
+        self.stats = {"requests": 0, "cache_hits": 0, "not_modified": 0, "reloads": 0}
+        self._lock = threading.Lock()
+        self._mtime_ns = None
+        self._db = None
+        self._names = []
+        self._state_of = {}
+        self.version = ""
+        self._responses = OrderedDict()
+        self._matches = OrderedDict()
+
+    # -- data version ---------------------------------------------------------
+
+    def _current(self) -> Tuple[DHSDatabase, str]:
+        """The loaded database and its version, reloading if the file changed"""
+        mtime_ns = self.db_path.stat().st_mtime_ns if self.db_path.exists() else 0
+        with self._lock:
+            if mtime_ns != self._mtime_ns:
+                db = DHSDatabase(str(self.db_path))
+                records = db.data["records"]
+                self._names = sorted(records)
+                self._state_of = {
+                    name: extract_state_from_location(r.get("arrested_location"))
+                    for name, r in records.items()
+                }
+                self._db = db
+                self._mtime_ns = mtime_ns
+                last_updated = db.data["metadata"].get("last_updated") or ""
+                self.version = f"{last_updated}@{mtime_ns}"
+                self._responses.clear()
+                self._matches.clear()
+                self.stats["reloads"] += 1
+            return self._db, self.version
+
+    # -- responses --------------------------------------------------------------
+
+    @staticmethod
+    def etag(version: str, path: str, query: Dict[str, List[str]]) -> str:
+        canonical = json.dumps([version, path, sorted(query.items())])
+        return '"' + hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:24] + '"'
+
+    def respond(
+        self, path: str, query: Dict[str, List[str]], if_none_match: str = None
+    ) -> Tuple[int, bytes, Optional[str]]:
+        """(status, JSON body, ETag) for one GET request"""
+        self.stats["requests"] += 1
+        try:
+            db, version = self._current()
+            cache_version = version
+            if path.rstrip("/") == "/api/changes":
+                # The tracker writes its changeset after saving the database,
+                # so the feed carries its own version
+                latest_run = read_index(db.changes_dir)["latest_run"]
+                cache_version = f"{version}#{latest_run}"
+            etag = self.etag(cache_version, path, query)
+            if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+                self.stats["not_modified"] += 1
+                return 304, b"", etag
+
+            key = (
+                cache_version,
+                path,
+                tuple(sorted((k, tuple(v)) for k, v in query.items())),
+            )
+            with self._lock:
+                body = self._responses.get(key)
+                if body is not None:
+                    self._responses.move_to_end(key)
+                    self.stats["cache_hits"] += 1
+                    return 200, body, etag
+
+            payload = self._route(db, version, path, query)
+            body = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+            body = body.encode("utf-8")
+            with self._lock:
+                self._responses[key] = body
+                if len(self._responses) > self.cache_entries:
+                    self._responses.popitem(last=False)
+            return 200, body, etag
+        except QueryError as e:
+            body = json.dumps({"error": str(e)}).encode("utf-8")
+            return e.status, body, None
+
+    def _route(self, db: DHSDatabase, version: str, path: str, query) -> Dict:
+        path = path.rstrip("/")
+        if path == "/api/records":
+            return self._list(db, version, query)
+        if path == "/api/stats":
+            return {"version": version, **db.get_statistics()}
+        if path == "/api/changes":
+            try:
+                since = int(_param(query, "since", 0))
+                max_runs = int(_param(query, "max_runs", 0)) or None
+            except ValueError:
+                raise QueryError(400, "since and max_runs must be integers")
+            changesets, cursor = read_changes(since, db.changes_dir, max_runs)
+            return {"version": version, "changes": changesets, "next_since": cursor}
+        if path == "/api/search/name":
+            q = _param(query, "q")
+            if not q:
+                raise QueryError(400, "q is required")
+            names = sorted(r["name"] for r in db.search_by_name(q))
+            return self._page(db, version, names, query)
+        if path == "/api/search/dates":
+            start, end = _date_param(query, "start"), _date_param(query, "end")
+            if not (start and end):
+                raise QueryError(400, "start and end are required")
+            names = sorted(r["name"] for r in db.search_by_date_range(start, end))
+            return self._page(db, version, names, query)
+
+        match = RECORD_PATH.match(path)
+        if match:
+            name = unquote(match.group(1))
+            record = db.data["records"].get(name)
+            if record is None:
+                raise QueryError(404, f"No record named {name!r}")
+            return {
+                "version": version,
+                "record": record,
+                "history": db.get_history(name),
+            }
+        raise QueryError(404, f"Unknown endpoint {path}")
+
+    # -- listing ----------------------------------------------------------------
+
+    def _list(self, db: DHSDatabase, version: str, query) -> Dict:
+        """Filtered listing: status, country, state, crime, q, first_seen_from/to"""
+        filters = (
+            (_param(query, "status", "active") or "active").lower(),
+            (_param(query, "country") or "").upper(),
+            _param(query, "state") or "",
+            _param(query, "crime") or "",
+            (_param(query, "q") or "").lower(),
+            _date_param(query, "first_seen_from") or "",
+            _date_param(query, "first_seen_to") or "9999-12-31",
+        )
+        if filters[0] not in ("active", "removed", "all"):
+            raise QueryError(400, "status must be active, removed or all")
+
+        key = (version, filters)
+        with self._lock:
+            names = self._matches.get(key)
+        if names is None:
+            names = self._filter(db, *filters)
+            with self._lock:
+                self._matches[key] = names
+                if len(self._matches) > self.cache_entries:
+                    self._matches.popitem(last=False)
+        return self._page(db, version, names, query)
+
+    def _filter(
+        self, db, status, country, state, crime, q, first_from, first_to
+    ) -> List[str]:
+        """Sorted names of the records matching every given filter"""
+        records = db.data["records"]
+        names = []
+        for name in self._names:
+            r = records[name]
+            if status != "all" and r.get("status") != status:
+                continue
+            if country and (r.get("country") or "").upper() != country:
+                continue
+            if state and self._state_of[name] != state:
+                continue
+            if crime and classify_crime(r.get("convicted_of")) != crime:
+                continue
+            if q and q not in name.lower():
+                continue
+            if not first_from <= (r.get("first_seen_date") or "") <= first_to:
+                continue
+            names.append(name)
+        return names
+
+    def _page(self, db: DHSDatabase, version: str, names: List[str], query) -> Dict:
+        """One page of a sorted name list, starting after the cursor"""
+        try:
+            limit = int(_param(query, "limit", DEFAULT_LIMIT))
+        except ValueError:
+            raise QueryError(400, "limit must be an integer")
+        limit = min(max(limit, 1), MAX_LIMIT)
+
+        cursor = _param(query, "cursor")
+        start = bisect_right(names, decode_cursor(cursor)) if cursor else 0
+        page = names[start : start + limit]
+        more = start + limit < len(names)
+        records = db.data["records"]
+        return {
+            "version": version,
+            "total": len(names),
+            "records": [records[name] for name in page],
+            "next_cursor": encode_cursor(page[-1]) if more and page else None,
+        }
+
+
+# -----------------------------------------------------------------------------
+# HTTP server
+# -----------------------------------------------------------------------------
+
+
+class QueryServer(ThreadingHTTPServer):
+    """Serves a QueryService on host:port (GET only, JSON responses)"""
+
+    daemon_threads = True
+
+    def __init__(
+        self, service: QueryService, host: str = "127.0.0.1", port: int = DEFAULT_PORT
+    ):
+        super().__init__((host, port), _QueryHandler)
+        self.service = service
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start_in_thread(self) -> threading.Thread:
+        """Serve in the background (for scripts and benchmarks)"""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+
+class _QueryHandler(BaseHTTPRequestHandler):
+    server: QueryServer
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        status, body, etag = self.server.service.respond(
+            parsed.path, parse_qs(parsed.query), self.headers.get("If-None-Match")
+        )
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+            # Clients may reuse a response but must revalidate it first
+            self.send_header("Cache-Control", "no-cache")
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    """Run the query API"""
+    parser = argparse.ArgumentParser(description="Read-only JSON API over the DB")
+    parser.add_argument("--db", type=str, default=DEFAULT_DB_PATH, help="Database file")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        "--cache-entries", type=int, default=CACHE_ENTRIES, help="Cached responses"
+    )
+    args = parser.parse_args()
+
+    service = QueryService(args.db, cache_entries=args.cache_entries)
+    server = QueryServer(service, args.host, args.port)
+    print(f"🌐 Query API on {server.base_url} (database: {args.db})")
+    print("   /records  /records/<name>  /stats  /search/name  /search/dates")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Adaptive Rate Control
+AIMD pacing for page fetches: speed up while the site is healthy, back off
+exponentially (with jitter) on empties, timeouts and 429/5xx responses
+"""
+
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+
+class AdaptiveRateController:
+    """
+    Tracks a request rate (pages/second) and turns it into sleeps. One
+    controller may be shared by several worker sessions: acquire() hands out
+    send slots one delay apart, so together they stay at the tracked rate.
+
+    - healthy fetch: rate += increase * starting rate (additive increase)
+    - slow fetch (latency well above its moving average): rate *= slow_factor
+    - failure: rate *= decrease and the next retry waits an exponential,
+      jittered backoff
+
+    With adaptive=False the delay stays fixed at initial_delay and backoff
+    is the old linear "delay + 3", so runs can be compared like for like.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 2.0,
+        min_delay: float = 0.5,
+        max_delay: float = 30.0,
+        increase: float = 0.25,
+        decrease: float = 0.5,
+        slow_factor: float = 0.8,
+        backoff_base: float = 1.0,
+        adaptive: bool = True,
+        seed: Optional[int] = None,
+    ):
+        self.adaptive = adaptive
+        self.initial_delay = initial_delay
+        self.min_delay = min(min_delay, initial_delay)
+        self.max_delay = max_delay
+        self.increase = increase / initial_delay if initial_delay > 0 else increase
+        self.decrease = decrease
+        self.slow_factor = slow_factor
+        self.backoff_base = backoff_base
+        self.rate = 1 / initial_delay if initial_delay > 0 else 1 / self.min_delay
+        self.latency_ewma = None
+        self.consecutive_failures = 0
+        self.stats = {"successes": 0, "failures": 0, "slow": 0, "backoff_s": 0.0}
+        self.failure_kinds = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._started = None
+        self._requests = 0
+        self._next_slot = 0.0
+
+    @property
+    def delay(self) -> float:
+        """Pacing sleep between page loads at the current rate"""
+        if not self.adaptive:
+            return self.initial_delay
+        return min(max(1 / self.rate, self.min_delay), self.max_delay)
+
+    def acquire(self) -> float:
+        """
+        Reserve the next send slot and return the seconds to wait for it.
+        Slots are handed out under the lock, one delay after the previous,
+        so concurrent callers queue up instead of each sleeping a full delay.
+        """
+        with self._lock:
+            now = time.perf_counter()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.delay
+            return slot - now
+
+    def on_request(self):
+        """Count one page request toward the effective rate"""
+        with self._lock:
+            if self._started is None:
+                self._started = time.perf_counter()
+            self._requests += 1
+
+    def on_success(self, latency_s: float):
+        """A page loaded with cards in latency_s seconds"""
+        with self._lock:
+            self.stats["successes"] += 1
+            self.consecutive_failures = 0
+            slow = (
+                self.latency_ewma is not None
+                and self.stats["successes"] > 3
+                and latency_s > 2 * self.latency_ewma
+            )
+            if self.latency_ewma is None:
+                self.latency_ewma = latency_s
+            else:
+                self.latency_ewma = 0.8 * self.latency_ewma + 0.2 * latency_s
+
+            if not self.adaptive:
+                return
+            if slow:
+                self.stats["slow"] += 1
+                self.rate *= self.slow_factor
+            else:
+                self.rate += self.increase
+            self._clamp()
+
+    def on_failure(self, kind: str = "empty") -> float:
+        """
+        Record a failed attempt (empty, timeout, http_429, http_5xx...) and
+        return how long to wait before retrying.
+        """
+        with self._lock:
+            self.stats["failures"] += 1
+            self.failure_kinds[kind] = self.failure_kinds.get(kind, 0) + 1
+            self.consecutive_failures += 1
+
+            if not self.adaptive:
+                wait = self.initial_delay + 3
+            else:
+                self.rate *= self.decrease
+                self._clamp()
+                # Exponential backoff with "equal jitter": half fixed, half random
+                ceiling = min(
+                    self.max_delay,
+                    self.backoff_base * 2 ** (self.consecutive_failures - 1)
+                    + self.delay,
+                )
+                wait = ceiling / 2 + self._rng.uniform(0, ceiling / 2)
+            self.stats["backoff_s"] += wait
+            return wait
+
+    def _clamp(self):
+        self.rate = min(max(self.rate, 1 / self.max_delay), 1 / self.min_delay)
+
+    def summary(self) -> Dict:
+        """Current pacing plus the effective request rate so far"""
+        with self._lock:
+            elapsed = time.perf_counter() - self._started if self._started else 0
+            return {
+                "adaptive": self.adaptive,
+                "current_delay_s": round(self.delay, 2),
+                "target_pages_per_minute": (
+                    round(60 / self.delay, 2) if self.delay else None
+                ),
+                "effective_pages_per_minute": (
+                    round(self._requests / elapsed * 60, 2) if elapsed else 0
+                ),
+                "requests": self._requests,
+                "successes": self.stats["successes"],
+                "failures": self.stats["failures"],
+                "slow_responses": self.stats["slow"],
+                "backoff_s": round(self.stats["backoff_s"], 1),
+                "failure_kinds": dict(self.failure_kinds),
+                "latency_ewma_s": (
+                    round(self.latency_ewma, 2) if self.latency_ewma else None
+                ),
+            }
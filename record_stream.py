@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Streaming Database Reader
+Read-only access to historical_arrests .json/.ndjson one record at a time,
+so statistics, searches and exports run in constant memory
+
+The command-line front end is dhs_tracker.py's query subcommands
+(stats, search-name, search-dates, export, verify).
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from ndjson_store import is_ndjson, iter_ndjson, read_header
+
+DEFAULT_DB_PATH = "data/historical_arrests.json"
+CHUNK_SIZE = 1 << 16
+
+REQUIRED_FIELDS = ("name", "status", "first_seen_date", "last_seen_date")
+ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+
+
+class _JSONScanner:
+    """
+    Incremental reader over a JSON text: the structure is walked by hand
+    and each value is decoded with json's raw_decode once it is fully
+    buffered, so memory follows the largest single value, not the file.
+    """
+
+    def __init__(self, f, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        # Read at least as much as is buffered, so a value that spans many
+        # chunks is re-tried O(log n) times rather than once per chunk
+        data = self.f.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not data:
+            self.eof = True
+        self.buf = self.buf[self.pos :] + data
+        self.pos = 0
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of input)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or self.eof:
+                return self.buf[self.pos : self.pos + 1]
+            self._fill()
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in JSON, found {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+                # A number cut at the buffer edge decodes as a shorter one,
+                # so only trust a value once the character after it is seen
+                if self.eof or (end < len(self.buf) and self.buf[end] in _DELIMITERS):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def keys(self) -> Iterator[str]:
+        """
+        Keys of the object whose '{' was just consumed. The caller must
+        read (or descend into) each key's value before asking for the next.
+        """
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' in JSON, found {separator!r}")
+
+
+def _scan_json(path) -> Iterator[Tuple[str, Optional[str], object]]:
+    with open(path, "r", encoding="utf-8") as f:
+        scanner = _JSONScanner(f)
+        scanner.expect("{")
+        for section in scanner.keys():
+            if scanner.peek() == "{":
+                scanner.expect("{")
+                for key in scanner.keys():
+                    yield section, key, scanner.value()
+            else:
+                yield section, None, scanner.value()
+
+
+def _scan_ndjson(path) -> Iterator[Tuple[str, Optional[str], object]]:
+    for section, value in read_header(path).items():
+        if isinstance(value, dict):
+            for key, item in value.items():
+                yield section, key, item
+        else:
+            yield section, None, value
+    for key, record, history in iter_ndjson(path):
+        if record is not None:
+            yield "records", key, record
+        if history:
+            yield "history", key, history
+
+
+def scan_database(path) -> Iterator[Tuple[str, Optional[str], object]]:
+    """
+    Stream a database file as (section, key, value) items: one per record,
+    history entry and metadata field, in file order. Top-level values that
+    aren't objects come back with key None.
+    """
+    if is_ndjson(path):
+        return _scan_ndjson(path)
+    return _scan_json(path)
+
+
+def compute_statistics(records: Iterable[Dict], metadata: Dict) -> Dict:
+    """
+    get_statistics() in one pass over records. metadata is only read after
+    records is exhausted, so a streaming caller may fill it during the pass.
+    """
+    total = active = 0
+    country_counts = {}
+    state_counts = {}
+    for r in records:
+        total += 1
+        if r["status"] != "active":
+            continue
+        active += 1
+        country = r.get("country", "Unknown")
+        country_counts[country] = country_counts.get(country, 0) + 1
+        location = r.get("arrested_location", "")
+        # Extract state from "City, State" format
+        if "," in location:
+            state = location.split(",")[-1].strip()
+            state_counts[state] = state_counts.get(state, 0) + 1
+
+    return {
+        "total_records": total,
+        "active_records": active,
+        "removed_records": total - active,
+        "top_countries": sorted(
+            country_counts.items(), key=lambda x: x[1], reverse=True
+        )[:10],
+        "top_states": sorted(state_counts.items(), key=lambda x: x[1], reverse=True)[
+            :10
+        ],
+        "last_updated": metadata.get("last_updated"),
+        "total_scrapes": metadata.get("total_scrapes", 0),
+    }
+
+
+def check_record(key: str, record: Dict) -> List[str]:
+    """Consistency problems in one record (empty if it looks right)"""
+    missing = [field for field in REQUIRED_FIELDS if not record.get(field)]
+    if missing:
+        return [f"{key}: missing {', '.join(missing)}"]
+
+    problems = []
+    if key != record["name"]:
+        problems.append(f"{key}: stored under a different name ({record['name']})")
+    status = record["status"]
+    if status not in ("active", "removed"):
+        problems.append(f"{key}: unknown status {status!r}")
+    dates = [record["first_seen_date"], record["last_seen_date"]]
+    if record.get("removed_date"):
+        dates.append(record["removed_date"])
+    if not all(ISO_DATE.match(str(d)) for d in dates):
+        problems.append(f"{key}: date not in YYYY-MM-DD form")
+    elif record["first_seen_date"] > record["last_seen_date"]:
+        problems.append(f"{key}: first_seen_date after last_seen_date")
+    if (status == "removed") != bool(record.get("removed_date")):
+        problems.append(f"{key}: removed_date does not match status {status}")
+    count = record.get("scrape_count")
+    if not isinstance(count, int) or count < 1:
+        problems.append(f"{key}: scrape_count {count!r} is not a positive integer")
+
+    # Periods are [start, end] in order; only the last may be open (end
+    # None), and only while the record is active
+    periods = record.get("active_periods")
+    if periods is not None:
+        previous_end = ""
+        for i, period in enumerate(periods):
+            if not (isinstance(period, list) and len(period) == 2 and period[0]):
+                problems.append(f"{key}: malformed active period {period!r}")
+                break
+            start, end = period
+            last = i == len(periods) - 1
+            if (
+                start < previous_end
+                or (end is None and not last)
+                or (end is not None and end < start)
+            ):
+                problems.append(f"{key}: active_periods out of order or overlapping")
+                break
+            previous_end = end or start
+        else:
+            if periods and (periods[-1][1] is None) != (status == "active"):
+                problems.append(f"{key}: last active period does not match status")
+    return problems
+
+
+class DatabaseReader:
+    """
+    Read-only, streaming counterpart of DHSDatabase.
+
+    Nothing is kept between calls: each method makes one pass over the file,
+    holding a single record at a time, so it works on databases larger than
+    memory. Searches yield records instead of building lists; exports feed
+    iter_records() to export_engine.
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = Path(db_path)
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"No database at {self.db_path}")
+
+    def iter_records(self, metadata: Optional[Dict] = None) -> Iterator[Dict]:
+        """Every record; metadata fields seen on the way are stored in metadata"""
+        for section, key, value in scan_database(self.db_path):
+            if section == "records":
+                yield value
+            elif section == "metadata" and metadata is not None:
+                metadata[key] = value
+
+    def get_metadata(self) -> Dict:
+        """The metadata block (a full pass for .json, where it comes last)"""
+        if is_ndjson(self.db_path):
+            return read_header(self.db_path).get("metadata") or {}
+        metadata = {}
+        for _ in self.iter_records(metadata):
+            pass
+        return metadata
+
+    def search_by_date_range(self, start_date: str, end_date: str) -> Iterator[Dict]:
+        """Records that first appeared between two dates"""
+        for record in self.iter_records():
+            if start_date <= record["first_seen_date"] <= end_date:
+                yield record
+
+    def search_by_name(self, query: str) -> Iterator[Dict]:
+        """Fuzzy search by name"""
+        query = query.lower()
+        for record in self.iter_records():
+            if query in record["name"].lower():
+                yield record
+
+    def get_statistics(self) -> Dict:
+        """Same result as DHSDatabase.get_statistics, in one streaming pass"""
+        metadata = {}
+        return compute_statistics(self.iter_records(metadata), metadata)
+
+    def verify(self) -> Dict:
+        """
+        Check every record, the history entries and the metadata counters.
+        Returns {"records", "active", "problems"}. Only record names are
+        held in memory (to match history to records).
+        """
+        names, problems = set(), []
+        history_names, metadata = [], {}
+        total = active = 0
+        for section, key, value in scan_database(self.db_path):
+            if section == "records":
+                total += 1
+                active += value.get("status") == "active"
+                names.add(key)
+                problems.extend(check_record(key, value))
+            elif section == "history":
+                history_names.append(key)
+                if not all(
+                    len(entry) == 2
+                    and ISO_DATE.match(str(entry[0]))
+                    and isinstance(entry[1], dict)
+                    for entry in value
+                ):
+                    problems.append(f"{key}: malformed history entry")
+            elif section == "metadata":
+                metadata[key] = value
+
+        orphans = [name for name in history_names if name not in names]
+        if orphans:
+            problems.append(
+                f"history for {len(orphans)} unknown record(s), e.g. {orphans[0]}"
+            )
+        for field, actual in (("total_records", total), ("active_records", active)):
+            if field in metadata and metadata[field] != actual:
+                problems.append(
+                    f"metadata {field} is {metadata[field]}, records give {actual}"
+                )
+        return {"records": total, "active": active, "problems": problems}
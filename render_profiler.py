@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Dashboard Render Profiler
+Opt-in per-stage timings for each dashboard rerun
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class RenderProfiler:
+    """
+    Times named stages of one dashboard rerun.
+    When disabled every call is a no-op, so it can stay wired in permanently.
+    """
+
+    def __init__(self, enabled: bool = False, log_path: Optional[str] = None):
+        self.enabled = enabled
+        self.log_path = Path(log_path or "logs/dashboard_timings.jsonl")
+        self.stages = []  # (name, wall_ms, cpu_ms)
+        self._start_wall = time.perf_counter()
+        self._start_cpu = time.process_time()
+
+    @classmethod
+    def from_request(cls, query_params) -> "RenderProfiler":
+        """Enable via DHS_PROFILE=1 or the ?profile=1 query parameter"""
+        enabled = os.environ.get("DHS_PROFILE") == "1" or (
+            query_params.get("profile") == "1"
+        )
+        return cls(enabled=enabled, log_path=os.environ.get("DHS_PROFILE_LOG"))
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one named stage"""
+        if not self.enabled:
+            yield
+            return
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            self.stages.append(
+                (
+                    name,
+                    (time.perf_counter() - wall) * 1000,
+                    (time.process_time() - cpu) * 1000,
+                )
+            )
+
+    def summary(self) -> Dict:
+        """Stage timings plus whole-rerun totals, in milliseconds"""
+        return {
+            "ts": datetime.now().isoformat(timespec="seconds"),
+            "total_ms": round((time.perf_counter() - self._start_wall) * 1000, 2),
+            "cpu_ms": round((time.process_time() - self._start_cpu) * 1000, 2),
+            "stages": {
+                name: {"ms": round(wall, 2), "cpu_ms": round(cpu, 2)}
+                for name, wall, cpu in self.stages
+            },
+        }
+
+    def write_log(self, summary: Dict, **context):
+        """Append one JSON line per rerun for later analysis"""
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({**summary, **context}, ensure_ascii=False) + "\n")
+
+    def finish(self, st, **context):
+        """Show the collapsible timing table and log the rerun"""
+        if not self.enabled:
+            return
+        summary = self.summary()
+        try:
+            self.write_log(summary, **context)
+        except OSError as e:
+            st.warning(f"Could not write timing log: {e}")
+
+        with st.expander(
+            f"⏱️ Render timings: {summary['total_ms']:.0f} ms "
+            f"({summary['cpu_ms']:.0f} ms CPU)"
+        ):
+            rows = [
+                {"Stage": name, "Wall (ms)": t["ms"], "CPU (ms)": t["cpu_ms"]}
+                for name, t in summary["stages"].items()
+            ]
+            st.table(rows)
+            st.caption(f"Appended to {self.log_path}")
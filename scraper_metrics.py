@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Scraper Run Telemetry
+Structured per-page and per-run metrics for dhs_tracker.py
+"""
+
+import json
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+# Counters kept per page and summed over the run
+PAGE_COUNTERS = (
+    "attempts",
+    "fetch_ms",
+    "wait_ms",
+    "extract_ms",
+    "cards",
+    "parse_failures",
+    "transfer_bytes",
+    "resource_requests",
+    "blocked_requests",
+)
+
+
+def _percentile(values, pct: float) -> Optional[float]:
+    """Nearest-rank percentile, None for an empty list"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return round(ordered[rank], 1)
+
+
+class ScrapeMetrics:
+    """
+    Collects fetch latency, sleep time, cards found, retries, driver
+    restarts and parse failures. Pages are written as JSON lines as they
+    finish; finish() writes the run summary (and optionally Prometheus text).
+    Pass out_dir=None to keep everything in memory.
+    """
+
+    def __init__(
+        self, out_dir: Optional[str] = "logs", prometheus_path: Optional[str] = None
+    ):
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.started = datetime.now()
+        self._start = time.perf_counter()
+        self.out_dir = Path(out_dir) if out_dir else None
+        self.prometheus_path = Path(prometheus_path) if prometheus_path else None
+        self.totals = Counter()
+        self.page_latencies = []
+        self.pages = []  # finished page dicts, in order
+        self.page = None
+
+        if self.out_dir:
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            self.pages_path = self.out_dir / f"scrape_pages_{self.run_id}.jsonl"
+            self.summary_path = self.out_dir / f"scrape_run_{self.run_id}.json"
+
+    def count(self, key: str, n: int = 1):
+        """Increment a counter on the current page (if any) and the run"""
+        self.totals[key] += n
+        if self.page is not None and key in self.page:
+            self.page[key] += n
+
+    @contextmanager
+    def timed(self, key: str):
+        """Add the enclosed block's duration (ms) to `key`"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.count(key, (time.perf_counter() - start) * 1000)
+
+    def wait(self, seconds: float):
+        """time.sleep that is accounted as wait time"""
+        with self.timed("wait_ms"):
+            time.sleep(seconds)
+
+    def begin_page(self, page_index: int):
+        """Start accumulating counters for one page"""
+        self.page = {"page": page_index, **{k: 0 for k in PAGE_COUNTERS}}
+        self._page_start = time.perf_counter()
+
+    def end_page(self):
+        """Close the current page and append it to the JSON lines log"""
+        page = self.page
+        self.page = None
+        if page is None:
+            return
+        page["total_ms"] = (time.perf_counter() - self._page_start) * 1000
+        page["retries"] = max(page["attempts"] - 1, 0)
+        page["empty"] = page["cards"] == 0
+        page["ts"] = datetime.now().isoformat(timespec="seconds")
+        for key in ("fetch_ms", "wait_ms", "extract_ms", "total_ms"):
+            page[key] = round(page[key], 1)
+
+        self.totals["pages"] += 1
+        self.totals["retries"] += page["retries"]
+        self.totals["empty_pages"] += page["empty"]
+        if page["attempts"]:
+            self.page_latencies.append(page["fetch_ms"] / page["attempts"])
+        self.pages.append(page)
+        self._write_page(page)
+
+    def _write_page(self, page: Dict):
+        if self.out_dir:
+            with open(self.pages_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(page) + "\n")
+
+    def merge(self, other: "ScrapeMetrics", count_pages: bool = True, **tags):
+        """
+        Fold a worker's metrics into this run; its pages are logged with
+        `tags` added. count_pages=False (second-pass retries) leaves the page
+        and empty-page totals to the main pass.
+        """
+        for key, value in other.totals.items():
+            if count_pages or key not in ("pages", "empty_pages"):
+                self.totals[key] += value
+        self.page_latencies.extend(other.page_latencies)
+        for page in other.pages:
+            page = {**page, **tags}
+            self.pages.append(page)
+            self._write_page(page)
+
+    def summary(self, **extra) -> Dict:
+        """Run-level totals and rates"""
+        duration = time.perf_counter() - self._start
+        pages = self.totals["pages"]
+        return {
+            "run_id": self.run_id,
+            "started": self.started.isoformat(timespec="seconds"),
+            "duration_s": round(duration, 1),
+            "pages": pages,
+            "empty_pages": self.totals["empty_pages"],
+            "cards": self.totals["cards"],
+            "attempts": self.totals["attempts"],
+            "retries": self.totals["retries"],
+            "driver_restarts": self.totals["driver_restarts"],
+            "throttled": self.totals["throttled"],
+            "parse_failures": self.totals["parse_failures"],
+            "fetch_s": round(self.totals["fetch_ms"] / 1000, 1),
+            "wait_s": round(self.totals["wait_ms"] / 1000, 1),
+            "extract_s": round(self.totals["extract_ms"] / 1000, 1),
+            "transfer_mb": round(self.totals["transfer_bytes"] / 1e6, 2),
+            "transfer_kb_per_page": (
+                round(self.totals["transfer_bytes"] / pages / 1000, 1) if pages else 0
+            ),
+            "resource_requests": self.totals["resource_requests"],
+            "blocked_requests": self.totals["blocked_requests"],
+            "pages_per_minute": round(pages / duration * 60, 2) if duration else 0,
+            "fetch_latency_ms_p50": _percentile(self.page_latencies, 50),
+            "fetch_latency_ms_p90": _percentile(self.page_latencies, 90),
+            "fetch_latency_ms_max": _percentile(self.page_latencies, 100),
+            **extra,
+        }
+
+    def prometheus_text(self, summary: Dict, prefix: str = "dhs_scrape") -> str:
+        """Summary in Prometheus text exposition format (nested dicts flattened)"""
+        lines = []
+        for key, value in summary.items():
+            name = f"{prefix}_{key}"
+            if isinstance(value, dict):
+                lines.append(self.prometheus_text(value, prefix=name).rstrip("\n"))
+                continue
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                continue
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {value}")
+        return "\n".join(line for line in lines if line) + "\n"
+
+    def finish(self, **extra) -> Dict:
+        """Write the run summary file (and Prometheus dump) and return it"""
+        if self.page is not None:
+            self.end_page()
+        summary = self.summary(**extra)
+        if self.out_dir:
+            with open(self.summary_path, "w", encoding="utf-8") as f:
+                json.dump(summary, f, indent=2)
+        if self.prometheus_path:
+            self.prometheus_path.parent.mkdir(parents=True, exist_ok=True)
+            self.prometheus_path.write_text(self.prometheus_text(summary))
+        return summary
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Dashboard Launcher
+Warms the dashboard's caches (data, indexes, default-view aggregates and
+figures) in-process, then starts the Streamlit server, so the first visitor
+after a deploy gets a warm page
+
+Usage examples:
+  python serve_dashboard.py
+  python serve_dashboard.py --server.port=8502 --server.address=127.0.0.1
+"""
+
+import argparse
+import logging
+import runpy
+import sys
+import time
+from pathlib import Path
+
+DASHBOARD = str(Path(__file__).with_name("dashboard_v2.py"))
+
+
+def warm_caches(script: str = DASHBOARD):
+    """
+    Run the dashboard once with no browser attached ("bare mode").
+
+    Streamlit keys its caches by module, function name and source, so a run
+    under __main__ fills the same caches the server's script runs will use.
+    Widgets return their defaults, so this primes exactly the default view
+    and starts the background warmer that follows new data versions.
+    """
+    # Bare mode warns about the missing browser session on every element
+    logging.disable(logging.WARNING)
+    try:
+        runpy.run_path(script, run_name="__main__")
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def main():
+    """Warm up, then hand over to `streamlit run` with the remaining flags"""
+    parser = argparse.ArgumentParser(
+        description="Start the dashboard with warm caches",
+        epilog="Any other flags are passed to `streamlit run`.",
+    )
+    parser.add_argument(
+        "--no-warm", action="store_true", help="Skip the warm-up (plain start)"
+    )
+    args, streamlit_args = parser.parse_known_args()
+
+    if not args.no_warm:
+        print("🔥 Warming dashboard caches...")
+        start = time.perf_counter()
+        warm_caches()
+        print(f"✓ Caches warm in {time.perf_counter() - start:.1f}s")
+
+    from streamlit.web import cli as stcli
+
+    sys.argv = ["streamlit", "run", DASHBOARD, *streamlit_args]
+    sys.exit(stcli.main())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Shared Read-Only Dataset
+One immutable copy of historical_arrests.json plus its indexes, meant to be
+held once per process and handed to every dashboard session without copying
+"""
+
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict
+
+from dhs_common import extract_state_from_location
+from ndjson_store import load_any
+
+
+class SharedDataset:
+    """
+    Read-only view of the tracker database.
+
+    records and metadata are MappingProxyType wrappers, so a session that
+    tries to modify a record gets a TypeError instead of silently changing
+    it for every other viewer. The indexes are built once at load time.
+    """
+
+    __slots__ = (
+        "records",
+        "metadata",
+        "version",
+        "active",
+        "state_of",
+        "countries",
+        "states",
+    )
+
+    def __init__(self, data: Dict):
+        records = {
+            name: MappingProxyType(record)
+            for name, record in data.get("records", {}).items()
+        }
+        self.records = MappingProxyType(records)
+        self.metadata = MappingProxyType(dict(data.get("metadata") or {}))
+        # Cached views downstream are keyed by this instead of hashing records
+        self.version = self.metadata.get("last_updated") or ""
+
+        # Indexes
+        self.active = tuple(r for r in records.values() if r.get("status") == "active")
+        self.state_of = MappingProxyType(
+            {
+                r["name"]: extract_state_from_location(r.get("arrested_location"))
+                for r in self.active
+            }
+        )
+        self.countries = tuple(
+            sorted({r["country"] for r in self.active if r.get("country")})
+        )
+        self.states = tuple(sorted({s for s in self.state_of.values() if s}))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @classmethod
+    def from_file(cls, path: str) -> "SharedDataset":
+        """Load a historical_arrests .json/.ndjson file (empty dataset if missing)"""
+        if not Path(path).exists():
+            return cls({"records": {}, "metadata": {}})
+        return cls(load_any(path))
+
+    @staticmethod
+    def from_snapshot(path: str):
+        """
+        Attach to an Arrow snapshot published by dataset_snapshot.py. Returns
+        a SnapshotDataset: the same read-only interface, with record values
+        left in the memory-mapped file instead of copied into this process.
+        """
+        from dataset_snapshot import SnapshotDataset
+
+        return SnapshotDataset(path)
@@ -24,7 +24,6 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-
 BASE_URL = "https://www.dhs.gov/wow"
 
 
@@ -56,9 +55,9 @@ def setup_driver(headless: bool = True, delay: float = 2.0):
     return driver
 
 
-def load_page(driver, page_ui: int, delay: float):
+def load_page(driver, page_ui: int, delay: float, base_url: str = BASE_URL):
     page_param = max(page_ui - 1, 0)  # convert to 0-based
-    url = f"{BASE_URL}?page={page_param}" if page_param > 0 else BASE_URL
+    url = f"{base_url}?page={page_param}" if page_param > 0 else base_url
     print(f"\n=== Loading page {page_ui} (param={page_param}) -> {url}")
     driver.get(url)
     time.sleep(delay + 1)
@@ -88,12 +87,14 @@ def extract_cards(driver, timeout: float = 10.0) -> List:
         return []
 
 
-def test_pages(pages: List[int], headless: bool, delay: float):
+def test_pages(
+    pages: List[int], headless: bool, delay: float, base_url: str = BASE_URL
+):
     driver = None
     try:
         driver = setup_driver(headless=headless, delay=delay)
         for p in pages:
-            load_page(driver, p, delay)
+            load_page(driver, p, delay, base_url)
             cards = extract_cards(driver, timeout=12.0)
             if cards:
                 print(f"  ✓ Found {len(cards)} cards on page {p}")
@@ -131,6 +132,12 @@ def main():
         default=2.0,
         help="Base delay between steps (seconds).",
     )
+    parser.add_argument(
+        "--base-url",
+        type=str,
+        default=BASE_URL,
+        help="Listing URL, e.g. a local wow_fixtures.py replay server.",
+    )
     args = parser.parse_args()
 
     pages = parse_pages(args.pages)
@@ -140,7 +147,7 @@ def main():
         f"Testing pages: {pages} | headless={headless} | delay={args.delay:.1f}s\n"
         "UI pages are 1-based; query param is 0-based (?page=N)."
     )
-    test_pages(pages, headless=headless, delay=args.delay)
+    test_pages(pages, headless=headless, delay=args.delay, base_url=args.base_url)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+DHS Worst of the Worst - Recorded Fixtures & Replay Server
+Records /wow?page=N responses once, then serves them locally with injected
+latency, errors and empty pages so the scraper can be benchmarked offline.
+
+Usage examples:
+  python wow_fixtures.py record --pages 0-20
+  python wow_fixtures.py serve --latency-ms 300 --error-rate 0.05
+  python wow_fixtures.py serve --synthetic 5000
+  python dhs_tracker.py --base-url http://127.0.0.1:8765/wow
+"""
+
+import argparse
+import gzip
+import html
+import json
+import random
+import threading
+import time
+import urllib.request
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from image_cache import USER_AGENT
+
+DEFAULT_BASE_URL = "https://www.dhs.gov/wow"
+DEFAULT_FIXTURE_DIR = "fixtures/wow"
+CARDS_PER_PAGE = 9
+
+EMPTY_PAGE = """<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Worst of the Worst</title></head>
+<body><main id="main-content"><ul class="usa-card-group"></ul></main></body></html>
+"""
+
+ERROR_PAGE = """<!DOCTYPE html>
+<html><head><title>{status} {reason}</title></head><body><h1>{reason}</h1></body></html>
+"""
+
+CARD_TEMPLATE = """<li class="usa-card tablet:grid-col-4">
+  <div class="usa-card__container">
+    <div class="usa-card__header"><p>{country}</p></div>
+    <div class="usa-card__media"><div class="usa-card__img"><img src="{image}" alt=""></div></div>
+    <div class="usa-card__body">
+      <p><strong>Convicted of:</strong></p><p>{crime}</p>
+      <p><strong>Arrested:</strong></p><p>{location}</p>
+      <p><strong>Name:</strong></p><p>{name}</p>
+    </div>
+    <div class="usa-card__footer"><a class="usa-card__more" href="{link}">&gt;&gt;</a></div>
+  </div>
+</li>"""
+
+
+# Placeholder assets served when asset_kb is set
+ASSET_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".css": "text/css",
+    ".woff2": "font/woff2",
+}
+
+
+def fixture_path(fixture_dir: Path, page_index: int) -> Path:
+    """Archive file for one ?page= index"""
+    return fixture_dir / f"page_{page_index:04d}.html.gz"
+
+
+def parse_page_spec(spec: str) -> List[int]:
+    """'0-3,7' -> [0, 1, 2, 3, 7] (0-based ?page= indexes)"""
+    pages = []
+    for part in spec.split(","):
+        part = part.strip()
+        if "-" in part:
+            first, last = part.split("-", 1)
+            pages.extend(range(int(first), int(last) + 1))
+        elif part:
+            pages.append(int(part))
+    return pages
+
+
+def page_url(base_url: str, page_index: int) -> str:
+    """URL of a 0-based page index, matching DHSWoWScraper.load_page_number"""
+    return base_url if page_index <= 0 else f"{base_url}?page={page_index}"
+
+
+# -----------------------------------------------------------------------------
+# Recording
+# -----------------------------------------------------------------------------
+
+
+def _fetch_http(url: str, timeout: float) -> Tuple[int, bytes]:
+    """Plain HTTP fetch; returns (status, body)"""
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.status, response.read()
+
+
+def record_fixtures(
+    pages: List[int],
+    fixture_dir: str = DEFAULT_FIXTURE_DIR,
+    base_url: str = DEFAULT_BASE_URL,
+    use_browser: bool = False,
+    delay: float = 2.0,
+    timeout: float = 30.0,
+) -> Dict:
+    """
+    Save the HTML of each page index into fixture_dir (gzip) and update
+    manifest.json. use_browser records the rendered DOM via Selenium instead
+    of the raw HTTP response.
+    """
+    out = Path(fixture_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    manifest_path = out / "manifest.json"
+    manifest = {"base_url": base_url, "pages": {}}
+    if manifest_path.exists():
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+
+    scraper = None
+    if use_browser:
+        from dhs_tracker import DHSWoWScraper
+
+        scraper = DHSWoWScraper(delay=delay, base_url=base_url)
+        if not scraper.setup_driver():
+            return manifest
+
+    try:
+        for page_index in pages:
+            url = page_url(base_url, page_index)
+            start = time.perf_counter()
+            try:
+                if scraper:
+                    scraper.load_page_number(page_index)
+                    status, body = 200, scraper.driver.page_source.encode("utf-8")
+                else:
+                    status, body = _fetch_http(url, timeout)
+            except Exception as e:
+                print(f"  ✗ Page {page_index}: {e}")
+                continue
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            with gzip.open(fixture_path(out, page_index), "wb") as f:
+                f.write(body)
+            cards = body.count(b"usa-card__container")
+            manifest["pages"][str(page_index)] = {
+                "url": url,
+                "status": status,
+                "bytes": len(body),
+                "cards": cards,
+                "elapsed_ms": round(elapsed_ms, 1),
+                "recorded": datetime.now().isoformat(timespec="seconds"),
+            }
+            print(f"  ✓ Page {page_index}: {cards} cards, {len(body):,} bytes")
+            if not scraper:
+                time.sleep(delay)
+    finally:
+        if scraper:
+            scraper.close()
+
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    print(f"💾 {len(manifest['pages'])} pages in {out}")
+    return manifest
+
+
+# -----------------------------------------------------------------------------
+# Synthetic pages (no recording needed)
+# -----------------------------------------------------------------------------
+
+
+def synthetic_pages(total_records: int, seed: int = 0) -> Dict[int, bytes]:
+    """Listing pages in the live markup, built from benchmark's generator"""
+    from benchmark import generate_dataset
+
+    records = [
+        r
+        for r in generate_dataset(total_records, seed=seed)["records"].values()
+        if r["status"] == "active"
+    ]
+    last_page = max((len(records) - 1) // CARDS_PER_PAGE, 0)
+    pages = {}
+    for page_index in range(last_page + 1):
+        chunk = records[page_index * CARDS_PER_PAGE : (page_index + 1) * CARDS_PER_PAGE]
+        cards = "\n".join(
+            CARD_TEMPLATE.format(
+                country=html.escape(r["country"]),
+                image=html.escape(r["image_url"].replace("https://www.dhs.gov", "")),
+                crime=html.escape(r["convicted_of"]),
+                location=html.escape(r["arrested_location"]),
+                name=html.escape(r["name"]),
+                link=html.escape(r["press_release_url"]),
+            )
+            for r in chunk
+        )
+        pager = (
+            '<nav class="usa-pagination"><ul class="usa-pagination__list">'
+            f'<li class="usa-pagination__item"><a href="?page={last_page}" '
+            f'class="usa-pagination__button" aria-label="Last page">{last_page + 1}'
+            "</a></li></ul></nav>"
+        )
+        body = EMPTY_PAGE.replace(
+            '<ul class="usa-card-group"></ul>',
+            f'<ul class="usa-card-group">\n{cards}\n</ul>\n{pager}',
+        )
+        pages[page_index] = body.encode("utf-8")
+    return pages
+
+
+def load_fixture_pages(fixture_dir: str) -> Dict[int, bytes]:
+    """Every recorded page in fixture_dir, keyed by page index"""
+    pages = {}
+    for path in sorted(Path(fixture_dir).glob("page_*.html.gz")):
+        page_index = int(path.name[len("page_") :].split(".")[0])
+        with gzip.open(path, "rb") as f:
+            pages[page_index] = f.read()
+    return pages
+
+
+# -----------------------------------------------------------------------------
+# Replay server
+# -----------------------------------------------------------------------------
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """
+    Serves /wow?page=N from memory. Every response can be delayed by
+    latency_ms ± jitter_ms; error_rate and empty_rate inject 503s and
+    card-less pages, and fail_pages always error. Pages past the archive
+    come back empty, like the live site past its last page. asset_kb > 0
+    answers image, font and stylesheet requests with that many bytes, so
+    full page loads cost roughly what they do live.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        pages: Dict[int, bytes],
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0.0,
+        empty_rate: float = 0.0,
+        error_status: int = 503,
+        fail_pages: Optional[List[int]] = None,
+        seed: Optional[int] = None,
+        asset_kb: float = 0,
+    ):
+        super().__init__((host, port), _ReplayHandler)
+        self.pages = pages
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.empty_rate = empty_rate
+        self.error_status = error_status
+        self.fail_pages = set(fail_pages or [])
+        self.asset_body = b"\0" * int(asset_kb * 1000)
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {
+            "requests": 0,
+            "served": 0,
+            "errors": 0,
+            "empty": 0,
+            "assets": 0,
+        }
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/wow"
+
+    def start_in_thread(self) -> threading.Thread:
+        """Serve in the background (for benchmarks driving a scraper)"""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def decide(self, page_index: int) -> Tuple[str, float]:
+        """Pick the outcome ('page', 'error', 'empty') and delay for one request"""
+        with self.lock:
+            self.stats["requests"] += 1
+            delay = max(
+                self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms), 0
+            )
+            if page_index in self.fail_pages or self.rng.random() < self.error_rate:
+                outcome = "error"
+            elif page_index not in self.pages or self.rng.random() < self.empty_rate:
+                outcome = "empty"
+            else:
+                outcome = "page"
+            self.stats[
+                {"page": "served", "error": "errors", "empty": "empty"}[outcome]
+            ] += 1
+        return outcome, delay / 1000
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    server: ReplayServer
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        if parsed.path.rstrip("/") != "/wow":
+            content_type = ASSET_TYPES.get(Path(parsed.path).suffix.lower())
+            if content_type and self.server.asset_body:
+                with self.server.lock:
+                    self.server.stats["assets"] += 1
+                self._send(200, self.server.asset_body, content_type)
+            else:
+                self._send(404, b"Not found", "text/plain")
+            return
+        try:
+            page_index = int(parse_qs(parsed.query).get("page", ["0"])[0])
+        except ValueError:
+            page_index = 0
+
+        outcome, delay = self.server.decide(page_index)
+        if delay:
+            time.sleep(delay)
+        if outcome == "error":
+            status = self.server.error_status
+            body = ERROR_PAGE.format(
+                status=status, reason=self.responses.get(status, ("Error",))[0]
+            )
+            self._send(status, body.encode("utf-8"))
+        elif outcome == "empty":
+            self._send(200, EMPTY_PAGE.encode("utf-8"))
+        else:
+            self._send(200, self.server.pages[page_index])
+
+    def _send(self, status: int, body: bytes, content_type: str = "text/html"):
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def main():
+    """Record fixtures or run the replay server"""
+    parser = argparse.ArgumentParser(
+        description="Record DHS WoW pages and replay them from a local server"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rec = sub.add_parser("record", help="Save /wow?page=N responses")
+    rec.add_argument(
+        "--pages", type=str, default="0-4", help="0-based page indexes, e.g. 0-20,208"
+    )
+    rec.add_argument("--out", type=str, default=DEFAULT_FIXTURE_DIR, help="Archive")
+    rec.add_argument("--base-url", type=str, default=DEFAULT_BASE_URL)
+    rec.add_argument("--delay", type=float, default=2.0, help="Delay between pages")
+    rec.add_argument(
+        "--browser",
+        action="store_true",
+        help="Record the Selenium-rendered DOM instead of the raw response",
+    )
+
+    srv = sub.add_parser("serve", help="Replay recorded (or synthetic) pages")
+    srv.add_argument("--fixtures", type=str, default=DEFAULT_FIXTURE_DIR)
+    srv.add_argument(
+        "--synthetic",
+        type=int,
+        default=0,
+        help="Serve N generated records instead of the recorded archive",
+    )
+    srv.add_argument("--host", type=str, default="127.0.0.1")
+    srv.add_argument("--port", type=int, default=8765)
+    srv.add_argument("--latency-ms", type=float, default=0, help="Added latency")
+    srv.add_argument("--jitter-ms", type=float, default=0, help="± latency jitter")
+    srv.add_argument("--error-rate", type=float, default=0.0, help="Share of 5xx")
+    srv.add_argument("--error-status", type=int, default=503)
+    srv.add_argument(
+        "--empty-rate", type=float, default=0.0, help="Share of card-less pages"
+    )
+    srv.add_argument(
+        "--fail-pages", type=str, default="", help="Page indexes that always error"
+    )
+    srv.add_argument("--seed", type=int, default=None, help="Seed for injection")
+    srv.add_argument(
+        "--asset-kb",
+        type=float,
+        default=0,
+        help="Answer image/CSS/font requests with this many KB (0 = 404)",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        record_fixtures(
+            parse_page_spec(args.pages),
+            fixture_dir=args.out,
+            base_url=args.base_url,
+            use_browser=args.browser,
+            delay=args.delay,
+        )
+        return
+
+    if args.synthetic:
+        pages = synthetic_pages(args.synthetic)
+    else:
+        pages = load_fixture_pages(args.fixtures)
+    if not pages:
+        print(f"✗ No fixtures in {args.fixtures} (record some or use --synthetic)")
+        return
+
+    server = ReplayServer(
+        pages,
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        empty_rate=args.empty_rate,
+        error_status=args.error_status,
+        fail_pages=parse_page_spec(args.fail_pages),
+        seed=args.seed,
+        asset_kb=args.asset_kb,
+    )
+    print(f"🎞️  Replaying {len(pages)} pages at {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        stats = server.stats
+        print(
+            f"\n📊 {stats['requests']} requests: {stats['served']} served, "
+            f"{stats['errors']} errors, {stats['empty']} empty, "
+            f"{stats['assets']} assets"
+        )
+
+
+if __name__ == "__main__":
+    main()